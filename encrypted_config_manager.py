@@ -3,17 +3,27 @@ Encrypted Configuration Manager for pySnap
 
 Provides secure SQLite-based configuration storage with Fernet encryption.
 Automatically migrates from legacy JSON configuration files.
+
+The database is accessed through one long-lived connection in WAL mode that
+is shared by the UI and worker threads and serialized by a lock. Fernet
+ciphertexts are randomized, so encrypted hostnames and usernames cannot
+be searched. Each server row also stores a blind index: a keyed HMAC of the
+hostname and of the username. Lookups compare those in an indexed SQL query.
 """
 
 import os
 import sys
+import hmac
+import hashlib
 import sqlite3
 import json
 import logging
+import threading
 import keyring
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional, Any
-from cryptography.fernet import Fernet
+from cryptography.fernet import Fernet, InvalidToken
 from secure_password import SecurePassword
 
 
@@ -45,6 +55,19 @@ class EncryptedConfigManager:
         # Set up logging
         self.logger = logging.getLogger(__name__)
         
+        # Encryption key and cipher, resolved from the keyring once per process
+        self._key = None  # bytearray so it can be zeroed
+        self._index_key = None  # HMAC key for blind indexes, derived from _key
+        self._fernet = None
+        self._key_lock = threading.Lock()
+        
+        # Shared database connection, opened by _init_database
+        self._conn = None
+        self._db_lock = threading.RLock()
+        
+        # Callables told about hostnames that are no longer saved
+        self._server_removed_listeners = []
+        
         # Ensure migration runs first
         self._ensure_migration()
         
@@ -94,17 +117,84 @@ class EncryptedConfigManager:
             self.logger.error(f"Failed to access keyring for encryption key: {e}")
             raise ConfigurationError(f"Cannot access encryption key: {e}")
     
+    def _load_key_material(self):
+        """Read the key from the keyring on first use and derive the cipher and index key (caller holds _key_lock)"""
+        if self._fernet is None:
+            self._key = bytearray(self._get_or_create_key())
+            self._index_key = bytearray(
+                hmac.new(self._key, b"pysnap blind index v1", hashlib.sha256).digest()
+            )
+            self._fernet = Fernet(bytes(self._key))
+    
+    def _get_cipher(self) -> Fernet:
+        """Return the cached Fernet cipher, reading the key from the keyring on first use"""
+        with self._key_lock:
+            self._load_key_material()
+            return self._fernet
+    
+    def _blind_index(self, value: str) -> str:
+        """Return the deterministic keyed HMAC used to look up an encrypted value"""
+        with self._key_lock:
+            self._load_key_material()
+            return hmac.new(self._index_key, value.encode('utf-8'), hashlib.sha256).hexdigest()
+    
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Encrypt binary data with the database key, for other local stores"""
+        return self._get_cipher().encrypt(data)
+    
+    def decrypt_bytes(self, token: bytes) -> bytes:
+        """Decrypt binary data written by encrypt_bytes"""
+        return self._get_cipher().decrypt(token)
+    
+    def lookup_key(self, value: str) -> str:
+        """Return the blind index of a value, for keying other encrypted stores"""
+        return self._blind_index(value)
+    
+    def add_server_removed_listener(self, listener):
+        """
+        Register a callable to run after saved servers are removed.
+        
+        The listener receives a list with the lookup key (see lookup_key) of
+        every hostname that no longer has a saved server, so stores keyed by
+        hostname can drop their entries.
+        """
+        self._server_removed_listeners.append(listener)
+    
+    def _notify_servers_removed(self, hostname_indexes):
+        """Tell the listeners which hostnames were removed, logging their failures"""
+        for listener in list(self._server_removed_listeners):
+            try:
+                listener(list(hostname_indexes))
+            except Exception as e:
+                self.logger.warning(f"Server removal listener failed: {e}")
+    
+    def invalidate_key_cache(self):
+        """Zero and drop the cached key so the next operation reads it from the keyring again"""
+        with self._key_lock:
+            for secret in (self._key, self._index_key):
+                if secret is not None:
+                    for i in range(len(secret)):
+                        secret[i] = 0
+            self._key = None
+            self._index_key = None
+            self._fernet = None
+    
+    def clear_sensitive_data(self):
+        """Clear the cached encryption key from memory"""
+        self.invalidate_key_cache()
+    
     def _encrypt_data(self, data: str) -> bytes:
         """Encrypt data using Fernet"""
-        key = self._get_or_create_key()
-        fernet = Fernet(key)
-        return fernet.encrypt(data.encode('utf-8'))
+        return self._get_cipher().encrypt(data.encode('utf-8'))
     
     def _decrypt_data(self, data: bytes) -> str:
         """Decrypt data using Fernet"""
-        key = self._get_or_create_key()
-        fernet = Fernet(key)
-        return fernet.decrypt(data).decode('utf-8')
+        try:
+            return self._get_cipher().decrypt(data).decode('utf-8')
+        except InvalidToken:
+            # The keyring entry may have been replaced since the key was cached
+            self.invalidate_key_cache()
+            return self._get_cipher().decrypt(data).decode('utf-8')
     
     def _ensure_migration(self):
         """Check marker and run cleanup if needed"""
@@ -171,28 +261,26 @@ class EncryptedConfigManager:
             raise MigrationError(f"Could not complete migration: {e}")
     
     def _init_database(self):
-        """Initialize encrypted database with schema"""
+        """Open the shared connection and initialize the schema"""
         try:
             # Create app directory
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
-            # Initialize database
-            conn = sqlite3.connect(self.db_path)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
-            
-            # Create tables
-            self._create_schema(conn)
-            
-            # Apply any needed schema migrations
-            self._apply_schema_migrations(conn)
-            
-            # Set initial config
-            self._save_config_internal(conn, 'schema_version', '3')  # Updated schema version
-            self._save_config_internal(conn, 'app_version', '1.3.0')
-            self._save_config_internal(conn, 'created_at', datetime.now().isoformat())
-            
-            conn.commit()
-            conn.close()
+            with self._db_lock:
+                self._conn = self._open_connection()
+                
+                # Create tables
+                self._create_schema(self._conn)
+                
+                with self._transaction() as conn:
+                    # Apply any needed schema migrations
+                    self._apply_schema_migrations(conn)
+                    
+                    # Set initial config, writing only values that changed
+                    self._save_config_if_changed(conn, 'schema_version', '4')  # Updated schema version
+                    self._save_config_if_changed(conn, 'app_version', '1.3.0')
+                    if self._get_config_internal(conn, 'created_at') is None:
+                        self._save_config_internal(conn, 'created_at', datetime.now().isoformat())
             
             self.logger.info(f"Initialized encrypted database at {self.db_path}")
             
@@ -200,6 +288,22 @@ class EncryptedConfigManager:
             self.logger.error(f"Failed to initialize database: {e}")
             raise DatabaseError(f"Database initialization failed: {e}")
     
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open the connection shared by all threads"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row  # Enable dict-like access
+        # WAL lets readers proceed during writes; NORMAL skips the fsync on every commit
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def close(self):
+        """Close the shared database connection"""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _apply_schema_migrations(self, conn: sqlite3.Connection):
         """Apply schema migrations for existing databases"""
         try:
@@ -211,11 +315,39 @@ class EncryptedConfigManager:
                 self.logger.info("Migrating database schema: adding password column to servers table")
                 conn.execute("ALTER TABLE servers ADD COLUMN password TEXT")
                 self.logger.info("Schema migration completed successfully")
+            
+            for column in ('hostname_index', 'username_index'):
+                if column not in columns:
+                    self.logger.info(f"Migrating database schema: adding {column} column to servers table")
+                    conn.execute(f"ALTER TABLE servers ADD COLUMN {column} TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_servers_lookup ON servers (hostname_index, username_index)"
+            )
+            self._backfill_blind_indexes(conn)
                 
         except Exception as e:
             self.logger.error(f"Schema migration failed: {e}")
             # Don't raise exception - let the app continue
     
+    def _backfill_blind_indexes(self, conn: sqlite3.Connection):
+        """Compute blind indexes for server rows written before they existed"""
+        rows = conn.execute(
+            "SELECT id, hostname, username FROM servers WHERE hostname_index IS NULL OR username_index IS NULL"
+        ).fetchall()
+        for row in rows:
+            try:
+                hostname = self._decrypt_data(row['hostname'])
+                username = self._decrypt_data(row['username'])
+            except Exception as e:
+                self.logger.warning(f"Cannot index server row {row['id']}: {e}")
+                continue
+            conn.execute(
+                "UPDATE servers SET hostname_index = ?, username_index = ? WHERE id = ?",
+                (self._blind_index(hostname), self._blind_index(username), row['id'])
+            )
+        if rows:
+            self.logger.info(f"Added lookup indexes to {len(rows)} server rows")
+    
     def _create_schema(self, conn: sqlite3.Connection):
         """Create database schema"""
         schema_sql = """
@@ -232,6 +364,8 @@ class EncryptedConfigManager:
             hostname TEXT NOT NULL UNIQUE,
             username TEXT NOT NULL,
             password TEXT,
+            hostname_index TEXT,
+            username_index TEXT,
             verify_ssl BOOLEAN DEFAULT 0,
             display_order INTEGER DEFAULT 0,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -250,13 +384,40 @@ class EncryptedConfigManager:
         conn.executescript(schema_sql)
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        if not os.path.exists(self.db_path):
+        """Get the shared database connection (use it while holding _db_lock)"""
+        if self._conn is None:
             self._init_database()
+        return self._conn
+    
+    @contextmanager
+    def _transaction(self):
+        """
+        Run a block of statements as one transaction on the shared connection.
         
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        Commits when the block completes and rolls back if it raises. Nested
+        blocks join the outer transaction.
+        """
+        with self._db_lock:
+            conn = self._get_connection()
+            if conn.in_transaction:
+                yield conn
+                return
+            try:
+                yield conn
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+    
+    def _get_config_internal(self, conn: sqlite3.Connection, key: str) -> Optional[str]:
+        """Read a config value using existing connection (None if missing or unreadable)"""
+        row = conn.execute("SELECT value FROM config WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            return self._decrypt_data(row['value'])
+        except Exception:
+            return None
     
     def _save_config_internal(self, conn: sqlite3.Connection, key: str, value: str):
         """Save config value using existing connection"""
@@ -266,46 +427,91 @@ class EncryptedConfigManager:
             (key, encrypted_value, datetime.now().isoformat())
         )
     
+    def _save_config_if_changed(self, conn: sqlite3.Connection, key: str, value: str):
+        """Save config value only if it differs from the stored one"""
+        if self._get_config_internal(conn, key) != value:
+            self._save_config_internal(conn, key, value)
+    
     # Server Management Methods
+    def _encrypt_password(self, password: Optional[SecurePassword]) -> Optional[bytes]:
+        """Encrypt a SecurePassword, clearing the temporary plaintext string"""
+        if not password or password.is_empty():
+            return None
+        password_str = password.get_password()
+        try:
+            return self._encrypt_data(password_str)
+        finally:
+            # Clear the temporary password string
+            password_str = '\0' * len(password_str)
+            del password_str
+    
+    def _decrypt_password(self, encrypted_password, hostname: str) -> Optional[SecurePassword]:
+        """Decrypt a stored password into a SecurePassword (None if absent or unreadable)"""
+        if not encrypted_password:
+            return None
+        try:
+            decrypted_password = self._decrypt_data(encrypted_password)
+            password = SecurePassword(decrypted_password)
+            # Clear the temporary decrypted string
+            decrypted_password = '\0' * len(decrypted_password)
+            del decrypted_password
+            return password
+        except Exception as e:
+            self.logger.warning(f"Failed to decrypt password for {hostname}: {e}")
+            return None
+    
+    def _row_to_server(self, row: sqlite3.Row) -> Dict[str, Any]:
+        """Decrypt a servers table row"""
+        hostname = self._decrypt_data(row['hostname'])
+        return {
+            'id': row['id'],
+            'hostname': hostname,
+            'username': self._decrypt_data(row['username']),
+            'password': self._decrypt_password(row['password'], hostname),
+            'verify_ssl': bool(row['verify_ssl']),
+            'display_order': row['display_order'],
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+    
+    def _find_server_id(self, conn: sqlite3.Connection, hostname: str, username: str) -> Optional[int]:
+        """Return the row ID of a server through its blind indexes"""
+        row = conn.execute(
+            "SELECT id FROM servers WHERE hostname_index = ? AND username_index = ? LIMIT 1",
+            (self._blind_index(hostname), self._blind_index(username))
+        ).fetchone()
+        return row['id'] if row else None
+    
+    def _insert_server(self, conn: sqlite3.Connection, hostname: str, username: str,
+                       encrypted_password: Optional[bytes], verify_ssl: bool, display_order: int):
+        """Insert a server row with its blind indexes"""
+        now = datetime.now().isoformat()
+        conn.execute("""
+            INSERT INTO servers 
+            (hostname, username, password, hostname_index, username_index, verify_ssl, display_order, created_at, updated_at) 
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, (self._encrypt_data(hostname), self._encrypt_data(username), encrypted_password,
+              self._blind_index(hostname), self._blind_index(username), verify_ssl, display_order, now, now))
+    
     def save_server(self, hostname: str, username: str, verify_ssl: bool = False, display_order: int = 0, password: SecurePassword = None):
         """Save server configuration"""
         try:
-            conn = self._get_connection()
-            
             # Encrypt sensitive data
-            encrypted_hostname = self._encrypt_data(hostname)
-            encrypted_username = self._encrypt_data(username)
-            encrypted_password = None
-            
-            if password and not password.is_empty():
-                password_str = password.get_password()
-                encrypted_password = self._encrypt_data(password_str)
-                # Clear the temporary password string
-                password_str = '\0' * len(password_str)
-                del password_str
-            
-            # Check if server already exists
-            cursor = conn.execute("SELECT id FROM servers WHERE hostname = ? AND username = ?", 
-                                (encrypted_hostname, encrypted_username))
-            existing = cursor.fetchone()
+            encrypted_password = self._encrypt_password(password)
             
-            if existing:
-                conn.execute("""
-                    UPDATE servers 
-                    SET password = ?, verify_ssl = ?, display_order = ?, updated_at = ?
-                    WHERE hostname = ? AND username = ?
-                """, (encrypted_password, verify_ssl, display_order, datetime.now().isoformat(), 
-                      encrypted_hostname, encrypted_username))
-            else:
-                conn.execute("""
-                    INSERT INTO servers 
-                    (hostname, username, password, verify_ssl, display_order, created_at, updated_at) 
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (encrypted_hostname, encrypted_username, encrypted_password, verify_ssl, display_order, 
-                      datetime.now().isoformat(), datetime.now().isoformat()))
+            with self._transaction() as conn:
+                # Check if server already exists
+                server_id = self._find_server_id(conn, hostname, username)
+                
+                if server_id:
+                    conn.execute("""
+                        UPDATE servers 
+                        SET password = ?, verify_ssl = ?, display_order = ?, updated_at = ?
+                        WHERE id = ?
+                    """, (encrypted_password, verify_ssl, display_order, datetime.now().isoformat(), server_id))
+                else:
+                    self._insert_server(conn, hostname, username, encrypted_password, verify_ssl, display_order)
             
-            conn.commit()
-            conn.close()
             self.logger.debug(f"Saved server configuration for {hostname}")
             
         except Exception as e:
@@ -315,43 +521,13 @@ class EncryptedConfigManager:
     def get_servers(self) -> List[Dict[str, Any]]:
         """Retrieve all server configurations"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("""
-                SELECT id, hostname, username, password, verify_ssl, display_order, created_at, updated_at 
-                FROM servers ORDER BY display_order, hostname
-            """)
-            
-            servers = []
-            for row in cursor:
-                # Decrypt sensitive data
-                hostname = self._decrypt_data(row['hostname'])
-                username = self._decrypt_data(row['username'])
-                
-                # Decrypt password if it exists
-                password = None
-                if row['password']:
-                    try:
-                        decrypted_password = self._decrypt_data(row['password'])
-                        password = SecurePassword(decrypted_password)
-                        # Clear the temporary decrypted string
-                        decrypted_password = '\0' * len(decrypted_password)
-                        del decrypted_password
-                    except Exception as e:
-                        self.logger.warning(f"Failed to decrypt password for {hostname}: {e}")
-                
-                servers.append({
-                    'id': row['id'],
-                    'hostname': hostname,
-                    'username': username,
-                    'password': password,
-                    'verify_ssl': bool(row['verify_ssl']),
-                    'display_order': row['display_order'],
-                    'created_at': row['created_at'],
-                    'updated_at': row['updated_at']
-                })
+            with self._transaction() as conn:
+                rows = conn.execute("""
+                    SELECT id, hostname, username, password, verify_ssl, display_order, created_at, updated_at 
+                    FROM servers ORDER BY display_order, hostname
+                """).fetchall()
             
-            conn.close()
-            return servers
+            return [self._row_to_server(row) for row in rows]
             
         except Exception as e:
             self.logger.error(f"Failed to retrieve servers: {e}")
@@ -359,56 +535,43 @@ class EncryptedConfigManager:
     
     def get_server(self, hostname: str) -> Optional[Dict[str, Any]]:
         """Retrieve specific server configuration"""
-        servers = self.get_servers()
-        for server in servers:
-            if server['hostname'] == hostname:
-                return server
-        return None
+        try:
+            with self._transaction() as conn:
+                row = conn.execute("""
+                    SELECT id, hostname, username, password, verify_ssl, display_order, created_at, updated_at 
+                    FROM servers WHERE hostname_index = ? ORDER BY display_order, id LIMIT 1
+                """, (self._blind_index(hostname),)).fetchone()
+            return self._row_to_server(row) if row else None
+            
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve server {hostname}: {e}")
+            return None
     
     def delete_server(self, hostname: str):
         """Remove server configuration"""
         try:
-            conn = self._get_connection()
-            
-            # Find server by decrypting hostnames
-            cursor = conn.execute("SELECT id, hostname FROM servers")
-            server_id = None
-            
-            for row in cursor:
-                try:
-                    decrypted_hostname = self._decrypt_data(row['hostname'])
-                    if decrypted_hostname == hostname:
-                        server_id = row['id']
-                        break
-                except:
-                    continue
-            
-            if server_id:
-                conn.execute("DELETE FROM servers WHERE id = ?", (server_id,))
-                conn.commit()
-                self.logger.debug(f"Deleted server configuration for {hostname}")
-            
-            conn.close()
+            with self._transaction() as conn:
+                cursor = conn.execute("DELETE FROM servers WHERE hostname_index = ?", (self._blind_index(hostname),))
             
         except Exception as e:
             self.logger.error(f"Failed to delete server {hostname}: {e}")
             raise DatabaseError(f"Could not delete server: {e}")
+        
+        if cursor.rowcount:
+            self.logger.debug(f"Deleted server configuration for {hostname}")
+            self._notify_servers_removed([self._blind_index(hostname)])
     
     # Settings Management Methods
     def save_setting(self, key: str, value: str, data_type: str = 'string'):
         """Save application setting"""
         try:
-            conn = self._get_connection()
-            
             encrypted_value = self._encrypt_data(value)
             
-            conn.execute("""
-                INSERT OR REPLACE INTO settings (key, value, data_type, updated_at) 
-                VALUES (?, ?, ?, ?)
-            """, (key, encrypted_value, data_type, datetime.now().isoformat()))
-            
-            conn.commit()
-            conn.close()
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO settings (key, value, data_type, updated_at) 
+                    VALUES (?, ?, ?, ?)
+                """, (key, encrypted_value, data_type, datetime.now().isoformat()))
             
         except Exception as e:
             self.logger.error(f"Failed to save setting {key}: {e}")
@@ -417,10 +580,8 @@ class EncryptedConfigManager:
     def get_setting(self, key: str, default: Any = None) -> Any:
         """Retrieve application setting"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("SELECT value, data_type FROM settings WHERE key = ?", (key,))
-            row = cursor.fetchone()
-            conn.close()
+            with self._transaction() as conn:
+                row = conn.execute("SELECT value, data_type FROM settings WHERE key = ?", (key,)).fetchone()
             
             if row:
                 decrypted_value = self._decrypt_data(row['value'])
@@ -443,11 +604,11 @@ class EncryptedConfigManager:
     def get_all_settings(self) -> Dict[str, Any]:
         """Retrieve all application settings"""
         try:
-            conn = self._get_connection()
-            cursor = conn.execute("SELECT key, value, data_type FROM settings")
+            with self._transaction() as conn:
+                rows = conn.execute("SELECT key, value, data_type FROM settings").fetchall()
             
             settings = {}
-            for row in cursor:
+            for row in rows:
                 try:
                     decrypted_value = self._decrypt_data(row['value'])
                     # Convert based on data type
@@ -462,7 +623,6 @@ class EncryptedConfigManager:
                 except:
                     continue
             
-            conn.close()
             return settings
             
         except Exception as e:
@@ -473,50 +633,27 @@ class EncryptedConfigManager:
     def save_password(self, hostname: str, username: str, secure_password: SecurePassword) -> bool:
         """Save SecurePassword to encrypted database"""
         try:
-            # Find the server by decrypting and comparing (like get_password does)
-            servers = self.get_servers()
-            server_id = None
-            
-            for server in servers:
-                if server['hostname'] == hostname and server['username'] == username:
-                    server_id = server['id']
-                    break
-            
             # Encrypt the password
-            encrypted_password = None
-            if secure_password and not secure_password.is_empty():
-                password_str = secure_password.get_password()
-                encrypted_password = self._encrypt_data(password_str)
-                # Clear the temporary password string
-                password_str = '\0' * len(password_str)
-                del password_str
+            encrypted_password = self._encrypt_password(secure_password)
             
-            conn = self._get_connection()
+            with self._transaction() as conn:
+                server_id = self._find_server_id(conn, hostname, username)
+                
+                if server_id:
+                    # Update existing server by ID
+                    conn.execute("""
+                        UPDATE servers 
+                        SET password = ?, updated_at = ?
+                        WHERE id = ?
+                    """, (encrypted_password, datetime.now().isoformat(), server_id))
+                else:
+                    # Server doesn't exist, create it with default settings
+                    self._insert_server(conn, hostname, username, encrypted_password, False, 0)
             
             if server_id:
-                # Update existing server by ID
-                conn.execute("""
-                    UPDATE servers 
-                    SET password = ?, updated_at = ?
-                    WHERE id = ?
-                """, (encrypted_password, datetime.now().isoformat(), server_id))
-                conn.commit()
-                conn.close()
                 self.logger.debug(f"Updated password for {hostname}:{username}")
                 return True
             else:
-                # Server doesn't exist, create it with default settings
-                encrypted_hostname = self._encrypt_data(hostname)
-                encrypted_username = self._encrypt_data(username)
-                
-                conn.execute("""
-                    INSERT INTO servers 
-                    (hostname, username, password, verify_ssl, display_order, created_at, updated_at) 
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (encrypted_hostname, encrypted_username, encrypted_password, False, 0, 
-                      datetime.now().isoformat(), datetime.now().isoformat()))
-                conn.commit()
-                conn.close()
                 self.logger.info(f"Created new server entry for {hostname}:{username} with password")
                 return True
                 
@@ -527,11 +664,12 @@ class EncryptedConfigManager:
     def get_password(self, hostname: str, username: str) -> Optional[SecurePassword]:
         """Get password from encrypted database and return as SecurePassword"""
         try:
-            servers = self.get_servers()
-            for server in servers:
-                if server['hostname'] == hostname and server['username'] == username:
-                    return server.get('password')
-            return None
+            with self._transaction() as conn:
+                row = conn.execute(
+                    "SELECT password FROM servers WHERE hostname_index = ? AND username_index = ? LIMIT 1",
+                    (self._blind_index(hostname), self._blind_index(username))
+                ).fetchone()
+            return self._decrypt_password(row['password'], hostname) if row else None
         except Exception as e:
             self.logger.error(f"Failed to get password for {hostname}:{username}: {e}")
             return None
@@ -539,20 +677,16 @@ class EncryptedConfigManager:
     def delete_password(self, hostname: str, username: str):
         """Delete password from encrypted database"""
         try:
-            # Find the server and update it without password
-            servers = self.get_servers()
-            for server in servers:
-                if server['hostname'] == hostname and server['username'] == username:
-                    self.save_server(
-                        hostname=hostname,
-                        username=username,
-                        verify_ssl=server['verify_ssl'],
-                        display_order=server['display_order'],
-                        password=None
-                    )
-                    self.logger.debug(f"Deleted password for {hostname}:{username}")
-                    return
-            self.logger.warning(f"Server {hostname}:{username} not found for password deletion")
+            with self._transaction() as conn:
+                cursor = conn.execute("""
+                    UPDATE servers 
+                    SET password = NULL, updated_at = ?
+                    WHERE hostname_index = ? AND username_index = ?
+                """, (datetime.now().isoformat(), self._blind_index(hostname), self._blind_index(username)))
+            if cursor.rowcount:
+                self.logger.debug(f"Deleted password for {hostname}:{username}")
+            else:
+                self.logger.warning(f"Server {hostname}:{username} not found for password deletion")
         except Exception as e:
             self.logger.error(f"Failed to delete password for {hostname}:{username}: {e}")
     
@@ -571,23 +705,16 @@ class EncryptedConfigManager:
         return legacy_format
     
     def save_servers(self, servers: Dict[str, Any]):
-        """Save servers in legacy format for compatibility"""
+        """
+        Save servers in legacy format for compatibility.
+        
+        The stored rows are compared with the given servers through their blind
+        indexes, without decrypting anything. Only the inserts, updates and
+        deletes needed are applied, in one transaction. Stored passwords are kept.
+        """
         try:
-            # Get existing servers with passwords to preserve them
-            existing_servers = self.get_servers()
-            existing_passwords = {}
-            for server in existing_servers:
-                key = f"{server['hostname']}:{server['username']}"
-                if server.get('password'):
-                    existing_passwords[key] = server['password']
-            
-            # Clear existing servers
-            conn = self._get_connection()
-            conn.execute("DELETE FROM servers")
-            conn.commit()
-            conn.close()
-            
-            # Save new servers, preserving passwords where they exist
+            # Resolve desired rows keyed by their blind indexes
+            desired = {}
             for hostname, server_data in servers.items():
                 if isinstance(server_data, str):
                     # Old format: just username
@@ -598,20 +725,51 @@ class EncryptedConfigManager:
                     username = server_data.get('username', '')
                     verify_ssl = server_data.get('verify_ssl', False)
                 
-                # Check if we have a saved password for this server
-                key = f"{hostname}:{username}"
-                saved_password = existing_passwords.get(key)
+                key = (self._blind_index(hostname), self._blind_index(username))
+                desired[key] = (hostname, username, bool(verify_ssl))
+            
+            inserted = updated = deleted = 0
+            deleted_hostnames = set()
+            with self._transaction() as conn:
+                rows = conn.execute("""
+                    SELECT id, hostname_index, username_index, verify_ssl, display_order 
+                    FROM servers ORDER BY id
+                """).fetchall()
                 
-                self.save_server(
-                    hostname=hostname,
-                    username=username,
-                    verify_ssl=verify_ssl,
-                    display_order=0,
-                    password=saved_password
-                )
+                kept = set()
+                now = datetime.now().isoformat()
+                for row in rows:
+                    key = (row['hostname_index'], row['username_index'])
+                    if key not in desired or key in kept:
+                        # Removed server, or a duplicate row for a kept server
+                        conn.execute("DELETE FROM servers WHERE id = ?", (row['id'],))
+                        deleted_hostnames.add(row['hostname_index'])
+                        deleted += 1
+                        continue
+                    
+                    kept.add(key)
+                    verify_ssl = desired[key][2]
+                    if bool(row['verify_ssl']) != verify_ssl or row['display_order'] != 0:
+                        conn.execute("""
+                            UPDATE servers 
+                            SET verify_ssl = ?, display_order = 0, updated_at = ?
+                            WHERE id = ?
+                        """, (verify_ssl, now, row['id']))
+                        updated += 1
                 
-            self.logger.debug(f"Saved {len(servers)} servers to encrypted database, preserving {len(existing_passwords)} passwords")
+                for key, (hostname, username, verify_ssl) in desired.items():
+                    if key not in kept:
+                        self._insert_server(conn, hostname, username, None, verify_ssl, 0)
+                        inserted += 1
+            
+            self.logger.debug(f"Saved {len(servers)} servers to encrypted database "
+                              f"({inserted} added, {updated} updated, {deleted} removed)")
             
         except Exception as e:
             self.logger.error(f"Failed to save servers: {e}")
-            raise DatabaseError(f"Could not save servers: {e}")
\ No newline at end of file
+            raise DatabaseError(f"Could not save servers: {e}")
+        
+        # A hostname saved again under another username is still saved
+        removed = deleted_hostnames - {hostname_index for hostname_index, username_index in desired}
+        if removed:
+            self._notify_servers_removed(sorted(removed))
\ No newline at end of file
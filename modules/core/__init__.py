@@ -4,10 +4,12 @@ Core module containing the main application window and essential components.
 
 from .utilities import format_vmware_time
 from .progress_tracker import ProgressTracker
+from .snapshot_record import SnapshotRecord
 from .snapshot_manager import SnapshotManagerWindow
 
 __all__ = [
     'format_vmware_time',
     'ProgressTracker',
+    'SnapshotRecord',
     'SnapshotManagerWindow'
 ]
\ No newline at end of file
@@ -0,0 +1,125 @@
+"""
+vCenter Connection Helpers
+
+This module contains helpers for logging in to vCenter servers. Timeouts are
+passed to each connection (httpConnectionTimeout) instead of changing the
+process-wide socket default, so logins can safely run in parallel.
+
+Sessions are identified by the vmware_soap_session cookie held by the
+SoapStubAdapter. A session that is still valid on the server can be
+re-attached through a fresh stub with that cookie, which costs one round
+trip instead of a full login.
+"""
+
+import ssl
+import urllib3
+from pyVim.connect import SmartConnect
+
+
+# Seconds to wait for a vCenter to accept a connection or answer a request
+DEFAULT_CONNECT_TIMEOUT = 10
+
+
+def build_ssl_context(verify_ssl):
+    """
+    Create the SSL context for a vCenter connection.
+
+    Args:
+        verify_ssl (bool): Verify the server certificate and hostname
+
+    Returns:
+        ssl.SSLContext: Context for SmartConnect
+    """
+    context = ssl.create_default_context()
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+        # Disable SSL verification warnings
+        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return context
+
+
+def connect_vcenter(hostname, username, secure_password, verify_ssl=False, timeout=DEFAULT_CONNECT_TIMEOUT):
+    """
+    Log in to a vCenter.
+
+    Args:
+        hostname (str): vCenter hostname
+        username (str): Login user
+        secure_password (SecurePassword): Password, read only for the duration of the login
+        verify_ssl (bool): Verify the server certificate and hostname
+        timeout (float): Connection timeout in seconds, scoped to this session
+
+    Returns:
+        vim.ServiceInstance: Logged-in service instance
+    """
+    # Get password string briefly for connection
+    password_str = secure_password.get_password()
+    try:
+        return SmartConnect(
+            host=hostname,
+            user=username,
+            pwd=password_str,
+            sslContext=build_ssl_context(verify_ssl),
+            disableSslCertValidation=not verify_ssl,
+            httpConnectionTimeout=timeout
+        )
+    finally:
+        # Clear the temporary password string
+        password_str = '\0' * len(password_str)
+        del password_str
+
+
+def session_is_active(si):
+    """
+    Check that a session is still logged in.
+
+    Reading currentSession is also a cheap keepalive: any authenticated call
+    resets the vCenter idle-session timer, unlike CurrentTime(), which works
+    without a session.
+
+    Args:
+        si: vim.ServiceInstance to check
+
+    Returns:
+        bool: True if the server still knows the session
+    """
+    return si.content.sessionManager.currentSession is not None
+
+
+def get_session_id(si):
+    """
+    Return the session cookie value of a service instance.
+
+    Args:
+        si: vim.ServiceInstance
+
+    Returns:
+        str: Session ID, or None if the stub has no session
+    """
+    stub = getattr(si, '_stub', None)
+    return stub.GetSessionId() if stub is not None else None
+
+
+def attach_session(hostname, session_id, verify_ssl=False, timeout=DEFAULT_CONNECT_TIMEOUT):
+    """
+    Re-attach to an existing vCenter session without logging in.
+
+    Args:
+        hostname (str): vCenter hostname
+        session_id (str): Session cookie value from get_session_id()
+        verify_ssl (bool): Verify the server certificate and hostname
+        timeout (float): Connection timeout in seconds, scoped to this session
+
+    Returns:
+        vim.ServiceInstance: Service instance on the session, or None if the
+            server no longer knows it
+    """
+    si = SmartConnect(
+        host=hostname,
+        sessionId=session_id,
+        sslContext=build_ssl_context(verify_ssl),
+        disableSslCertValidation=not verify_ssl,
+        httpConnectionTimeout=timeout
+    )
+    return si if session_is_active(si) else None
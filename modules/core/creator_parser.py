@@ -0,0 +1,121 @@
+"""
+Creator Parser
+
+This module contains the parser that attributes a snapshot to its creator.
+VMware snapshots have no createdBy property, so the creator is read from the
+description. The rules are combined into one precompiled pattern that finds
+the highest-priority match in a single scan, and results are memoized per
+description text since standardized descriptions repeat across thousands of
+snapshots.
+"""
+
+import re
+import threading
+from functools import lru_cache
+
+
+UNKNOWN_CREATOR = 'Unknown'
+
+# Rules in priority order; each pattern captures the creator in its first group
+DEFAULT_RULES = [
+    r'Created by:\s*(\w+)',
+    r'\(Created by:\s*(\w+)\)',
+    r'User:\s*(\w+)',
+    r'By:\s*(\w+)',
+]
+
+# Distinct descriptions remembered by each parser
+DEFAULT_CACHE_SIZE = 4096
+
+
+class CreatorParser:
+    """
+    Extracts the creator from snapshot descriptions using prioritized rules.
+
+    The first rule that matches anywhere in the description wins, at its
+    leftmost match, exactly as if the rules were searched one after another.
+
+    Usage:
+        parser = CreatorParser()
+        parser.add_rule(r'Owner=(\\w+)', priority=0)
+        creator = parser.parse(description)
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, flags=re.IGNORECASE, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            rules (list): Regular expressions in priority order, each with the
+                creator in its first capture group
+            flags (int): re flags applied to every rule
+            cache_size (int): Number of distinct descriptions to memoize
+        """
+        self.flags = flags
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._set_rules(list(rules))
+
+    @property
+    def rules(self):
+        """Rule patterns in priority order"""
+        return list(self._rules)
+
+    def add_rule(self, pattern, priority=None):
+        """
+        Add a rule and forget cached results.
+
+        Args:
+            pattern (str): Regular expression with the creator in its first capture group
+            priority (int): Position in the rule list (0 is tried first), or None to append
+        """
+        with self._lock:
+            rules = list(self._rules)
+            rules.insert(len(rules) if priority is None else priority, pattern)
+            self._set_rules(rules)
+
+    def _set_rules(self, rules):
+        """Compile the rules and start a new cache"""
+        compiled = [re.compile(pattern, self.flags) for pattern in rules]
+        for pattern in compiled:
+            if pattern.groups < 1:
+                raise ValueError(f"Creator rule has no capture group: {pattern.pattern}")
+
+        # A zero-width lookahead tries every rule at every position, so a match
+        # of a lower-priority rule never hides a later match of a better one
+        alternation = '|'.join(f'(?P<rule{i}>{pattern})' for i, pattern in enumerate(rules))
+        self._rules = rules
+        self._compiled = compiled
+        self._scanner = re.compile(f'(?=(?:{alternation}))', self.flags)
+        self.parse = lru_cache(maxsize=self.cache_size)(self._parse)
+
+    def _parse(self, description):
+        if not description:
+            return UNKNOWN_CREATOR
+
+        best_rule = best_position = None
+        for match in self._scanner.finditer(description):
+            rule = int(match.lastgroup[4:])
+            if best_rule is None or rule < best_rule:
+                best_rule, best_position = rule, match.start()
+                if rule == 0:
+                    break  # Leftmost match of the top rule; nothing can beat it
+
+        if best_rule is None:
+            return UNKNOWN_CREATOR
+        return self._compiled[best_rule].match(description, best_position).group(1)
+
+
+# Parser shared by the workers
+default_parser = CreatorParser()
+
+
+def extract_creator(description):
+    """
+    Return the creator named in a snapshot description using the shared parser.
+
+    Args:
+        description (str): Snapshot description, or None
+
+    Returns:
+        str: The username who created the snapshot, or 'Unknown'
+    """
+    return default_parser.parse(description)
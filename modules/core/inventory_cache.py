@@ -0,0 +1,142 @@
+"""
+Inventory Cache
+
+This module contains the on-disk cache of the last fetched snapshot inventory.
+It lives in inventory.db next to config.db and holds one row per vCenter: the
+time the vCenter was fetched and its snapshot records as a compressed blob
+encrypted with the configuration database key. Rows are keyed by the config
+manager's blind index, so hostnames are never stored in plain text.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import zlib
+
+from .snapshot_record import SnapshotRecord
+
+
+# Version of the payload layout; rows in another format are ignored
+PAYLOAD_FORMAT = 1
+
+
+class InventoryCache:
+    """
+    Persists snapshot records per vCenter for an instant warm start.
+
+    Usage:
+        cache = InventoryCache(path, config_manager)
+        cache.save_vcenter('vc1', records, fetched_at)
+        for vcenter, (fetched_at, records) in cache.load().items(): ...
+    """
+
+    def __init__(self, db_path, config_manager):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            db_path (str): Path of inventory.db
+            config_manager (EncryptedConfigManager): Provides encryption and lookup keys
+        """
+        self.db_path = db_path
+        self.config_manager = config_manager
+        self.lock = threading.Lock()
+        self.logger = logging.getLogger('pySnap')
+
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS inventory (
+                vcenter_key TEXT PRIMARY KEY,
+                fetched_at REAL NOT NULL,
+                format INTEGER NOT NULL,
+                payload BLOB NOT NULL
+            )
+        """)
+        self.conn.commit()
+
+    def save_vcenter(self, vcenter, records, fetched_at):
+        """
+        Replace the cached inventory of one vCenter.
+
+        Args:
+            vcenter (str): vCenter hostname
+            records (list): SnapshotRecord objects for the vCenter
+            fetched_at (float): POSIX time the records were fetched
+        """
+        document = {
+            'vcenter': vcenter,
+            'fields': SnapshotRecord._fields,
+            'records': [list(record) for record in records]
+        }
+        payload = self.config_manager.encrypt_bytes(
+            zlib.compress(json.dumps(document, separators=(',', ':')).encode('utf-8'))
+        )
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO inventory (vcenter_key, fetched_at, format, payload) VALUES (?, ?, ?, ?)",
+                (self.config_manager.lookup_key(vcenter), fetched_at, PAYLOAD_FORMAT, payload)
+            )
+            self.conn.commit()
+
+    def remove_vcenter(self, vcenter):
+        """Drop the cached inventory of one vCenter"""
+        self.remove_vcenter_keys([self.config_manager.lookup_key(vcenter)])
+
+    def remove_vcenter_keys(self, vcenter_keys):
+        """
+        Drop the cached inventories stored under the given lookup keys.
+
+        Suited as a server-removed listener of the config manager, which only
+        knows the lookup keys of the hostnames it removed.
+
+        Args:
+            vcenter_keys (list): Lookup keys (config_manager.lookup_key) of vCenter hostnames
+        """
+        with self.lock:
+            self.conn.executemany("DELETE FROM inventory WHERE vcenter_key = ?",
+                                  [(key,) for key in vcenter_keys])
+            self.conn.commit()
+
+    def load(self):
+        """
+        Read every cached vCenter inventory.
+
+        Entries that cannot be decrypted or decoded (for example after the
+        database key changed) are skipped.
+
+        Returns:
+            dict: vCenter hostname -> (fetched_at, list of SnapshotRecord)
+        """
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT fetched_at, payload FROM inventory WHERE format = ?", (PAYLOAD_FORMAT,)
+            ).fetchall()
+
+        inventory = {}
+        for fetched_at, payload in rows:
+            try:
+                document = json.loads(zlib.decompress(self.config_manager.decrypt_bytes(payload)))
+                inventory[document['vcenter']] = (fetched_at, self.decode_records(document))
+            except Exception as e:
+                self.logger.warning(f"Ignoring unreadable inventory cache entry: {e}")
+        return inventory
+
+    @staticmethod
+    def decode_records(document):
+        """Rebuild SnapshotRecord objects, tolerating fields added or removed since they were saved"""
+        fields = document['fields']
+        if tuple(fields) == SnapshotRecord._fields:
+            return [SnapshotRecord(*values) for values in document['records']]
+        known = set(SnapshotRecord._fields)
+        return [
+            SnapshotRecord(**{name: value for name, value in zip(fields, values) if name in known})
+            for values in document['records']
+        ]
+
+    def close(self):
+        """Close the cache database"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,239 @@
+"""
+Inventory Watch
+
+This module contains a live view of the snapshots on a set of vCenters.
+Each vCenter gets one private PropertyCollector with a filter on every VM's
+name and snapshot tree, and a thread blocked in WaitForUpdatesEx. The first
+calls return the whole inventory in pages; after that vCenter only reports
+the VMs that changed since the last version, and each change is turned into
+the snapshot records that were added or removed.
+"""
+
+import logging
+import queue
+import threading
+from typing import NamedTuple
+from pyVmomi import vim, vmodl
+
+from .property_collector import build_container_filter_spec, DEFAULT_PAGE_SIZE
+from .snapshot_record import walk_snapshot_tree
+
+
+# Longest time a WaitForUpdatesEx call blocks before returning empty
+DEFAULT_WAIT_SECONDS = 30
+
+# VM properties watched for snapshot changes
+VM_PROPERTIES = ['name', 'snapshot.rootSnapshotList']
+
+
+class InventoryChange(NamedTuple):
+    """Snapshots that changed on one vCenter since the previous change"""
+    vcenter: str
+    added: list  # SnapshotRecord objects that are new or changed
+    removed: list  # SnapshotRecord objects that no longer exist in this form
+    synced: bool  # The complete inventory has been delivered
+    error: str = ''  # Set when the watch failed and stopped
+
+
+class InventoryWatch:
+    """
+    Streams snapshot changes across vCenters with one long-poll per vCenter.
+
+    Usage:
+        watch = InventoryWatch(build_record)
+        watch.watch(hostname, si)
+        change = watch.next_change()  # InventoryChange
+        watch.stop()
+    """
+
+    def __init__(self, build_record, wait_seconds=DEFAULT_WAIT_SECONDS, page_size=DEFAULT_PAGE_SIZE):
+        """
+        Args:
+            build_record: Callable (vcenter, vm, vm_name, snapshot tree node, parent node)
+                returning the SnapshotRecord for a snapshot
+            wait_seconds (int): Longest time each long-poll blocks
+            page_size (int): Most VMs reported per update while the inventory loads
+        """
+        self.build_record = build_record
+        self.wait_seconds = wait_seconds
+        self.page_size = page_size
+        self.changes = queue.Queue()
+        self._watchers = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger('pySnap')
+
+    def watch(self, vcenter, si):
+        """
+        Start watching a vCenter, replacing any watch on a previous session.
+
+        The first changes reported for the vCenter deliver its whole inventory.
+
+        Args:
+            vcenter (str): vCenter hostname
+            si: vim.ServiceInstance for the vCenter
+        """
+        watcher = _VCenterInventoryWatcher(vcenter, si, self.build_record, self.changes,
+                                           self.wait_seconds, self.page_size)
+        with self._lock:
+            previous = self._watchers.get(vcenter)
+            self._watchers[vcenter] = watcher
+        if previous is not None:
+            previous.stop()
+        watcher.start()
+
+    def unwatch(self, vcenter):
+        """Stop watching a vCenter"""
+        with self._lock:
+            watcher = self._watchers.pop(vcenter, None)
+        if watcher is not None:
+            watcher.stop()
+
+    def next_change(self, timeout=None):
+        """
+        Wait for the next change from a vCenter that is still watched.
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            InventoryChange: Next change, or None if the timeout expired
+        """
+        while True:
+            try:
+                watcher, change = self.changes.get(timeout=timeout)
+            except queue.Empty:
+                return None
+            with self._lock:
+                current = self._watchers.get(change.vcenter) is watcher
+            if current:
+                return change
+            # Left over from a watch that was replaced or removed
+
+    def stop(self):
+        """Stop all long-polls and destroy their property collectors"""
+        with self._lock:
+            watchers, self._watchers = list(self._watchers.values()), {}
+        for watcher in watchers:
+            watcher.stop()
+        for watcher in watchers:
+            watcher.join()
+
+
+class _VCenterInventoryWatcher(threading.Thread):
+    """Long-polls one vCenter's private PropertyCollector for VM snapshot changes"""
+
+    def __init__(self, vcenter, si, build_record, changes, wait_seconds, page_size):
+        super().__init__(name=f'pysnap-inventory-{vcenter}', daemon=True)
+        self.vcenter = vcenter
+        self.build_record = build_record
+        self.changes = changes
+        self.wait_seconds = wait_seconds
+        self.page_size = page_size
+        self.logger = logging.getLogger('pySnap')
+        self.vms = {}  # VM MoRef ID -> (properties, {snapshot MoRef ID: SnapshotRecord})
+        self.stopped = threading.Event()
+
+        # A private collector keeps our filter and update versions isolated
+        content = si.RetrieveContent()
+        self.property_collector = content.propertyCollector.CreatePropertyCollector()
+        self.container = None
+        try:
+            self.container = content.viewManager.CreateContainerView(
+                content.rootFolder, [vim.VirtualMachine], True
+            )
+            filter_spec = build_container_filter_spec(self.container, vim.VirtualMachine, VM_PROPERTIES)
+            self.property_collector.CreateFilter(filter_spec, partialUpdates=False)
+        except Exception:
+            self.destroy()
+            raise
+
+    def stop(self):
+        """Ask the long-poll to return and the thread to exit"""
+        self.stopped.set()
+        try:
+            self.property_collector.CancelWaitForUpdates()
+        except Exception:
+            pass  # Nothing is waiting, or the session is gone
+
+    def run(self):
+        version = ''
+        synced = False
+        options = vmodl.query.PropertyCollector.WaitOptions(
+            maxWaitSeconds=self.wait_seconds, maxObjectUpdates=self.page_size
+        )
+        try:
+            while not self.stopped.is_set():
+                update_set = self.property_collector.WaitForUpdatesEx(version, options)
+                if update_set is None:
+                    # Timed out with no changes; an empty inventory is complete
+                    if not synced:
+                        synced = True
+                        self.publish([], [], synced)
+                    continue
+                version = update_set.version
+
+                added, removed = [], []
+                for filter_update in update_set.filterSet or []:
+                    for object_update in filter_update.objectSet or []:
+                        self.apply_update(object_update, added, removed)
+
+                # A truncated update set means more of the initial inventory follows
+                newly_synced = not synced and not update_set.truncated
+                synced = synced or newly_synced
+                if added or removed or newly_synced:
+                    self.publish(added, removed, synced)
+        except Exception as e:
+            if not self.stopped.is_set():
+                self.logger.error(f"Inventory watch failed on {self.vcenter}: {str(e)}")
+                self.changes.put((self, InventoryChange(self.vcenter, [], [], synced, str(e))))
+        finally:
+            self.destroy()
+
+    def publish(self, added, removed, synced):
+        """Queue a change unless the watch is being stopped"""
+        if not self.stopped.is_set():
+            self.changes.put((self, InventoryChange(self.vcenter, added, removed, synced)))
+
+    def apply_update(self, object_update, added, removed):
+        """
+        Merge one VM's property changes and collect the snapshot records that changed.
+
+        Args:
+            object_update: vmodl.query.PropertyCollector.ObjectUpdate for a VM
+            added (list): Receives records that are new or changed
+            removed (list): Receives records that disappeared or were replaced
+        """
+        vm = object_update.obj
+        if object_update.kind == 'leave':
+            _, snapshots = self.vms.pop(vm._moId, ({}, {}))
+            removed.extend(snapshots.values())
+            return
+
+        properties, snapshots = self.vms.get(vm._moId, ({}, {}))
+        for change in object_update.changeSet or []:
+            if change.op in ('remove', 'indirectRemove'):
+                properties.pop(change.name, None)
+            else:
+                properties[change.name] = change.val
+
+        vm_name = properties.get('name', '')
+        records = {}
+        for snapshot, parent in walk_snapshot_tree(properties.get('snapshot.rootSnapshotList') or []):
+            record = self.build_record(self.vcenter, vm, vm_name, snapshot, parent)
+            records[record.snapshot_moref] = record
+        self.vms[vm._moId] = (properties, records)
+
+        removed.extend(record for moref, record in snapshots.items() if records.get(moref) != record)
+        added.extend(record for moref, record in records.items() if snapshots.get(moref) != record)
+
+    def destroy(self):
+        """Destroy the container view and the private collector (which drops its filter)"""
+        try:
+            if self.container is not None:
+                self.container.Destroy()
+        except Exception:
+            pass
+        try:
+            self.property_collector.DestroyPropertyCollector()
+        except Exception:
+            pass
@@ -0,0 +1,169 @@
+"""
+Property Collector Helpers
+
+This module contains helpers for bulk inventory retrieval through the
+vSphere PropertyCollector, so callers can read properties for every object
+in a container with a handful of paged SOAP calls instead of one round trip
+per attribute.
+"""
+
+from pyVmomi import vim, vmodl
+
+
+# Number of objects requested per RetrievePropertiesEx/ContinueRetrievePropertiesEx page
+DEFAULT_PAGE_SIZE = 1000
+
+
+def build_container_filter_spec(container, obj_type, path_set):
+    """
+    Build a filter spec that selects every object of obj_type in a container view.
+
+    Args:
+        container: vim.view.ContainerView to traverse
+        obj_type: Managed object type to collect (e.g. vim.VirtualMachine)
+        path_set (list): Property paths to collect for each object
+
+    Returns:
+        vmodl.query.PropertyCollector.FilterSpec: Filter spec for the collector
+    """
+    traversal_spec = vmodl.query.PropertyCollector.TraversalSpec(
+        name='traverseView',
+        path='view',
+        skip=False,
+        type=vim.view.ContainerView
+    )
+    object_spec = vmodl.query.PropertyCollector.ObjectSpec(
+        obj=container,
+        skip=True,
+        selectSet=[traversal_spec]
+    )
+    property_spec = vmodl.query.PropertyCollector.PropertySpec(
+        type=obj_type,
+        pathSet=list(path_set),
+        all=False
+    )
+    return vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[object_spec],
+        propSet=[property_spec]
+    )
+
+
+def retrieve_pages(property_collector, filter_spec, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Retrieve object contents page by page using RetrievePropertiesEx.
+
+    Args:
+        property_collector: vmodl.query.PropertyCollector to query
+        filter_spec: FilterSpec describing the objects and properties to collect
+        page_size (int): Maximum number of objects returned per page
+
+    Yields:
+        list: vmodl.query.PropertyCollector.ObjectContent entries for one page
+    """
+    options = vmodl.query.PropertyCollector.RetrieveOptions(maxObjects=page_size)
+    result = property_collector.RetrievePropertiesEx([filter_spec], options)
+
+    while result:
+        yield list(result.objects or [])
+
+        if not result.token:
+            break
+        result = property_collector.ContinueRetrievePropertiesEx(result.token)
+
+
+def retrieve_properties(property_collector, filter_spec, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Retrieve object contents one object at a time, fetching pages as needed.
+
+    Args:
+        property_collector: vmodl.query.PropertyCollector to query
+        filter_spec: FilterSpec describing the objects and properties to collect
+        page_size (int): Maximum number of objects returned per page
+
+    Yields:
+        vmodl.query.PropertyCollector.ObjectContent: One entry per collected object
+    """
+    for page in retrieve_pages(property_collector, filter_spec, page_size):
+        yield from page
+
+
+def object_properties(object_content):
+    """
+    Flatten an ObjectContent into a dictionary of property path -> value.
+
+    Args:
+        object_content: vmodl.query.PropertyCollector.ObjectContent
+
+    Returns:
+        dict: Collected property values keyed by property path
+    """
+    return {prop.name: prop.val for prop in object_content.propSet or []}
+
+
+def iter_container_pages(si, obj_type, path_set, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Collect properties for every object of obj_type under the root folder, page by page.
+
+    The container view is always destroyed, even if the caller stops
+    iterating early or an error is raised mid-page.
+
+    Args:
+        si: vim.ServiceInstance for the vCenter
+        obj_type: Managed object type to collect (e.g. vim.VirtualMachine)
+        path_set (list): Property paths to collect for each object
+        page_size (int): Maximum number of objects returned per page
+
+    Yields:
+        list: (managed object reference, dict of property path -> value) tuples for one page
+    """
+    content = si.RetrieveContent()
+    container = content.viewManager.CreateContainerView(
+        content.rootFolder, [obj_type], True
+    )
+    try:
+        filter_spec = build_container_filter_spec(container, obj_type, path_set)
+        for page in retrieve_pages(content.propertyCollector, filter_spec, page_size):
+            yield [(object_content.obj, object_properties(object_content)) for object_content in page]
+    finally:
+        container.Destroy()
+
+
+def iter_container_properties(si, obj_type, path_set, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Collect properties for every object of obj_type under the root folder.
+
+    Args:
+        si: vim.ServiceInstance for the vCenter
+        obj_type: Managed object type to collect (e.g. vim.VirtualMachine)
+        path_set (list): Property paths to collect for each object
+        page_size (int): Maximum number of objects returned per page
+
+    Yields:
+        tuple: (managed object reference, dict of property path -> value)
+    """
+    for page in iter_container_pages(si, obj_type, path_set, page_size):
+        yield from page
+
+
+def iter_object_properties(si, objects, obj_type, path_set, page_size=DEFAULT_PAGE_SIZE):
+    """
+    Collect properties for a known list of managed objects.
+
+    Args:
+        si: vim.ServiceInstance for the vCenter
+        objects (list): Managed object references of type obj_type
+        obj_type: Managed object type of the objects (e.g. vim.VirtualMachine)
+        path_set (list): Property paths to collect for each object
+        page_size (int): Maximum number of objects returned per page
+
+    Yields:
+        tuple: (managed object reference, dict of property path -> value)
+    """
+    if not objects:
+        return
+    filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+        objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=obj, skip=False) for obj in objects],
+        propSet=[vmodl.query.PropertyCollector.PropertySpec(type=obj_type, pathSet=list(path_set), all=False)]
+    )
+    for object_content in retrieve_properties(si.RetrieveContent().propertyCollector, filter_spec, page_size):
+        yield object_content.obj, object_properties(object_content)
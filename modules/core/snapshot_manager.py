@@ -10,27 +10,31 @@ import time
 import os
 import json
 import logging
-import ssl
-import socket
 import getpass
-import urllib3
 from datetime import datetime, timedelta
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QPushButton, 
-                            QLabel, QVBoxLayout, QHBoxLayout, QTreeWidget, 
-                            QTreeWidgetItem, QCheckBox, QMessageBox, QFrame,
-                            QTreeWidgetItemIterator, QMenu, QTextEdit, QProgressBar,
-                            QApplication, QDialog)
+                            QLabel, QVBoxLayout, QHBoxLayout, QTreeView,
+                            QCheckBox, QMessageBox, QFrame,
+                            QMenu, QProgressBar,
+                            QApplication, QDialog, QAbstractItemView)
 from PyQt6.QtCore import Qt, QTimer, QSettings
-from PyQt6.QtGui import QColor, QBrush, QIcon
-from pyVim.connect import SmartConnect, Disconnect
+from PyQt6.QtGui import QIcon
+from pyVim.connect import Disconnect
 from pyVmomi import vim
 
 from ..workers import (SnapshotFetchWorker, SnapshotDeleteWorker, 
-                      SnapshotCreateWorker, AutoConnectWorker)
-from ..dialogs import AddVCenterDialog, CreateSnapshotsDialog
+                      SnapshotCreateWorker, AutoConnectWorker, ConnectionSupervisor,
+                      LiveInventoryWorker)
+from ..dialogs import AddVCenterDialog, CreateSnapshotsDialog, ConfirmDeleteDialog
 from ..widgets import SecurePasswordField
-from .utilities import format_vmware_time
+from .utilities import (format_vmware_time, HolidayCalendar, count_business_days,
+                        count_business_days_many)
 from .progress_tracker import ProgressTracker
+from .connection import connect_vcenter
+from .snapshot_record import SnapshotRecord
+from .inventory_cache import InventoryCache
+from .snapshot_model import (SnapshotTableModel, SnapshotFilterProxyModel, ChunkedFilterRunner,
+                             CHECK_COLUMN, VM_NAME_COLUMN, CREATED_COLUMN)
 from snapshot_filters import SnapshotFilterPanel
 from version import __version__
 from encrypted_config_manager import EncryptedConfigManager
@@ -70,20 +74,39 @@ class SnapshotManagerWindow(QMainWindow):
         # Initialize variables
         self.vcenter_connections = {}
         self.connections_lock = threading.Lock()  # Thread safety for connections dict
-        self.snapshots = {}
+        self.vcenter_fetch_status = {}  # Per-vCenter status during parallel fetches
+        self.connection_latency = {}  # Last login time per vCenter, in seconds
         self.setup_logging()
         self.logger = logging.getLogger('pySnap')
         self.config_manager = ConfigManager()
         self.saved_servers = self.config_manager.load_servers()
-        
-        # Add connection monitoring timer
-        self.connection_timer = QTimer(self)
-        self.connection_timer.timeout.connect(self.check_connections)
-        self.connection_timer.start(300000)  # Check every 5 minutes
+        self.holiday_calendar = self.load_holiday_calendar()
+        
+        # Last fetched inventory, shown at startup until a refresh replaces it
+        self.inventory_cache = self.open_inventory_cache()
+        self.inventory_fetched_at = {}  # vCenter -> POSIX time its displayed snapshots were fetched
+        self.stale_vcenters = set()  # vCenters showing data older than the last refresh
+        self.dirty_vcenters = set()  # vCenters whose cached inventory needs rewriting
+        self.fetch_seen = {}  # vCenter -> snapshot IDs received during the running fetch
+        self.cache_timer = QTimer(self)
+        self.cache_timer.setSingleShot(True)
+        self.cache_timer.setInterval(2000)
+        self.cache_timer.timeout.connect(self.persist_inventory)
+        
+        # Streams snapshot changes while live updates are switched on
+        self.live_worker = None
         
         # Store credentials for reconnection
         self.active_credentials = {}  # Store credentials for active connections
         
+        # Probe sessions and reconnect in the background
+        self.connection_health = {}  # hostname -> (healthy, detail) from the supervisor
+        self.connection_supervisor = ConnectionSupervisor()
+        self.connection_supervisor.health_changed.connect(self.on_connection_health)
+        self.connection_supervisor.reconnected.connect(self.on_reconnected)
+        self.connection_supervisor.connection_lost.connect(self.on_connection_lost)
+        self.connection_supervisor.start()
+        
         # Session management for security
         self.session_timeout = 30 * 60 * 1000  # 30 minutes in milliseconds
         self.last_activity = time.time()
@@ -128,7 +151,7 @@ class SnapshotManagerWindow(QMainWindow):
         # Connect to filter panel and save state when changed
         self.patch_filter_checkbox.stateChanged.connect(self.save_patch_filter_state)
         self.patch_filter_checkbox.stateChanged.connect(self.sync_patch_filter_to_panel)
-        self.patch_filter_checkbox.stateChanged.connect(self.apply_filters)
+        self.patch_filter_checkbox.stateChanged.connect(self.schedule_filters)
         
         conn_layout.addWidget(self.add_conn_btn)
         conn_layout.addWidget(self.auto_conn_btn)
@@ -139,9 +162,14 @@ class SnapshotManagerWindow(QMainWindow):
         
         # Filter panel
         self.filter_panel = SnapshotFilterPanel()
-        self.filter_panel.filters_changed.connect(self.apply_filters)
+        self.filter_panel.filters_changed.connect(self.schedule_filters)
         self.filter_panel.filters_changed.connect(self.sync_patch_filter_from_panel)
-        self.filter_panel.filters_changed.connect(self.update_old_snapshots_label)
+        
+        # Coalesce bursts of filter changes (e.g. typing) into a single filter pass
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(self.apply_filters)
         
         # Sync the patching filter with the main checkbox
         self.filter_panel.set_patching_filter(patch_filter_enabled)
@@ -152,26 +180,40 @@ class SnapshotManagerWindow(QMainWindow):
         # Update the color legend label
         self.update_old_snapshots_label()
         
-        # Tree widget for snapshots
-        self.tree = QTreeWidget()
-        self.tree.setHeaderLabels(["Select", "VM Name", "vCenter", "Snapshot Name", "Created", "Created By", "Description", "Snapshot Type"])
-        self.tree.setSortingEnabled(True)
+        # Snapshot model, filter proxy and view
+        self.snapshot_model = SnapshotTableModel(self)
+        self.snapshot_model.set_age_policy(
+            self.filter_panel.get_age_threshold(),
+            self.filter_panel.get_day_type(),
+            self.calculate_ages
+        )
+        self.snapshot_model.checked_count_changed.connect(self.update_delete_button)
         
-        # Disable row selection, only allow checkbox interaction
-        self.tree.setSelectionMode(QTreeWidget.SelectionMode.NoSelection)
+        self.snapshot_proxy = SnapshotFilterProxyModel(self)
+        self.snapshot_proxy.setSourceModel(self.snapshot_model)
         
-        # Connect to item clicked for checkbox handling
-        self.tree.itemClicked.connect(self.on_item_clicked)
+        # Large inventories are filtered in chunks so the UI never blocks
+        self.filter_runner = ChunkedFilterRunner(self.snapshot_proxy, parent=self)
+        self.filter_runner.finished.connect(self.update_snapshot_counter)
         
-        # Set default sorting to Created column (index 4) in ascending order
-        self.tree.sortByColumn(4, Qt.SortOrder.AscendingOrder)
+        self.snapshot_view = QTreeView()
+        self.snapshot_view.setModel(self.snapshot_proxy)
+        self.snapshot_view.setRootIsDecorated(False)
+        self.snapshot_view.setUniformRowHeights(True)
+        self.snapshot_view.setSortingEnabled(True)
         
-        # Enable context menu for tree widget
-        self.tree.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
-        self.tree.customContextMenuRequested.connect(self.show_context_menu)
+        # Disable row selection, only allow checkbox interaction
+        self.snapshot_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        
+        # Set default sorting to Created column in ascending order
+        self.snapshot_view.sortByColumn(CREATED_COLUMN, Qt.SortOrder.AscendingOrder)
+        
+        # Enable context menu for the snapshot view
+        self.snapshot_view.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
+        self.snapshot_view.customContextMenuRequested.connect(self.show_context_menu)
         
         # Connect double-click handler
-        self.tree.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.snapshot_view.doubleClicked.connect(self.on_item_double_clicked)
         
         # Button frame
         button_frame = QWidget()
@@ -189,6 +231,11 @@ class SnapshotManagerWindow(QMainWindow):
         self.fetch_button.clicked.connect(self.start_fetch)
         self.fetch_button.setEnabled(False)
         
+        self.live_checkbox = QCheckBox("Live updates")
+        self.live_checkbox.setToolTip("Keep the list current by streaming snapshot changes from vCenter")
+        self.live_checkbox.setEnabled(False)
+        self.live_checkbox.toggled.connect(self.toggle_live_updates)
+        
         self.delete_button = QPushButton("Delete Selected")
         self.delete_button.setFixedWidth(button_width)
         self.delete_button.clicked.connect(self.delete_selected)
@@ -199,6 +246,7 @@ class SnapshotManagerWindow(QMainWindow):
         button_layout.addWidget(self.create_button)
         button_layout.addSpacing(10)  # Add space between buttons
         button_layout.addWidget(self.fetch_button)
+        button_layout.addWidget(self.live_checkbox)
         button_layout.addSpacing(10)
         button_layout.addWidget(self.delete_button)
         button_layout.addStretch()  # Push buttons to center
@@ -252,7 +300,7 @@ class SnapshotManagerWindow(QMainWindow):
         
         # Replace the old highlight info with the new frame
         main_layout.addWidget(conn_frame)
-        main_layout.addWidget(self.tree)
+        main_layout.addWidget(self.snapshot_view)
         main_layout.addWidget(highlight_frame)
         main_layout.addWidget(button_frame)
         
@@ -280,32 +328,39 @@ class SnapshotManagerWindow(QMainWindow):
         """)
         self.progress_bar.hide()  # Hidden by default
         self.counter_label = QLabel("Snapshots: 0")
+        self.stale_label = QLabel()
+        self.stale_label.setStyleSheet("color: #B8860B;")  # Dark goldenrod
+        self.stale_label.hide()
         
         status_layout.addWidget(self.progress_bar)
         status_layout.addWidget(self.status_label)
         status_layout.addStretch()
+        status_layout.addWidget(self.stale_label)
         status_layout.addWidget(self.counter_label)
         
         # Add all sections to main layout
         main_layout.addWidget(conn_frame)
         main_layout.addWidget(self.filter_panel)
-        main_layout.addWidget(self.tree)
+        main_layout.addWidget(self.snapshot_view)
         main_layout.addWidget(highlight_frame)
         main_layout.addWidget(button_frame)
         main_layout.addWidget(status_frame)
 
         # Add column widths
-        self.tree.setColumnWidth(0, 50)   # Checkbox column
-        self.tree.setColumnWidth(1, 180)  # VM Name
-        self.tree.setColumnWidth(2, 180)  # vCenter
-        self.tree.setColumnWidth(3, 180)  # Snapshot Name
-        self.tree.setColumnWidth(4, 130)  # Created
-        self.tree.setColumnWidth(5, 120)  # Created By
-        self.tree.setColumnWidth(6, 250)  # Description
-        self.tree.setColumnWidth(7, 150)  # Snapshot Type column
+        self.snapshot_view.setColumnWidth(0, 50)   # Checkbox column
+        self.snapshot_view.setColumnWidth(1, 180)  # VM Name
+        self.snapshot_view.setColumnWidth(2, 180)  # vCenter
+        self.snapshot_view.setColumnWidth(3, 180)  # Snapshot Name
+        self.snapshot_view.setColumnWidth(4, 130)  # Created
+        self.snapshot_view.setColumnWidth(5, 120)  # Created By
+        self.snapshot_view.setColumnWidth(6, 250)  # Description
+        self.snapshot_view.setColumnWidth(7, 150)  # Snapshot Type column
 
         # After loading saved_servers
         self.check_auto_connect()
+        
+        # Show the cached inventory as soon as the window is up
+        QTimer.singleShot(0, self.load_cached_inventory)
 
         # Settings menu removed - auto-connect is now manual only
 
@@ -374,87 +429,19 @@ class SnapshotManagerWindow(QMainWindow):
         self.status_var.set(f"Found {len(snapshots)} snapshots")
 
     def delete_selected(self):
-        """Delete selected snapshots"""
-        selected_items = []
-        iterator = QTreeWidgetItemIterator(self.tree)
-        while iterator.value():
-            item = iterator.value()
-            if item.checkState(0) == Qt.CheckState.Checked:
-                snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
-                if snapshot_id in self.snapshots:
-                    selected_items.append((item, self.snapshots[snapshot_id]))
-            iterator += 1
+        """Delete selected snapshots after the user confirms them"""
+        selected_items = self.snapshot_model.checked_snapshots()
         
         if not selected_items:
             QMessageBox.warning(self, "Warning", "No snapshots selected")
             return
         
-        # Group snapshots by vCenter for better organization
-        by_vcenter = {}
-        for item, data in selected_items:
-            vcenter = data['vcenter']
-            if vcenter not in by_vcenter:
-                by_vcenter[vcenter] = []
-            by_vcenter[vcenter].append(data)
-        
-        # Create enhanced confirmation dialog
-        confirm_msg = (
-            f"You are about to delete {len(selected_items)} snapshot{'s' if len(selected_items) > 1 else ''}.\n"
-            "Please review the following snapshots carefully:\n"
-        )
-        
-        # Create custom confirmation dialog with scrollable area
-        dialog = QDialog(self)
-        dialog.setWindowTitle("Confirm Snapshot Deletion")
-        dialog.setModal(True)
-        dialog.resize(600, 400)  # Set reasonable default size
-        
-        layout = QVBoxLayout(dialog)
-        
-        # Warning icon and message
-        warning_layout = QHBoxLayout()
-        warning_icon = QLabel("⚠️")
-        warning_icon.setStyleSheet("font-size: 24px;")
-        warning_text = QLabel(confirm_msg)
-        warning_layout.addWidget(warning_icon)
-        warning_layout.addWidget(warning_text, 1)
-        layout.addLayout(warning_layout)
-        
-        # Scrollable text area for snapshot details
-        text_area = QTextEdit()
-        text_area.setReadOnly(True)
-        text_area.setLineWrapMode(QTextEdit.LineWrapMode.NoWrap)
-        
-        # Build detailed message
-        details = ""
-        for vcenter, snapshots in by_vcenter.items():
-            details += f"\nvCenter: {vcenter}"
-            for data in snapshots:
-                details += f"\n• VM: {data['vm_name']}"
-                details += f"\n  ├ Snapshot: {data['name']}"
-                details += f"\n  ├ Created: {data['created']}"
-                details += f"\n  └ Age: {self.get_business_days(datetime.strptime(data['created'], '%Y-%m-%d %H:%M'), datetime.now())} business days"
-                details += "\n"
-        
-        details += "\nWARNING: This action cannot be undone!"
-        text_area.setText(details)
-        layout.addWidget(text_area)
-        
-        # Buttons
-        button_box = QHBoxLayout()
-        
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(dialog.reject)
-        
-        delete_btn = QPushButton("Delete Snapshots")
-        delete_btn.clicked.connect(dialog.accept)
-        delete_btn.setStyleSheet("QPushButton { color: red; }")
-        
-        button_box.addStretch()  # Add stretch before buttons to right-align them
-        button_box.addWidget(cancel_btn)
-        button_box.addWidget(delete_btn)
-        layout.addLayout(button_box)
+        # Ages for the whole selection in one call; the dialog groups them by bucket
+        day_type = "business days"
+        ages = self.calculate_ages([data.created_datetime for _, data in selected_items],
+                                   datetime.now(), day_type)
         
+        dialog = ConfirmDeleteDialog(selected_items, ages, day_type, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.start_delete(selected_items)
 
@@ -482,30 +469,14 @@ class SnapshotManagerWindow(QMainWindow):
         logger.addHandler(file_handler)
         logger.addHandler(console_handler)
 
-    def on_item_clicked(self, item, column):
-        """Handle tree item clicks"""
-        if column == 0:  # Only handle clicks in the checkbox column
-            # Let Qt handle the checkbox state toggle naturally
-            pass
-            
-            # Count checked items and update delete button
-            checked_count = 0
-            iterator = QTreeWidgetItemIterator(self.tree)
-            while iterator.value():
-                if iterator.value().checkState(0) == Qt.CheckState.Checked:
-                    checked_count += 1
-                iterator += 1
-            
-            # Update delete button text and enabled state
-            if checked_count > 0:
-                self.delete_button.setText(f"Delete Selected ({checked_count})")
-                self.delete_button.setEnabled(True)
-            else:
-                self.delete_button.setText("Delete Selected")
-                self.delete_button.setEnabled(False)
+    def update_delete_button(self, checked_count):
+        """Update delete button text and enabled state from the checked snapshot count"""
+        if checked_count > 0:
+            self.delete_button.setText(f"Delete Selected ({checked_count})")
+            self.delete_button.setEnabled(True)
         else:
-            # Prevent selection when clicking other columns
-            self.tree.clearSelection()
+            self.delete_button.setText("Delete Selected")
+            self.delete_button.setEnabled(False)
 
     def add_vcenter(self):
         """Show dialog to add new vCenter connection"""
@@ -517,36 +488,13 @@ class SnapshotManagerWindow(QMainWindow):
                 # Show connection status without progress bar
                 self.status_label.setText(f"Connecting to {data['hostname']}...")
                 
-                # Create SSL context based on user preference
-                context = ssl.create_default_context()
-                if not data.get('verify_ssl', False):
-                    # Disable SSL verification
-                    context.check_hostname = False
-                    context.verify_mode = ssl.CERT_NONE
-                    # Disable SSL verification warnings
-                    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                # else: use default context with verification enabled
-                
-                # Set temporary socket timeout for this connection
-                old_timeout = socket.getdefaulttimeout()
-                socket.setdefaulttimeout(10.0)
-                
-                # Get password string briefly for connection
-                password_str = data['password'].get_password()
-                try:
-                    si = SmartConnect(
-                        host=data['hostname'],
-                        user=data['username'],
-                        pwd=password_str,
-                        sslContext=context,
-                        disableSslCertValidation=not data.get('verify_ssl', False)
-                    )
-                finally:
-                    # Clear the temporary password string
-                    password_str = '\0' * len(password_str)
-                    del password_str
-                    # Restore original timeout
-                    socket.setdefaulttimeout(old_timeout)
+                # Timeout is scoped to this session so probes of it can't hang
+                si = connect_vcenter(
+                    data['hostname'],
+                    data['username'],
+                    data['password'],
+                    data.get('verify_ssl', False)
+                )
                 
                 self.status_label.setText(f"Connected to {data['hostname']}, initializing...")
                 
@@ -558,6 +506,7 @@ class SnapshotManagerWindow(QMainWindow):
                             'password': data['password'],  # This is now a SecurePassword object
                             'verify_ssl': data.get('verify_ssl', False)
                         }
+                    self.track_connection(data['hostname'], si)
                     # Save credentials if requested
                     if data['save']:
                         self.status_label.setText("Saving credentials...")
@@ -593,6 +542,8 @@ class SnapshotManagerWindow(QMainWindow):
             connections_copy = dict(self.vcenter_connections)
             self.vcenter_connections.clear()
             self.active_credentials.clear()  # Clear stored credentials
+        self.connection_supervisor.clear()
+        self.connection_health.clear()
         
         # Disconnect outside the lock to avoid holding it during network operations
         for hostname, si in connections_copy.items():
@@ -603,6 +554,14 @@ class SnapshotManagerWindow(QMainWindow):
         
         self.update_connection_status()
 
+    def track_connection(self, hostname, si):
+        """Hand a new session to the connection supervisor"""
+        with self.connections_lock:
+            credentials = self.active_credentials.get(hostname)
+        self.connection_supervisor.add_session(hostname, si, credentials)
+        self.connection_health[hostname] = (True, 'Connected')
+        self.watch_live(hostname, si)
+
     def update_connection_status(self):
         """Update the connection status label"""
         with self.connections_lock:
@@ -613,30 +572,39 @@ class SnapshotManagerWindow(QMainWindow):
             self.conn_label.setText("No active connections")
             self.clear_conn_btn.setEnabled(False)
             self.fetch_button.setEnabled(False)
+            self.live_checkbox.setChecked(False)
+            self.live_checkbox.setEnabled(False)
             self.delete_button.setEnabled(False)
         else:
+            # Health comes from the connection supervisor; never probe on the GUI thread
             status_text = ""
+            tooltip = []
             for hostname in hostnames:
-                try:
-                    # Test connection
-                    with self.connections_lock:
-                        si = self.vcenter_connections.get(hostname)
-                    if si:
-                        si.CurrentTime()
-                        status_text += f"🟢 {hostname}  "  # Green circle for success
-                    else:
-                        status_text += f"🔴 {hostname}  "  # Red circle for failure
-                except:
+                healthy, detail = self.connection_health.get(hostname, (True, 'Connected'))
+                if healthy:
+                    status_text += f"🟢 {hostname}  "  # Green circle for success
+                else:
                     status_text += f"🔴 {hostname}  "  # Red circle for failure
+                line = f"{hostname}: {detail}"
+                # Login times help spot slow sites
+                if hostname in self.connection_latency:
+                    line += f", login took {self.connection_latency[hostname]:.2f}s"
+                tooltip.append(line)
             
             self.conn_label.setText(f"Connected to: {status_text}")
+            self.conn_label.setToolTip("\n".join(tooltip))
             self.clear_conn_btn.setEnabled(True)
-            self.fetch_button.setEnabled(True)
+            self.fetch_button.setEnabled(self.live_worker is None)
+            # Stays disabled while a stopped live worker shuts down
+            self.live_checkbox.setEnabled(self.live_worker is None or self.live_checkbox.isChecked())
 
     def start_fetch(self):
-        """Start fetching snapshots in background"""
-        self.tree.clear()
-        self.snapshots.clear()  # Clear snapshot data
+        """
+        Start fetching snapshots in background.
+        
+        Rows already shown stay in place. Each vCenter's rows are reconciled
+        with the fresh data as soon as that vCenter finishes.
+        """
         self.clear_filters_on_refresh()  # Clear filters
         self.fetch_button.setEnabled(False)
         self.delete_button.setText("Delete Selected")  # Reset delete button text
@@ -649,143 +617,298 @@ class SnapshotManagerWindow(QMainWindow):
         # Create a copy of connections for the worker thread
         with self.connections_lock:
             connections_copy = dict(self.vcenter_connections)
+        
+        # Rows of vCenters left out of this fetch keep their old data
+        self.fetch_seen = {hostname: set() for hostname in connections_copy}
+        self.stale_vcenters.update(set(self.inventory_fetched_at) - set(connections_copy))
+        self.update_stale_label()
             
+        self.vcenter_fetch_status = {}
         self.fetch_worker = SnapshotFetchWorker(connections_copy)
         self.fetch_worker.progress.connect(self.update_progress)
-        self.fetch_worker.snapshot_found.connect(self.add_snapshot_to_tree)
+        self.fetch_worker.vcenter_progress.connect(self.update_vcenter_fetch_status)
+        self.fetch_worker.snapshots_batch.connect(self.add_snapshots_to_tree)
+        self.fetch_worker.vcenter_complete.connect(self.on_vcenter_fetched)
         self.fetch_worker.error.connect(self.on_fetch_error)
         self.fetch_worker.finished.connect(self.on_fetch_complete)
         self.fetch_worker.start()
 
+    def update_vcenter_fetch_status(self, hostname, message):
+        """Track per-vCenter fetch status and show it as the status label tooltip"""
+        self.vcenter_fetch_status[hostname] = message
+        self.status_label.setToolTip("\n".join(
+            f"{host}: {status}" for host, status in sorted(self.vcenter_fetch_status.items())
+        ))
+
     def add_snapshot_to_tree(self, data):
-        """Add a snapshot to the tree widget"""
-        item = QTreeWidgetItem(self.tree)
-        
-        # Check if snapshot is part of a chain
-        is_in_chain = data['has_children'] or data['is_child']
-        
-        if is_in_chain:
-            # Disable checkbox and add warning style
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEnabled)  # Don't add ItemIsUserCheckable
-            warning_color = QColor(211, 211, 211)  # Light gray
-            warning_text = QColor(128, 128, 128)  # Gray text
-            
-            for column in range(8):
-                item.setBackground(column, QBrush(warning_color))
-                item.setForeground(column, QBrush(warning_text))
-            
-            # Add warning tooltip
-            chain_status = []
-            if data['has_children']:
-                chain_status.append("Has child snapshots")
-            if data['is_child']:
-                chain_status.append("Is a child snapshot")
-            
-            warning_text = "Cannot delete: " + " and ".join(chain_status)
-            warning_text += "\n\nChain snapshots must be deleted through vSphere Client because:"
-            warning_text += "\n• They have dependencies that require special handling"
-            warning_text += "\n• Improper deletion can corrupt VM data"
-            warning_text += "\n• VMware needs to consolidate disk changes properly"
-            item.setToolTip(0, warning_text)
-        else:
-            # Normal snapshot handling
-            item.setFlags(item.flags() | Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsEnabled)
-            item.setCheckState(0, Qt.CheckState.Unchecked)
-        
-        # Set text for other columns
-        item.setText(1, data['vm_name'])
-        item.setText(2, data['vcenter'])
-        item.setText(3, data['name'])
-        item.setText(4, data['created'])
-        item.setText(5, data.get('created_by', 'Unknown'))  # Add created by column
-        item.setText(6, data.get('description', ''))  # Add description column
-        
-        # Add chain status column
-        if is_in_chain:
-            if data['has_children'] and data['is_child']:
-                chain_status = "Part of Chain (Middle)"
-            elif data['has_children']:
-                chain_status = "Has Child Snapshots (Delete Manually)"
-            else:  # is_child
-                chain_status = "Child Snapshot"
-        else:
-            chain_status = "Independent Snapshot"  # Changed from "Safe to Delete"
-        item.setText(7, chain_status)
-        
-        # Only apply age highlighting if NOT part of a chain (chain highlighting takes precedence)
-        if not is_in_chain:
-            # Check if snapshot is older than the configured threshold
-            created_date = datetime.strptime(data['created'], '%Y-%m-%d %H:%M')
-            current_date = datetime.now()
-            
-            # Get the age threshold and day type from the filter panel
-            age_threshold = self.filter_panel.get_age_threshold()
-            day_type = self.filter_panel.get_day_type()
-            
-            # Calculate days between dates based on selected type
-            if day_type == "business days":
-                days_old = self.get_business_days(created_date, current_date)
-            else:  # calendar days
-                days_old = self.get_calendar_days(created_date, current_date)
-            
-            if days_old > age_threshold:
-                # Highlight old snapshots with yellow colors
-                background_color = QColor(255, 255, 200)  # Light yellow
-                text_color = QColor(139, 69, 19)  # Saddle brown (dark brown)
-                
-                for column in range(8):
-                    item.setBackground(column, QBrush(background_color))
-                    item.setForeground(column, QBrush(text_color))
-                
-                # Add tooltip with age information
-                age_text = f"Snapshot is {days_old} {day_type} old (threshold: {age_threshold} {day_type})"
-                item.setToolTip(0, age_text)
+        """Add a snapshot to the snapshot view"""
+        self.add_snapshots_to_tree([data])
+
+    def add_snapshots_to_tree(self, batch):
+        """
+        Add a batch of snapshots to the snapshot model in one operation.
         
-        # Generate a unique ID for the snapshot
-        snapshot_id = f"{data['vcenter']}_{data['vm_name']}_{data['name']}"
+        Args:
+            batch (list): SnapshotRecord objects emitted by a worker
+        """
+        if not batch:
+            return
         
-        # Store the ID in the item's data
-        item.setData(0, Qt.ItemDataRole.UserRole, snapshot_id)
+        snapshots = [(data.key, data) for data in batch]
+        replaced = self.snapshot_model.add_snapshots(snapshots)
         
-        # Store snapshot data using the ID
-        self.snapshots[snapshot_id] = data
+        # Remember what the running fetch delivered, for reconciliation
+        if self.fetch_seen:
+            for snapshot_id, data in snapshots:
+                seen = self.fetch_seen.get(data.vcenter)
+                if seen is not None:
+                    seen.add(snapshot_id)
         
         # Update counter
         self.update_snapshot_counter()
         
-        # Update filter dropdown options
-        self.filter_panel.update_dropdown_options(self.snapshots)
+        # Update filter dropdown options once for the whole batch
+        self.filter_panel.remove_dropdown_values(replaced)
+        self.filter_panel.add_dropdown_values(batch)
+        self.filter_panel.refresh_dropdowns()
+
+    def on_vcenter_fetched(self, hostname, fetched_at):
+        """
+        Reconcile one vCenter's rows after its fetch completed.
+        
+        Rows of the vCenter that the fetch did not deliver no longer exist
+        and are removed. The vCenter is then current and its cache entry is
+        rewritten.
+        """
+        seen = self.fetch_seen.pop(hostname, set())
+        gone = [snapshot_id for snapshot_id, data in self.snapshot_model.vcenter_snapshots(hostname)
+                if snapshot_id not in seen]
+        removed = self.snapshot_model.remove_snapshots(gone)
+        if removed:
+            self.filter_panel.remove_dropdown_values(removed)
+            self.filter_panel.refresh_dropdowns()
+            self.update_snapshot_counter()
+        
+        self.inventory_fetched_at[hostname] = fetched_at
+        self.stale_vcenters.discard(hostname)
+        self.update_stale_label()
+        self.mark_inventory_dirty(hostname)
+
+    def open_inventory_cache(self):
+        """Open the inventory cache next to the config database (None if unavailable)"""
+        try:
+            path = os.path.join(os.path.dirname(self.config_manager.db_path), 'inventory.db')
+            cache = InventoryCache(path, self.config_manager)
+        except Exception as e:
+            self.logger.warning(f"Inventory cache unavailable: {e}")
+            return None
+        # Forget the inventory of vCenters whose saved server is removed
+        self.config_manager.add_server_removed_listener(cache.remove_vcenter_keys)
+        return cache
+
+    def load_cached_inventory(self):
+        """Show the last fetched inventory, marked stale until it is refreshed"""
+        if self.inventory_cache is None:
+            return
+        try:
+            inventory = self.inventory_cache.load()
+        except Exception as e:
+            self.logger.warning(f"Could not read inventory cache: {e}")
+            return
+        
+        # One insert for everything, so the view sorts and lays out once
+        cached = []
+        for vcenter, (fetched_at, records) in inventory.items():
+            if vcenter in self.inventory_fetched_at:
+                continue  # Already refreshed
+            self.inventory_fetched_at[vcenter] = fetched_at
+            self.stale_vcenters.add(vcenter)
+            cached.extend(records)
+        self.add_snapshots_to_tree(cached)
+        if inventory:
+            self.logger.info(f"Loaded cached inventory for {len(inventory)} vCenters")
+        self.update_stale_label()
+
+    def update_stale_label(self):
+        """Show when the oldest data on screen was fetched, if any vCenter is not current"""
+        stale = sorted(v for v in self.stale_vcenters if v in self.inventory_fetched_at)
+        if not stale:
+            self.stale_label.hide()
+            return
+        
+        def fetched(vcenter):
+            return datetime.fromtimestamp(self.inventory_fetched_at[vcenter]).strftime('%Y-%m-%d %H:%M')
+        
+        oldest = min(stale, key=self.inventory_fetched_at.get)
+        self.stale_label.setText(f"⚠ Cached data, stale since {fetched(oldest)}")
+        self.stale_label.setToolTip("\n".join(f"{vcenter}: fetched {fetched(vcenter)}" for vcenter in stale))
+        self.stale_label.show()
+
+    def mark_inventory_dirty(self, vcenter):
+        """Schedule a rewrite of a vCenter's cached inventory"""
+        self.dirty_vcenters.add(vcenter)
+        self.cache_timer.start()
+
+    def persist_inventory(self):
+        """Write the cache entries of every vCenter changed since the last write"""
+        dirty, self.dirty_vcenters = self.dirty_vcenters, set()
+        if self.inventory_cache is None:
+            return
+        for vcenter in dirty:
+            fetched_at = self.inventory_fetched_at.get(vcenter)
+            if fetched_at is None:
+                continue  # Never fetched; a partial cache entry would hide missing snapshots
+            records = [data for snapshot_id, data in self.snapshot_model.vcenter_snapshots(vcenter)]
+            try:
+                self.inventory_cache.save_vcenter(vcenter, records, fetched_at)
+            except Exception as e:
+                self.logger.warning(f"Could not cache inventory for {vcenter}: {e}")
+
+    def calculate_ages(self, created_dates, current_date, day_type):
+        """Calculate snapshot ages in the selected day type (None for unknown dates)"""
+        if day_type == "business days":
+            return count_business_days_many(created_dates, current_date, self.holiday_calendar)
+        return [None if created_date is None else self.get_calendar_days(created_date, current_date)
+                for created_date in created_dates]
 
     def get_business_days(self, start_date, end_date):
         """Calculate number of business days between two dates"""
-        current = start_date
-        business_days = 0
-        
-        while current <= end_date:
-            # Monday = 0, Sunday = 6
-            if current.weekday() < 5:  # Monday to Friday
-                business_days += 1
-            current += timedelta(days=1)
-            
-        return business_days
+        return count_business_days(start_date, end_date, self.holiday_calendar)
     
     def get_calendar_days(self, start_date, end_date):
         """Calculate number of calendar days between two dates"""
         return (end_date - start_date).days
 
+    def load_holiday_calendar(self):
+        """
+        Load the holiday calendar excluded from business-day ages.
+        
+        The 'holiday_calendar' setting holds either a path to an .ics file or
+        a list of ISO dates separated by commas.
+        
+        Returns:
+            HolidayCalendar: Configured calendar (empty if unset or unreadable)
+        """
+        try:
+            return HolidayCalendar.from_setting(self.config_manager.get_setting('holiday_calendar', ''))
+        except Exception as e:
+            self.logger.warning(f"Could not load holiday calendar: {e}")
+            return HolidayCalendar()
+
     def on_fetch_error(self, error_msg):
         """Handle fetch errors"""
         QMessageBox.warning(self, "Error", f"Failed to fetch snapshots: {error_msg}")
-        self.fetch_button.setEnabled(True)
+        self.fetch_button.setEnabled(self.live_worker is None)
 
     def on_fetch_complete(self):
         """Handle fetch completion"""
         self.reset_progress()
-        self.fetch_button.setEnabled(True)
+        self.status_label.setToolTip("")
+        self.fetch_button.setEnabled(self.live_worker is None)
         self.delete_button.setEnabled(True)
         
-        # Update filter dropdown options with new data
-        self.filter_panel.update_dropdown_options(self.snapshots)
+        # Make sure the filter dropdowns reflect the final data
+        self.filter_panel.refresh_dropdowns()
+        self.fetch_seen = {}
+
+    def toggle_live_updates(self, enabled):
+        """Start or stop live updates when the checkbox changes"""
+        if enabled:
+            self.start_live_updates()
+        elif self.live_worker is not None:
+            # on_live_stopped finishes the cleanup and enables the checkbox again
+            self.live_checkbox.setEnabled(False)
+            self.live_worker.stop()
+
+    def start_live_updates(self):
+        """
+        Watch every connected vCenter and apply snapshot changes as they happen.
+        
+        The first updates deliver each vCenter's inventory and are reconciled
+        with the rows on screen like a fetch; after that only changes arrive.
+        """
+        if self.live_worker is not None:
+            return
+        with self.connections_lock:
+            connections_copy = dict(self.vcenter_connections)
+        
+        self.fetch_button.setEnabled(False)
+        self.fetch_seen = {hostname: set() for hostname in connections_copy}
+        self.vcenter_fetch_status = {}
+        self.status_label.setText("Starting live updates...")
+        
+        self.live_worker = LiveInventoryWorker(connections_copy)
+        self.live_worker.progress.connect(self.update_progress)
+        self.live_worker.vcenter_progress.connect(self.update_vcenter_fetch_status)
+        self.live_worker.snapshots_changed.connect(self.apply_snapshot_changes)
+        self.live_worker.vcenter_complete.connect(self.on_live_vcenter_synced)
+        self.live_worker.vcenter_failed.connect(self.on_live_vcenter_failed)
+        self.live_worker.error.connect(self.on_fetch_error)
+        self.live_worker.finished.connect(self.on_live_stopped)
+        self.live_worker.start()
+
+    def watch_live(self, hostname, si):
+        """Add a new or re-established session to the running live updates"""
+        if self.live_worker is None:
+            return
+        self.fetch_seen[hostname] = set()
+        self.live_worker.watch_vcenter(hostname, si)
+
+    def apply_snapshot_changes(self, hostname, added, removed):
+        """
+        Apply snapshots a live watch reported as added, changed or removed.
+        
+        Args:
+            hostname (str): vCenter the changes belong to
+            added (list): SnapshotRecord objects that are new or changed
+            removed (list): SnapshotRecord objects that no longer exist in this form
+        """
+        # A changed snapshot keeps its key and is replaced in place
+        kept = {data.key for data in added}
+        gone = [data.key for data in removed if data.key not in kept]
+        dropped = self.snapshot_model.remove_snapshots(gone)
+        if dropped:
+            self.filter_panel.remove_dropdown_values(dropped)
+            self.filter_panel.refresh_dropdowns()
+            self.update_snapshot_counter()
+        self.add_snapshots_to_tree(added)
+        
+        # Once the inventory has loaded, every change leaves the vCenter current
+        if hostname not in self.fetch_seen:
+            self.inventory_fetched_at[hostname] = time.time()
+            self.mark_inventory_dirty(hostname)
+
+    def on_live_vcenter_synced(self, hostname, fetched_at):
+        """Reconcile a vCenter whose live inventory finished loading"""
+        self.on_vcenter_fetched(hostname, fetched_at)
+        self.finish_live_sync()
+
+    def on_live_vcenter_failed(self, hostname, reason):
+        """Keep showing a vCenter whose live watch stopped, marked stale"""
+        self.fetch_seen.pop(hostname, None)
+        if hostname in self.inventory_fetched_at:
+            self.stale_vcenters.add(hostname)
+            self.update_stale_label()
+        self.logger.warning(f"Live updates stopped for {hostname}: {reason}")
+        self.finish_live_sync()
+        self.status_label.setText(f"Live updates stopped for {hostname}")
+
+    def finish_live_sync(self):
+        """Hide the progress bar once no vCenter is still loading"""
+        if not self.fetch_seen:
+            self.reset_progress()
+            self.status_label.setToolTip("")
+            self.status_label.setText("Live updates on")
+
+    def on_live_stopped(self):
+        """Clean up after the live worker finished"""
+        self.live_worker = None
+        self.fetch_seen = {}
+        self.reset_progress()
+        self.status_label.setToolTip("")
+        if self.live_checkbox.isChecked():
+            self.live_checkbox.setChecked(False)  # Stopped by an error
+        self.update_connection_status()
 
     def start_delete(self, selected_items):
         """Start deletion process"""
@@ -797,19 +920,24 @@ class SnapshotManagerWindow(QMainWindow):
         self.progress_bar.setValue(0)
         self.status_label.setText("Starting snapshot deletion...")
         
-        self.delete_worker = SnapshotDeleteWorker(selected_items)
+        # Create a copy of connections for the worker thread
+        with self.connections_lock:
+            connections_copy = dict(self.vcenter_connections)
+        
+        self.delete_worker = SnapshotDeleteWorker(connections_copy, selected_items)
         self.delete_worker.progress.connect(self.update_progress)
         self.delete_worker.error.connect(lambda msg: QMessageBox.warning(self, "Error", msg))
         self.delete_worker.item_complete.connect(self.remove_deleted_item)
         self.delete_worker.finished.connect(self.on_delete_complete)
         self.delete_worker.start()
 
-    def remove_deleted_item(self, item):
-        """Remove a successfully deleted item from the tree"""
-        snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
-        if snapshot_id in self.snapshots:
-            del self.snapshots[snapshot_id]
-        self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+    def remove_deleted_item(self, snapshot_id):
+        """Remove a successfully deleted snapshot from the model"""
+        data = self.snapshot_model.get_snapshot(snapshot_id)
+        if self.snapshot_model.remove_snapshot(snapshot_id):
+            self.filter_panel.remove_dropdown_values([data])
+            self.filter_panel.refresh_dropdowns()
+            self.mark_inventory_dirty(data.vcenter)
         self.update_snapshot_counter()
         
         # Reset delete button text after deletion
@@ -818,118 +946,66 @@ class SnapshotManagerWindow(QMainWindow):
     def on_delete_complete(self):
         """Handle deletion completion"""
         self.reset_progress()
-        self.fetch_button.setEnabled(True)
+        self.fetch_button.setEnabled(self.live_worker is None)
         self.delete_button.setEnabled(True)
 
     def check_connections(self):
-        """Check all connections and reconnect if needed"""
-        reconnect_needed = []
-        
-        # Get a copy of connections to check
-        with self.connections_lock:
-            connections_to_check = dict(self.vcenter_connections)
-            
-        for hostname, si in connections_to_check.items():
-            try:
-                # Test connection by making a simple API call
-                si.CurrentTime()
-            except Exception as e:
-                self.logger.warning(f"Connection to {hostname} lost: {str(e)}")
-                
-                # Add to reconnection list if we have credentials
-                with self.connections_lock:
-                    if hostname in self.active_credentials:
-                        reconnect_needed.append(hostname)
-                    else:
-                        # No credentials available, remove the connection
-                        self.vcenter_connections.pop(hostname, None)
-        
-        # If reconnections needed, show status without progress
-        if reconnect_needed:
-            total = len(reconnect_needed)
-            completed = 0
-            
-            for hostname in reconnect_needed:
-                completed += 1
-                self.status_label.setText(f"Reconnecting to {hostname}... ({completed}/{total})")
-                
-                try:
-                    with self.connections_lock:
-                        creds = self.active_credentials.get(hostname)
-                    
-                    if not creds:
-                        continue
-                        
-                    # Create SSL context based on saved preference
-                    context = ssl.create_default_context()
-                    verify_ssl = creds.get('verify_ssl', False)
-                    if not verify_ssl:
-                        context.check_hostname = False
-                        context.verify_mode = ssl.CERT_NONE
-                        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                    
-                    # Get password string briefly for connection
-                    password_str = creds['password'].get_password()
-                    try:
-                        new_si = SmartConnect(
-                            host=hostname,
-                            user=creds['username'],
-                            pwd=password_str,
-                            sslContext=context,
-                            disableSslCertValidation=not verify_ssl
-                        )
-                    finally:
-                        # Clear the temporary password string
-                        password_str = '\0' * len(password_str)
-                        del password_str
-                    
-                    if new_si:
-                        with self.connections_lock:
-                            self.vcenter_connections[hostname] = new_si
-                        self.logger.info(f"Successfully reconnected to {hostname}")
-                    else:
-                        self.logger.error(f"Failed to reconnect to {hostname}")
-                        # Remove failed connection
-                        with self.connections_lock:
-                            self.vcenter_connections.pop(hostname, None)
-                            self.active_credentials.pop(hostname, None)
-                        
-                except Exception as reconnect_error:
-                    self.logger.error(f"Failed to reconnect to {hostname}: {str(reconnect_error)}")
-                    # Remove failed connection
-                    with self.connections_lock:
-                        self.vcenter_connections.pop(hostname, None)
-                        self.active_credentials.pop(hostname, None)
-            
-            # Reset status when done
+        """Ask the connection supervisor to probe all sessions now"""
+        self.connection_supervisor.request_probe()
+
+    def on_connection_health(self, hostname, healthy, detail):
+        """Cache a session health change published by the connection supervisor"""
+        self.connection_health[hostname] = (healthy, detail)
+        if healthy:
             self.status_label.setText("Ready")
-        
-        # Update UI based on current connections
+        else:
+            self.status_label.setText(f"{hostname}: {detail}")
+        self.update_connection_status()
+
+    def on_reconnected(self, hostname, si):
+        """Swap in the new session after the supervisor logged in again"""
+        with self.connections_lock:
+            if hostname not in self.vcenter_connections:
+                return  # Cleared while the supervisor was reconnecting
+            self.vcenter_connections[hostname] = si
+        # The watch on the old session has failed; start over on the new one
+        self.watch_live(hostname, si)
+
+    def on_connection_lost(self, hostname, reason):
+        """Drop a session that failed and cannot be re-established"""
+        with self.connections_lock:
+            self.vcenter_connections.pop(hostname, None)
+            self.active_credentials.pop(hostname, None)
+        self.connection_health.pop(hostname, None)
+        if self.live_worker is not None:
+            self.live_worker.unwatch_vcenter(hostname)
+            self.on_live_vcenter_failed(hostname, reason)
         self.update_connection_status()
 
     def show_context_menu(self, position):
-        """Show context menu for tree widget"""
-        item = self.tree.itemAt(position)
-        if not item:
+        """Show context menu for the snapshot view"""
+        index = self.snapshot_view.indexAt(position)
+        if not index.isValid():
             return
             
         menu = QMenu(self)
         
         # Get the column that was clicked
-        column = self.tree.header().logicalIndexAt(position.x())
-        cell_text = item.text(column)
+        column = index.column()
+        cell_text = index.data() or ""
         
         # Create actions for copying
-        copy_action = menu.addAction(f"Copy '{self.tree.headerItem().text(column)}'")
+        header_text = self.snapshot_proxy.headerData(column, Qt.Orientation.Horizontal)
+        copy_action = menu.addAction(f"Copy '{header_text}'")
         copy_action.triggered.connect(lambda: self.copy_to_clipboard(cell_text))
         
         # Add action to copy VM name regardless of which column was clicked
-        if column != 1:  # If not already on VM Name column
-            vm_name = item.text(1)
+        if column != VM_NAME_COLUMN:  # If not already on VM Name column
+            vm_name = index.siblingAtColumn(VM_NAME_COLUMN).data()
             copy_vm_action = menu.addAction("Copy VM Name")
             copy_vm_action.triggered.connect(lambda: self.copy_to_clipboard(vm_name))
         
-        menu.exec(self.tree.viewport().mapToGlobal(position))
+        menu.exec(self.snapshot_view.viewport().mapToGlobal(position))
 
     def copy_to_clipboard(self, text):
         """Copy text to clipboard"""
@@ -963,10 +1039,10 @@ class SnapshotManagerWindow(QMainWindow):
         # Fallback to system username if no vCenter credentials available
         return getpass.getuser()
 
-    def on_item_double_clicked(self, item, column):
+    def on_item_double_clicked(self, index):
         """Handle double-click to copy cell content"""
-        if column != 0:  # Don't handle checkbox column
-            text = item.text(column)
+        if index.column() != CHECK_COLUMN:  # Don't handle checkbox column
+            text = index.data() or ""
             QApplication.clipboard().setText(text)
             self.status_label.setText(f"Copied to clipboard: {text}")
             
@@ -1033,17 +1109,16 @@ class SnapshotManagerWindow(QMainWindow):
         after creating new ones, which improves performance.
         
         Args:
-            snapshot_data (dict): Dictionary containing snapshot details
+            snapshot_data: SnapshotRecord for the new snapshot, or the server
+                name if the snapshot could not be read back
         """
-        # If we received a dict with full snapshot details, add it to the tree
-        if isinstance(snapshot_data, dict) and 'vm_name' in snapshot_data and 'snapshot' in snapshot_data:
+        # If we received a full snapshot record, add it to the tree
+        if isinstance(snapshot_data, SnapshotRecord):
             self.add_snapshot_to_tree(snapshot_data)
-            self.logger.info(f"Added new snapshot for {snapshot_data['vm_name']} to tree")
-        # For backward compatibility with older versions
-        elif isinstance(snapshot_data, dict) and 'vm_name' in snapshot_data:
-            self.logger.info(f"Created snapshot for {snapshot_data['vm_name']}")
+            self.mark_inventory_dirty(snapshot_data.vcenter)
+            self.logger.info(f"Added new snapshot for {snapshot_data.vm_name} to tree")
         else:
-            self.logger.info(f"Created snapshot with unknown details")
+            self.logger.info(f"Created snapshot for {snapshot_data}")
 
     def on_create_complete(self):
         """
@@ -1054,7 +1129,7 @@ class SnapshotManagerWindow(QMainWindow):
         handle_created_snapshot method, implementing an efficient caching strategy.
         """
         self.reset_progress()
-        self.fetch_button.setEnabled(True)
+        self.fetch_button.setEnabled(self.live_worker is None)
         self.delete_button.setEnabled(True)
         # No need to call start_fetch() as we've already added the snapshots to the tree
 
@@ -1062,8 +1137,19 @@ class SnapshotManagerWindow(QMainWindow):
         """Save window position when closing"""
         settings = QSettings()
         settings.setValue("WindowGeometry", self.saveGeometry())
+        # Write pending inventory changes while the database key is still cached
+        self.cache_timer.stop()
+        self.persist_inventory()
+        if self.inventory_cache is not None:
+            self.inventory_cache.close()
+        if self.live_worker is not None:
+            self.live_worker.stop()
+            self.live_worker.wait(2000)
         # Clear sensitive data on exit
         self.clear_sensitive_data()
+        self.connection_supervisor.stop()
+        self.connection_supervisor.wait(2000)
+        self.config_manager.close()
         super().closeEvent(event)
 
     def check_session_timeout(self):
@@ -1081,6 +1167,9 @@ class SnapshotManagerWindow(QMainWindow):
                 creds['password'].clear()
         self.active_credentials.clear()
         
+        # Drop the cached database encryption key
+        self.config_manager.clear_sensitive_data()
+        
         # Clear connections
         self.clear_connections()
     
@@ -1160,6 +1249,7 @@ class SnapshotManagerWindow(QMainWindow):
         self.auto_connect_worker = AutoConnectWorker(self.saved_servers, self.config_manager)
         self.auto_connect_worker.progress.connect(self.update_auto_connect_status)
         self.auto_connect_worker.connection_made.connect(self.handle_auto_connection)
+        self.auto_connect_worker.connection_latency.connect(self.record_connection_latency)
         self.auto_connect_worker.finished.connect(self.on_auto_connect_finished)
         self.auto_connect_worker.error.connect(self.on_auto_connect_error)
         self.auto_connect_worker.start()
@@ -1173,8 +1263,13 @@ class SnapshotManagerWindow(QMainWindow):
         with self.connections_lock:
             self.vcenter_connections[hostname] = si
             self.active_credentials[hostname] = credentials
+        self.track_connection(hostname, si)
         self.logger.info(f"Auto-connected to {hostname}")
     
+    def record_connection_latency(self, hostname, seconds):
+        """Remember how long the last login to a vCenter took"""
+        self.connection_latency[hostname] = seconds
+    
     def on_auto_connect_finished(self):
         """Handle auto-connect completion"""
         self.update_connection_status()
@@ -1192,103 +1287,48 @@ class SnapshotManagerWindow(QMainWindow):
 
 
     
-    def apply_filters(self):
+    def schedule_filters(self):
         """
-        Apply current filters to the snapshot tree.
-        This method is called whenever any filter changes.
-        """
-        # Check if tree exists (it might not during initialization)
-        if not hasattr(self, 'tree') or self.tree is None:
-            return
-            
-        root = self.tree.invisibleRootItem()
-        visible_count = 0
-        age_threshold = self.filter_panel.get_age_threshold()
-        patching_only = self.patch_filter_checkbox.isChecked()
+        Request a filter pass once filter changes settle.
         
-        for i in range(root.childCount()):
-            item = root.child(i)
-            snapshot_id = item.data(0, Qt.ItemDataRole.UserRole)
-            
-            if snapshot_id in self.snapshots:
-                snapshot_data = self.snapshots[snapshot_id]
-                
-                # Check if item matches filter panel filters
-                should_show = self.filter_panel.matches_filters(snapshot_data)
-                
-                # Apply patching filter if enabled
-                if should_show and patching_only:
-                    snapshot_name = snapshot_data.get('name', '').lower()
-                    should_show = 'patch' in snapshot_name
-                
-                item.setHidden(not should_show)
-                if should_show:
-                    visible_count += 1
-                
-                # Re-apply age-based highlighting when threshold changes
-                self.update_age_highlighting(item, snapshot_data, age_threshold)
-        
-        # Update counter to show filtered results
-        total_count = self.tree.topLevelItemCount()
-        if visible_count == total_count:
-            self.counter_label.setText(f"Snapshots: {total_count}")
-        else:
-            self.counter_label.setText(f"Snapshots: {visible_count} of {total_count} shown")
+        Each call restarts the debounce timer and abandons any pass still in progress.
+        """
+        # The runner might not exist yet during initialization
+        if hasattr(self, 'filter_runner'):
+            self.filter_runner.cancel()
+        self.filter_timer.start()
     
-    def update_age_highlighting(self, item, snapshot_data, age_threshold):
+    def apply_filters(self):
         """
-        Update age-based highlighting for a tree item.
-        
-        Args:
-            item: QTreeWidgetItem to update
-            snapshot_data: Dictionary containing snapshot information
-            age_threshold: Age threshold in business days
+        Apply current filters to the snapshot view.
+        This method runs once a burst of filter changes has settled.
         """
-        try:
-            created_date = datetime.strptime(snapshot_data['created'], '%Y-%m-%d %H:%M')
-            current_date = datetime.now()
-            
-            # Get day type from filter panel  
-            day_type = self.filter_panel.get_day_type()
-            
-            # Calculate days based on selected type
-            if day_type == "business days":
-                days_old = self.get_business_days(created_date, current_date)
-            else:  # calendar days
-                days_old = self.get_calendar_days(created_date, current_date)
-            
-            # Check if snapshot is part of a chain (already has different highlighting)
-            is_in_chain = snapshot_data.get('has_children', False) or snapshot_data.get('is_child', False)
-            
-            if days_old > age_threshold and not is_in_chain:
-                # Apply age highlighting
-                background_color = QColor(255, 255, 200)  # Light yellow
-                text_color = QColor(139, 69, 19)  # Saddle brown
-                
-                for column in range(8):
-                    item.setBackground(column, QBrush(background_color))
-                    item.setForeground(column, QBrush(text_color))
-                
-                age_text = f"Snapshot is {days_old} {day_type} old (threshold: {age_threshold} {day_type})"
-                item.setToolTip(0, age_text)
-            elif not is_in_chain:
-                # Remove age highlighting (but preserve chain highlighting if applicable)
-                for column in range(8):
-                    item.setBackground(column, QBrush())  # Clear background
-                    item.setForeground(column, QBrush())  # Clear foreground
-                
-                # Clear age-related tooltip
-                item.setToolTip(0, "")
-                
-        except (ValueError, KeyError):
-            # If date parsing fails, don't apply highlighting
-            pass
+        # Check if the model exists (it might not during initialization)
+        if not hasattr(self, 'filter_runner'):
+            return
+        
+        # Re-apply age-based highlighting only when the threshold or day type changes
+        age_threshold = self.filter_panel.get_age_threshold()
+        day_type = self.filter_panel.get_day_type()
+        if (age_threshold != self.snapshot_model.age_threshold
+                or day_type != self.snapshot_model.day_type):
+            self.snapshot_model.set_age_policy(age_threshold, day_type, self.calculate_ages)
+        
+        # Compile the filter state once and evaluate it over all snapshots
+        snapshot_filter = self.filter_panel.compile_filters(self.patch_filter_checkbox.isChecked())
+        self.filter_runner.start(snapshot_filter)
+        self.update_old_snapshots_label()
     
     def update_snapshot_counter(self):
         """
-        Update the snapshot counter label.
+        Update the snapshot counter label to show filtered results.
         """
-        self.counter_label.setText(f"Snapshots: {self.tree.topLevelItemCount()}")
+        total_count = self.snapshot_model.rowCount()
+        visible_count = self.snapshot_proxy.rowCount()
+        if visible_count == total_count:
+            self.counter_label.setText(f"Snapshots: {total_count}")
+        else:
+            self.counter_label.setText(f"Snapshots: {visible_count} of {total_count} shown")
     
     def clear_filters_on_refresh(self):
         """
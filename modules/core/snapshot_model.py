@@ -0,0 +1,668 @@
+"""
+Snapshot Table Model
+
+This module contains the model/view classes backing the snapshot list:
+a columnar QAbstractTableModel that computes colors and tooltips on demand,
+a QSortFilterProxyModel that shows the rows accepted by the active filter,
+and a runner that evaluates filters in chunks across event-loop iterations.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from functools import partial
+from PyQt6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel,
+                          QObject, QTimer, pyqtSignal)
+from PyQt6.QtGui import QColor, QBrush
+
+
+COLUMN_HEADERS = ["Select", "VM Name", "vCenter", "Snapshot Name", "Created",
+                  "Created By", "Description", "Snapshot Type"]
+
+CHECK_COLUMN = 0
+VM_NAME_COLUMN = 1
+CREATED_COLUMN = 4
+
+# Shared brushes - computed once instead of one QBrush per cell
+CHAIN_BACKGROUND = QBrush(QColor(211, 211, 211))  # Light gray
+CHAIN_FOREGROUND = QBrush(QColor(128, 128, 128))  # Gray text
+OLD_BACKGROUND = QBrush(QColor(255, 255, 200))  # Light yellow
+OLD_FOREGROUND = QBrush(QColor(139, 69, 19))  # Saddle brown (dark brown)
+
+# Number of rows evaluated per event-loop iteration by ChunkedFilterRunner
+FILTER_CHUNK_SIZE = 5000
+
+# Single-row removals absorbed before the ID lookup is renumbered in one pass
+REINDEX_THRESHOLD = 1024
+
+
+def chain_tooltip(has_children, is_child):
+    """Build the warning tooltip shown on chain snapshots"""
+    chain_status = []
+    if has_children:
+        chain_status.append("Has child snapshots")
+    if is_child:
+        chain_status.append("Is a child snapshot")
+
+    warning_text = "Cannot delete: " + " and ".join(chain_status)
+    warning_text += "\n\nChain snapshots must be deleted through vSphere Client because:"
+    warning_text += "\n• They have dependencies that require special handling"
+    warning_text += "\n• Improper deletion can corrupt VM data"
+    warning_text += "\n• VMware needs to consolidate disk changes properly"
+    return warning_text
+
+
+class SnapshotTableModel(QAbstractTableModel):
+    """
+    Columnar snapshot store exposed as a Qt table model.
+
+    Each displayed attribute is kept in its own list, indexed by row. Colors,
+    tooltips and check states are derived in data() for the requested role,
+    so no per-cell objects are created. A map from snapshot ID to row slot and
+    the set of checked IDs are maintained alongside. Removing a row leaves the
+    slots below it stale instead of renumbering them; a slot is turned into a
+    row by subtracting the removed slots before it, and the map is renumbered
+    in one pass every REINDEX_THRESHOLD removals.
+    """
+
+    # Emitted with the number of checked snapshots whenever a checkbox changes
+    checked_count_changed = pyqtSignal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._age_threshold = 3
+        self._day_type = "business days"
+        self._age_calculator = None
+        self._filter = None
+        # Incremented whenever existing rows are removed, shifting the rows after them
+        self._revision = 0
+        self._reset_columns()
+
+    def _reset_columns(self):
+        """Create empty column storage"""
+        self._ids = []
+        self._slot_by_id = {}
+        self._removed_slots = []  # Sorted slots removed since the last renumbering
+        self._records = []
+        self._columns = [[] for _ in COLUMN_HEADERS]
+        self._in_chain = []
+        self._created_dates = []
+        self._ages = []
+        self._is_old = []
+        self._checked = []
+        self._checked_ids = set()
+        self._visible = []
+
+    def _row_of(self, snapshot_id):
+        """Return the row of a snapshot ID, or None if it is not in the model"""
+        slot = self._slot_by_id.get(snapshot_id)
+        if slot is None or not self._removed_slots:
+            return slot
+        return slot - bisect_left(self._removed_slots, slot)
+
+    def _reindex(self):
+        """Renumber the slots left stale by single-row removals"""
+        if self._removed_slots:
+            first = self._removed_slots[0]
+            self._slot_by_id.update(zip(self._ids[first:], range(first, len(self._ids))))
+            self._removed_slots = []
+
+    def _row_stores(self):
+        """Return the per-row lists besides the displayed columns"""
+        return (self._ids, self._records, self._in_chain, self._created_dates,
+                self._ages, self._is_old, self._checked, self._visible)
+
+    # Qt model interface
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(COLUMN_HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return COLUMN_HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.ItemFlag.NoItemFlags
+        flags = Qt.ItemFlag.ItemIsEnabled
+        # Chain snapshots get no checkbox - they must be deleted through vSphere Client
+        if index.column() == CHECK_COLUMN and not self._in_chain[index.row()]:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        column = index.column()
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == CHECK_COLUMN:
+                return None
+            return self._columns[column][row]
+
+        if role == Qt.ItemDataRole.CheckStateRole:
+            if column == CHECK_COLUMN and not self._in_chain[row]:
+                return Qt.CheckState.Checked if self._checked[row] else Qt.CheckState.Unchecked
+            return None
+
+        if role == Qt.ItemDataRole.BackgroundRole:
+            # Chain highlighting takes precedence over age highlighting
+            if self._in_chain[row]:
+                return CHAIN_BACKGROUND
+            if self._is_old[row]:
+                return OLD_BACKGROUND
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if self._in_chain[row]:
+                return CHAIN_FOREGROUND
+            if self._is_old[row]:
+                return OLD_FOREGROUND
+            return None
+
+        if role == Qt.ItemDataRole.ToolTipRole and column == CHECK_COLUMN:
+            record = self._records[row]
+            if self._in_chain[row]:
+                return chain_tooltip(record.has_children, record.is_child)
+            if self._is_old[row]:
+                return (f"Snapshot is {self._ages[row]} {self._day_type} old "
+                        f"(threshold: {self._age_threshold} {self._day_type})")
+            return None
+
+        return None
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (role != Qt.ItemDataRole.CheckStateRole or not index.isValid()
+                or index.column() != CHECK_COLUMN or self._in_chain[index.row()]):
+            return False
+
+        row = index.row()
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self._checked[row] = checked
+        if checked:
+            self._checked_ids.add(self._ids[row])
+        else:
+            self._checked_ids.discard(self._ids[row])
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+        self.checked_count_changed.emit(self.checked_count())
+        return True
+
+    # Snapshot store interface
+    def add_snapshots(self, snapshots):
+        """
+        Add snapshots to the model, appending new rows in a single insert operation.
+
+        A snapshot whose ID is already in the model replaces the existing row
+        instead of adding a duplicate. Replaced rows are updated together, with
+        one dataChanged per run of adjacent rows.
+
+        Args:
+            snapshots (list): (snapshot_id, SnapshotRecord) tuples
+
+        Returns:
+            list: Snapshot records that were replaced (or superseded within the batch)
+        """
+        replaced = []
+        if not snapshots:
+            return replaced
+
+        now = datetime.now()
+        new_snapshots = {}
+        replacements = {}  # row -> SnapshotRecord
+        for snapshot_id, data in snapshots:
+            row = self._row_of(snapshot_id)
+            if row is None:
+                # Later repeats within the same batch replace earlier ones
+                if snapshot_id in new_snapshots:
+                    replaced.append(new_snapshots[snapshot_id])
+                new_snapshots[snapshot_id] = data
+            else:
+                replaced.append(replacements.get(row, self._records[row]))
+                replacements[row] = data
+
+        if replacements:
+            self._replace_rows(replacements, now)
+
+        if not new_snapshots:
+            return replaced
+
+        # Evaluate the active filter for the whole batch in one pass
+        new_records = list(new_snapshots.values())
+        new_visible = self._evaluate_filter(new_records)
+
+        # Parse dates once and compute ages for the whole batch in one call
+        new_dates = [data.created_datetime for data in new_records]
+        new_ages = self._calculate_ages(new_dates, now)
+
+        first = len(self._ids)
+        self.beginInsertRows(QModelIndex(), first, first + len(new_snapshots) - 1)
+        for snapshot_id, data in new_snapshots.items():
+            self._slot_by_id[snapshot_id] = len(self._ids) + len(self._removed_slots)
+            self._ids.append(snapshot_id)
+            for column, value in zip(self._columns, self._column_values(data)):
+                column.append(value)
+
+            self._records.append(data)
+            self._in_chain.append(data.is_in_chain)
+            self._checked.append(False)
+        self._created_dates.extend(new_dates)
+        self._ages.extend(new_ages)
+        self._is_old.extend(self._old_flags(new_ages))
+        self._visible.extend(new_visible)
+        self.endInsertRows()
+        return replaced
+
+    def _replace_rows(self, replacements, now):
+        """
+        Overwrite existing rows with fresh snapshot data.
+
+        Rows whose record is unchanged are skipped. Changed rows are reported
+        with one dataChanged per run of adjacent rows, spanning only the
+        columns that changed, so the proxy re-sorts only when a sort key may
+        have moved. Row positions do not change, so the revision is left
+        alone; filter passes in progress re-evaluate the rows through
+        dataChanged.
+
+        Args:
+            replacements (dict): Row -> SnapshotRecord
+            now (datetime): Time the ages are computed against
+        """
+        rows = sorted(row for row, data in replacements.items() if data != self._records[row])
+        if not rows:
+            return
+        records = [replacements[row] for row in rows]
+        created_dates = [data.created_datetime for data in records]
+        ages = self._calculate_ages(created_dates, now)
+        visible = self._evaluate_filter(records)
+
+        unchecked = False
+        spans = []  # First and last changed column of each row
+        for row, data, created_date, age, row_visible in zip(rows, records, created_dates, ages, visible):
+            values = self._column_values(data)
+            changed = [column for column, value in enumerate(values) if self._columns[column][row] != value]
+            for column in changed:
+                self._columns[column][row] = values[column]
+
+            in_chain = data.is_in_chain
+            is_old = age is not None and age > self._age_threshold
+            whole_row = (in_chain, is_old) != (self._in_chain[row], self._is_old[row])
+            self._records[row] = data
+            self._in_chain[row] = in_chain
+            self._created_dates[row] = created_date
+            self._ages[row] = age
+            self._is_old[row] = is_old
+            self._visible[row] = row_visible
+            if in_chain and self._checked[row]:
+                # Chain snapshots cannot stay selected for deletion
+                self._checked[row] = False
+                self._checked_ids.discard(self._ids[row])
+                unchecked = whole_row = True
+
+            if whole_row:
+                spans.append((0, len(COLUMN_HEADERS) - 1))  # Colors and check state span the row
+            elif changed:
+                spans.append((changed[0], changed[-1]))
+            else:
+                spans.append((CHECK_COLUMN, CHECK_COLUMN))  # Only hidden fields; still refilter the row
+
+        # One notification per run of adjacent rows
+        start = 0
+        for end in range(1, len(rows) + 1):
+            if end == len(rows) or rows[end] != rows[end - 1] + 1:
+                run = spans[start:end]
+                self.dataChanged.emit(self.index(rows[start], min(first for first, last in run)),
+                                      self.index(rows[end - 1], max(last for first, last in run)))
+                start = end
+
+        if unchecked:
+            self.checked_count_changed.emit(self.checked_count())
+
+    @staticmethod
+    def _column_values(data):
+        """Return the displayed column values for a snapshot record"""
+        return (
+            None,
+            data.vm_name,
+            data.vcenter,
+            data.name,
+            data.created,
+            data.created_by,
+            data.description,
+            data.snapshot_type
+        )
+
+    def remove_snapshot(self, snapshot_id):
+        """
+        Remove a snapshot's row from the model.
+
+        The rows below move up one place, as for any row removal, so
+        persistent indexes (current index, selection, editors) keep pointing
+        at the same snapshots. The lookup entries of the moved rows are
+        renumbered later, in bulk.
+
+        Args:
+            snapshot_id: ID the snapshot was added with
+
+        Returns:
+            bool: True if the snapshot was found and removed
+        """
+        row = self._row_of(snapshot_id)
+        if row is None:
+            return False
+
+        self._revision += 1
+        was_checked = snapshot_id in self._checked_ids
+        self._checked_ids.discard(snapshot_id)
+
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for store in (*self._columns, *self._row_stores()):
+            del store[row]
+        insort(self._removed_slots, self._slot_by_id.pop(snapshot_id))
+        if len(self._removed_slots) >= REINDEX_THRESHOLD:
+            self._reindex()
+        self.endRemoveRows()
+
+        if was_checked:
+            self.checked_count_changed.emit(self.checked_count())
+        return True
+
+    def remove_snapshots(self, snapshot_ids):
+        """
+        Remove many snapshots, one contiguous block of rows at a time.
+
+        Suited to bulk removal: the cost is one pass over the rows after the
+        first removed one, however many rows go.
+
+        Args:
+            snapshot_ids (iterable): IDs the snapshots were added with
+
+        Returns:
+            list: Snapshot records that were removed
+        """
+        self._reindex()
+        rows = sorted({self._slot_by_id[i] for i in snapshot_ids if i in self._slot_by_id}, reverse=True)
+        if not rows:
+            return []
+
+        removed = [self._records[row] for row in rows]
+        removed_ids = {self._ids[row] for row in rows}
+        was_checked = not self._checked_ids.isdisjoint(removed_ids)
+        self._checked_ids -= removed_ids
+        self._revision += 1
+
+        # Walk runs of adjacent rows from the bottom so earlier row numbers stay valid
+        index = 0
+        while index < len(rows):
+            last = rows[index]
+            first = last
+            while index + 1 < len(rows) and rows[index + 1] == first - 1:
+                index += 1
+                first -= 1
+            index += 1
+
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for snapshot_id in self._ids[first:last + 1]:
+                del self._slot_by_id[snapshot_id]
+            for store in (*self._columns, *self._row_stores()):
+                del store[first:last + 1]
+            self.endRemoveRows()
+
+        # Renumber the rows that moved up
+        for moved_row in range(rows[-1], len(self._ids)):
+            self._slot_by_id[self._ids[moved_row]] = moved_row
+
+        if was_checked:
+            self.checked_count_changed.emit(self.checked_count())
+        return removed
+
+    def clear(self):
+        """Remove all snapshots from the model"""
+        self._revision += 1
+        self.beginResetModel()
+        self._reset_columns()
+        self.endResetModel()
+        self.checked_count_changed.emit(0)
+
+    def snapshot_data(self, row):
+        """Return the snapshot record stored at a model row"""
+        return self._records[row]
+
+    def snapshot_records(self, start, end):
+        """Return the snapshot records for rows start..end-1"""
+        return self._records[start:end]
+
+    @property
+    def revision(self):
+        """Counter that changes whenever existing rows are removed"""
+        return self._revision
+
+    def snapshot_id(self, row):
+        """Return the snapshot ID stored at a model row"""
+        return self._ids[row]
+
+    def all_snapshots(self):
+        """Return every snapshot record in the model"""
+        return list(self._records)
+
+    def get_snapshot(self, snapshot_id):
+        """Return the snapshot record for an ID, or None if it is not in the model"""
+        row = self._row_of(snapshot_id)
+        return None if row is None else self._records[row]
+
+    def vcenter_snapshots(self, vcenter):
+        """Return (snapshot_id, SnapshotRecord) pairs for every snapshot of a vCenter"""
+        return [(snapshot_id, data) for snapshot_id, data in zip(self._ids, self._records)
+                if data.vcenter == vcenter]
+
+    def contains(self, snapshot_id):
+        """Return True if a snapshot with this ID is in the model"""
+        return snapshot_id in self._slot_by_id
+
+    @property
+    def age_threshold(self):
+        """Age threshold currently used for highlighting"""
+        return self._age_threshold
+
+    @property
+    def day_type(self):
+        """Day type currently used for snapshot ages"""
+        return self._day_type
+
+    def checked_count(self):
+        """Return the number of checked snapshots"""
+        return len(self._checked_ids)
+
+    def checked_snapshots(self):
+        """
+        Return the checked snapshots.
+
+        Returns:
+            list: (snapshot_id, SnapshotRecord) tuples
+        """
+        rows = sorted(self._row_of(snapshot_id) for snapshot_id in self._checked_ids)
+        return [(self._ids[row], self._records[row]) for row in rows]
+
+    # Filtering
+    def set_filter(self, snapshot_filter, visible=None):
+        """
+        Evaluate a filter against every row and remember it for rows added later.
+
+        Args:
+            snapshot_filter: Object with matches(SnapshotRecord) -> bool and
+                evaluate(records) -> list of bool, or None to show everything
+            visible (list): Results already computed for the leading rows, if any
+        """
+        self._filter = snapshot_filter
+        visible = list(visible or [])[:len(self._records)]
+        visible.extend(self._evaluate_filter(self._records[len(visible):]))
+        self._visible = visible
+
+    def _evaluate_filter(self, records):
+        """Return the visibility of each record under the active filter"""
+        if self._filter is None:
+            return [True] * len(records)
+        return self._filter.evaluate(records)
+
+    def is_visible(self, row):
+        """Return True if the row passes the active filter"""
+        return self._visible[row]
+
+    # Age highlighting
+    def set_age_policy(self, age_threshold, day_type, age_calculator):
+        """
+        Recompute snapshot ages and age highlighting for all rows.
+
+        Args:
+            age_threshold (int): Snapshots older than this are highlighted
+            day_type (str): "business days" or "calendar days"
+            age_calculator: Callable (created_dates, current_date, day_type) -> list
+                returning one age per date (None for dates that are None)
+        """
+        self._age_threshold = age_threshold
+        self._day_type = day_type
+        self._age_calculator = age_calculator
+
+        now = datetime.now()
+        self._ages = self._calculate_ages(self._created_dates, now)
+        self._is_old = self._old_flags(self._ages)
+
+        if self._ids:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._ids) - 1, len(COLUMN_HEADERS) - 1),
+                [Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole,
+                 Qt.ItemDataRole.ToolTipRole]
+            )
+
+    def _calculate_ages(self, created_dates, now):
+        """Return the ages of snapshots in the configured day type (None where unknown)"""
+        if self._age_calculator is None:
+            return [None] * len(created_dates)
+        return self._age_calculator(created_dates, now, self._day_type)
+
+    def _old_flags(self, ages):
+        """Return whether each age exceeds the threshold"""
+        threshold = self._age_threshold
+        return [age is not None and age > threshold for age in ages]
+
+
+
+class SnapshotFilterProxyModel(QSortFilterProxyModel):
+    """Sort/filter proxy that hides snapshots rejected by the active filter function"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setDynamicSortFilter(True)
+
+    def set_filter(self, snapshot_filter, visible=None):
+        """
+        Set the filter deciding which snapshots are visible.
+
+        The filter is evaluated once over the whole source model; the proxy
+        then only looks up the precomputed result for each row.
+
+        Args:
+            snapshot_filter: Object with matches() and evaluate() (see
+                SnapshotTableModel.set_filter), or None to show everything
+            visible (list): Results already computed for the leading rows, if any
+        """
+        self.sourceModel().set_filter(snapshot_filter, visible)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        return self.sourceModel().is_visible(source_row)
+
+
+class ChunkedFilterRunner(QObject):
+    """
+    Applies filters to a SnapshotFilterProxyModel without blocking the UI.
+
+    Small models are filtered immediately. Larger ones are evaluated
+    chunk_size rows per event-loop iteration and the result is installed
+    in the proxy once complete. Starting a new pass (or cancelling) makes
+    any pass still in progress stop at its next chunk.
+    """
+
+    # Emitted when a filter pass has been applied to the proxy
+    finished = pyqtSignal()
+
+    def __init__(self, proxy, chunk_size=FILTER_CHUNK_SIZE, parent=None):
+        super().__init__(parent)
+        self.proxy = proxy
+        self.chunk_size = chunk_size
+        self._generation = 0
+        self._filter = None
+        self._visible = []
+        self._revision = None
+        self._running = False
+        proxy.sourceModel().dataChanged.connect(self._rows_changed)
+
+    @property
+    def is_running(self):
+        """True while a chunked pass is in progress"""
+        return self._running
+
+    def start(self, snapshot_filter):
+        """
+        Start filtering with a new filter, superseding any pass in progress.
+
+        Args:
+            snapshot_filter: Filter object accepted by SnapshotFilterProxyModel.set_filter
+        """
+        self._generation += 1
+        model = self.proxy.sourceModel()
+
+        if snapshot_filter is None or model.rowCount() <= self.chunk_size:
+            self._running = False
+            self.proxy.set_filter(snapshot_filter)
+            self.finished.emit()
+            return
+
+        self._filter = snapshot_filter
+        self._visible = []
+        self._revision = model.revision
+        self._running = True
+        QTimer.singleShot(0, partial(self._run_chunk, self._generation))
+
+    def cancel(self):
+        """Abandon the pass in progress, leaving the current filter in place"""
+        self._generation += 1
+        self._running = False
+
+    def _run_chunk(self, generation):
+        """Evaluate the next chunk of rows, or install the result when done"""
+        if generation != self._generation:
+            return  # Superseded by a newer pass
+
+        model = self.proxy.sourceModel()
+        if model.revision != self._revision:
+            # Rows were removed - results so far may be misaligned
+            self._visible = []
+            self._revision = model.revision
+
+        start = len(self._visible)
+        if start < model.rowCount():
+            self._visible.extend(self._filter.evaluate(model.snapshot_records(start, start + self.chunk_size)))
+
+        if len(self._visible) >= model.rowCount():
+            self._running = False
+            self.proxy.set_filter(self._filter, self._visible)
+            self.finished.emit()
+        else:
+            QTimer.singleShot(0, partial(self._run_chunk, generation))
+
+    def _rows_changed(self, top_left, bottom_right, roles=()):
+        """Re-evaluate replaced rows that the pass in progress has already covered"""
+        if not self._running or roles:
+            return  # Only whole-row replacements are reported without roles
+        first, last = top_left.row(), min(bottom_right.row(), len(self._visible) - 1)
+        if first <= last:
+            records = self.proxy.sourceModel().snapshot_records(first, last + 1)
+            self._visible[first:last + 1] = self._filter.evaluate(records)
@@ -0,0 +1,144 @@
+"""
+Snapshot Record
+
+This module contains the compact, immutable record describing one snapshot.
+It is produced by the fetch and create workers and consumed by the table
+model, the filters and the delete worker, so creation times are parsed once
+and managed objects are referenced only by their MoRef IDs.
+"""
+
+from datetime import datetime, timezone
+from typing import NamedTuple
+from pyVmomi import vim
+
+from .utilities import format_vmware_time
+
+
+def snapshot_type_label(has_children, is_child):
+    """
+    Classify a snapshot by its position in the snapshot chain.
+
+    Args:
+        has_children (bool): Snapshot has child snapshots
+        is_child (bool): Snapshot has a parent snapshot
+
+    Returns:
+        str: Snapshot type as shown in the Snapshot Type column
+    """
+    if has_children and is_child:
+        return "Part of Chain (Middle)"
+    elif has_children:
+        return "Has Child Snapshots (Delete Manually)"
+    elif is_child:
+        return "Child Snapshot"
+    return "Independent Snapshot"
+
+
+class SnapshotRecord(NamedTuple):
+    """One snapshot as shown in the snapshot list"""
+    vcenter: str
+    vm_name: str
+    name: str
+    created_ts: float  # Creation time as a POSIX timestamp
+    created: str  # Creation time in local time, 'YYYY-MM-DD HH:MM'
+    created_by: str = 'Unknown'
+    description: str = ''
+    has_children: bool = False
+    is_child: bool = False
+    vm_moref: str = ''
+    snapshot_moref: str = ''
+
+    @classmethod
+    def from_snapshot_tree(cls, vcenter, vm_moref, vm_name, snapshot, is_child, created_by):
+        """
+        Build a record from a VirtualMachineSnapshotTree node.
+
+        Args:
+            vcenter (str): vCenter hostname the snapshot was read from
+            vm_moref (str): MoRef ID of the VM owning the snapshot
+            vm_name (str): Display name of the VM
+            snapshot: vim.vm.SnapshotTree node
+            is_child (bool): Node has a parent snapshot
+            created_by (str): Creator parsed from the description
+
+        Returns:
+            SnapshotRecord: Record for the snapshot
+        """
+        create_time = snapshot.createTime
+        if create_time.tzinfo is None:
+            # VMware createTime is UTC
+            create_time = create_time.replace(tzinfo=timezone.utc)
+
+        return cls(
+            vcenter=vcenter,
+            vm_name=vm_name,
+            name=snapshot.name,
+            created_ts=create_time.timestamp(),
+            created=format_vmware_time(create_time),
+            created_by=created_by,
+            description=snapshot.description or '',
+            has_children=bool(snapshot.childSnapshotList),
+            is_child=is_child,
+            vm_moref=vm_moref,
+            snapshot_moref=snapshot.snapshot._moId
+        )
+
+    @property
+    def key(self):
+        """Identity of the snapshot: (vCenter, snapshot MoRef ID), unique even for repeated names"""
+        return (self.vcenter, self.snapshot_moref)
+
+    @property
+    def created_datetime(self):
+        """Creation time as a naive local datetime"""
+        return datetime.fromtimestamp(self.created_ts)
+
+    @property
+    def is_in_chain(self):
+        """True if the snapshot has a parent or children"""
+        return self.has_children or self.is_child
+
+    @property
+    def snapshot_type(self):
+        """Snapshot type as shown in the Snapshot Type column"""
+        return snapshot_type_label(self.has_children, self.is_child)
+
+    def snapshot_ref(self, si):
+        """
+        Return a managed object reference to the snapshot.
+
+        Args:
+            si: vim.ServiceInstance for the snapshot's vCenter
+
+        Returns:
+            vim.vm.Snapshot: Snapshot bound to the connection's stub
+        """
+        return vim.vm.Snapshot(self.snapshot_moref, si._stub)
+
+    def vm_ref(self, si):
+        """
+        Return a managed object reference to the snapshot's VM.
+
+        Args:
+            si: vim.ServiceInstance for the snapshot's vCenter
+
+        Returns:
+            vim.VirtualMachine: VM bound to the connection's stub
+        """
+        return vim.VirtualMachine(self.vm_moref, si._stub)
+
+
+def walk_snapshot_tree(snapshots, parent=None):
+    """
+    Traverse a snapshot tree depth-first.
+
+    Args:
+        snapshots (list): vim.vm.SnapshotTree nodes
+        parent: Parent node of the given snapshots, or None for root snapshots
+
+    Yields:
+        tuple: (snapshot tree node, parent node or None for root snapshots)
+    """
+    for snapshot in snapshots:
+        yield snapshot, parent
+        yield from walk_snapshot_tree(snapshot.childSnapshotList, snapshot)
@@ -0,0 +1,251 @@
+"""
+Task Monitor
+
+This module contains an event-driven monitor for vSphere tasks. Instead of
+polling task.info for every outstanding task, it creates one private
+PropertyCollector per vCenter, registers a filter on each task's state and
+progress, and blocks in WaitForUpdatesEx. Changes are delivered through a
+thread-safe queue as soon as vCenter reports them.
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, NamedTuple
+from pyVmomi import vim, vmodl
+
+
+# Longest time a WaitForUpdatesEx call blocks before returning empty
+DEFAULT_WAIT_SECONDS = 30
+
+# Task properties tracked for every watched task
+TASK_PROPERTIES = ['info.state', 'info.progress', 'info.error', 'info.result']
+
+
+class TaskEvent(NamedTuple):
+    """Change in a watched task's state or progress"""
+    task: Any  # vim.Task
+    context: Any  # Caller-supplied value passed to TaskMonitor.watch()
+    state: str  # vim.TaskInfo.State value
+    progress: int  # Percent complete (0 when unknown)
+    error: str = ''  # Error message for failed tasks
+    result: Any = None  # info.result for successful tasks
+
+    @property
+    def is_done(self):
+        """True once the task has succeeded or failed"""
+        return self.state in (vim.TaskInfo.State.success, vim.TaskInfo.State.error)
+
+
+class TaskMonitor:
+    """
+    Watches vSphere tasks across vCenters with one long-poll per vCenter.
+
+    Usage:
+        monitor = TaskMonitor()
+        monitor.watch(hostname, si, task, context)
+        event = monitor.next_event()  # TaskEvent
+        monitor.stop()
+    """
+
+    def __init__(self, wait_seconds=DEFAULT_WAIT_SECONDS):
+        self.wait_seconds = wait_seconds
+        self.events = queue.Queue()
+        self._watchers = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger('pySnap')
+
+    def watch(self, vcenter, si, task, context=None):
+        """
+        Start watching a task.
+
+        A vCenter whose long-poll has failed gets a new watcher, so tasks are
+        never handed to a collector that is no longer polled.
+
+        Args:
+            vcenter (str): vCenter hostname the task runs on
+            si: vim.ServiceInstance for the vCenter
+            task: vim.Task to watch
+            context: Value returned with every event for this task
+        """
+        while True:
+            with self._lock:
+                watcher = self._watchers.get(vcenter)
+                if watcher is None or watcher.closed:
+                    watcher = _VCenterTaskWatcher(vcenter, si, self.events, self.wait_seconds,
+                                                  self._remove_watcher)
+                    self._watchers[vcenter] = watcher
+                    watcher.start()
+            if watcher.add(task, context):
+                return
+            # The watcher failed while the task was being registered; use a new one
+
+    def _remove_watcher(self, watcher):
+        """Forget a watcher whose long-poll has ended"""
+        with self._lock:
+            if self._watchers.get(watcher.vcenter) is watcher:
+                del self._watchers[watcher.vcenter]
+
+    def next_event(self, timeout=None):
+        """
+        Wait for the next task event.
+
+        Args:
+            timeout (float): Seconds to wait, or None to wait indefinitely
+
+        Returns:
+            TaskEvent: Next event, or None if the timeout expired
+        """
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self):
+        """Stop all long-polls and destroy their property collectors"""
+        with self._lock:
+            watchers, self._watchers = list(self._watchers.values()), {}
+        for watcher in watchers:
+            watcher.stop()
+        for watcher in watchers:
+            watcher.join()
+
+
+class _VCenterTaskWatcher(threading.Thread):
+    """Long-polls one vCenter's private PropertyCollector for task changes"""
+
+    def __init__(self, vcenter, si, events, wait_seconds, on_exit):
+        super().__init__(name=f'pysnap-tasks-{vcenter}', daemon=True)
+        self.vcenter = vcenter
+        self.si = si
+        self.events = events
+        self.wait_seconds = wait_seconds
+        self.on_exit = on_exit
+        self.logger = logging.getLogger('pySnap')
+
+        # A private collector keeps our filters and update versions isolated
+        self.property_collector = si.content.propertyCollector.CreatePropertyCollector()
+        self.lock = threading.Lock()
+        self.tasks = {}  # task MoRef ID -> [task, context, filter, state, progress]
+        self.stopped = threading.Event()
+        self.closed = False  # Set once the long-poll has ended; no tasks are accepted after
+
+    def add(self, task, context):
+        """
+        Register a filter for a task's properties.
+
+        Returns:
+            bool: False if the long-poll ended before the task was registered
+        """
+        filter_spec = vmodl.query.PropertyCollector.FilterSpec(
+            objectSet=[vmodl.query.PropertyCollector.ObjectSpec(obj=task)],
+            propSet=[vmodl.query.PropertyCollector.PropertySpec(
+                type=vim.Task, pathSet=TASK_PROPERTIES, all=False
+            )]
+        )
+        # Register before creating the filter so the first update always finds the task
+        with self.lock:
+            if self.closed:
+                return False
+            self.tasks[task._moId] = [task, context, None, None, 0]
+        try:
+            property_filter = self.property_collector.CreateFilter(filter_spec, partialUpdates=False)
+        except Exception:
+            with self.lock:
+                self.tasks.pop(task._moId, None)
+                if self.closed:
+                    return False  # The collector was destroyed under us
+            raise
+
+        with self.lock:
+            entry = self.tasks.get(task._moId)
+            if entry is not None and not self.closed:
+                entry[2] = property_filter
+                return True
+            if entry is not None:
+                del self.tasks[task._moId]
+        self.destroy_filter(property_filter)
+        # Otherwise the task already completed while the filter was being created
+        return entry is None
+
+    def stop(self):
+        """Ask the long-poll to return and the thread to exit"""
+        self.stopped.set()
+        try:
+            self.property_collector.CancelWaitForUpdates()
+        except Exception:
+            pass  # Nothing is waiting, or the session is gone
+
+    def run(self):
+        version = ''
+        options = vmodl.query.PropertyCollector.WaitOptions(maxWaitSeconds=self.wait_seconds)
+        error = ''
+        try:
+            while not self.stopped.is_set():
+                update_set = self.property_collector.WaitForUpdatesEx(version, options)
+                if update_set is None:
+                    continue  # Timed out with no changes
+                version = update_set.version
+                for filter_update in update_set.filterSet or []:
+                    for object_update in filter_update.objectSet or []:
+                        self.apply_update(object_update)
+        except Exception as e:
+            if not self.stopped.is_set():
+                self.logger.error(f"Task monitoring failed on {self.vcenter}: {str(e)}")
+                error = str(e)
+        finally:
+            self.close(error)
+            self.on_exit(self)
+            try:
+                self.property_collector.DestroyPropertyCollector()
+            except Exception:
+                pass
+
+    def apply_update(self, object_update):
+        """Merge property changes for one task and publish an event"""
+        with self.lock:
+            entry = self.tasks.get(object_update.obj._moId)
+        if entry is None:
+            return
+
+        values = {change.name: change.val for change in object_update.changeSet or []}
+        task, context, property_filter, state, progress = entry
+        state = values.get('info.state', state)
+        progress = values.get('info.progress', progress) or 0
+        entry[3], entry[4] = state, progress
+
+        error = ''
+        if state == vim.TaskInfo.State.error:
+            fault = values.get('info.error')
+            error = getattr(fault, 'msg', None) or str(fault or 'Unknown error')
+
+        event = TaskEvent(task, context, state, progress, error, values.get('info.result'))
+        if event.is_done:
+            with self.lock:
+                self.tasks.pop(task._moId, None)
+            if property_filter is not None:
+                self.destroy_filter(property_filter)
+        self.events.put(event)
+
+    def close(self, message):
+        """
+        Stop accepting tasks and, if the long-poll failed, report every watched task as failed.
+
+        Tasks still being added are left to add(), which hands them to a new watcher.
+        """
+        with self.lock:
+            self.closed = True
+            entries = [entry for entry in self.tasks.values() if entry[2] is not None]
+            self.tasks = {moref: entry for moref, entry in self.tasks.items() if entry[2] is None}
+        if not message:
+            return
+        for task, context, property_filter, state, progress in entries:
+            self.events.put(TaskEvent(task, context, vim.TaskInfo.State.error, progress,
+                                      f"Lost track of task: {message}"))
+
+    def destroy_filter(self, property_filter):
+        """Remove a task's filter, ignoring failures (the collector may be gone)"""
+        try:
+            property_filter.DestroyPropertyFilter()
+        except Exception:
+            pass
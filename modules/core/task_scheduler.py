@@ -0,0 +1,183 @@
+"""
+Task Scheduler
+
+This module contains a sliding-window scheduler for vSphere tasks. Each work
+item declares the resources it uses (its vCenter, cluster, host, datastores);
+an item is started as soon as every one of those resources has a free slot,
+so finishing one task immediately makes room for the next instead of waiting
+for a whole batch.
+"""
+
+from collections import defaultdict
+
+
+class ConcurrencyScheduler:
+    """
+    Tracks in-flight work per resource and hands out items that fit the limits.
+
+    Resources are (scope, key) tuples such as ('datastore', 'vc1:datastore-12').
+    Limits are set per scope and can be overridden per resource. A limit of
+    None or 0 means unlimited. The scheduler does no I/O and is not thread-safe;
+    it is driven from a single worker thread.
+    """
+
+    def __init__(self, limits=None):
+        """
+        Create a scheduler.
+
+        Args:
+            limits (dict): Scope -> maximum in-flight items per resource of that scope
+        """
+        self.limits = dict(limits or {})
+        self.resource_limits = {}  # (scope, key) -> limit overriding the scope limit
+        self.in_flight = defaultdict(int)  # (scope, key) -> running items
+        self.pending = []  # [(item, resources)] in submission order
+        self.running = {}  # id(item) -> resources
+
+    def add(self, item, resources):
+        """
+        Queue a work item.
+
+        Args:
+            item: Work item returned by take_ready() when it may start
+            resources (iterable): (scope, key) tuples the item occupies while running
+        """
+        self.pending.append((item, tuple(resources)))
+
+    def limit_for(self, resource):
+        """Return the in-flight limit for a resource (None for unlimited)"""
+        if resource in self.resource_limits:
+            return self.resource_limits[resource]
+        return self.limits.get(resource[0])
+
+    def set_resource_limit(self, resource, limit):
+        """Override the in-flight limit for a single resource"""
+        self.resource_limits[resource] = limit
+
+    def has_capacity(self, resources):
+        """Return True if every resource has a free slot"""
+        for resource in resources:
+            limit = self.limit_for(resource)
+            if limit and self.in_flight[resource] >= limit:
+                return False
+        return True
+
+    def take_ready(self):
+        """
+        Remove and return every pending item that can start now, in submission order.
+
+        Items blocked on a busy resource are skipped, so they never hold up
+        items that only use idle resources.
+
+        Returns:
+            list: Items to start; each must later be passed to release()
+        """
+        ready = []
+        still_pending = []
+        for item, resources in self.pending:
+            if self.has_capacity(resources):
+                for resource in resources:
+                    self.in_flight[resource] += 1
+                self.running[id(item)] = resources
+                ready.append(item)
+            else:
+                still_pending.append((item, resources))
+        self.pending = still_pending
+        return ready
+
+    def release(self, item):
+        """
+        Mark a started item as finished, freeing its resource slots.
+
+        Returns:
+            tuple: Resources the item was holding
+        """
+        resources = self.running.pop(id(item), ())
+        for resource in resources:
+            self.in_flight[resource] -= 1
+            if not self.in_flight[resource]:
+                del self.in_flight[resource]
+        return resources
+
+    @property
+    def pending_count(self):
+        """Number of items waiting to start"""
+        return len(self.pending)
+
+    @property
+    def running_count(self):
+        """Number of items started and not yet released"""
+        return len(self.running)
+
+    def has_work(self):
+        """True while any item is pending or running"""
+        return bool(self.pending or self.running)
+
+
+class AdaptiveLimiter:
+    """
+    Adjusts per-resource limits of a ConcurrencyScheduler from task durations.
+
+    Each resource keeps an exponentially weighted moving average (EWMA) of
+    its task durations and remembers the lowest average seen as its healthy
+    baseline. Once per window of completions (as many as the current limit),
+    the limit grows by one while durations stay near the baseline (additive
+    increase) and is halved when they exceed slowdown_factor times the
+    baseline (multiplicative decrease).
+    """
+
+    def __init__(self, scheduler, initial_limit, max_limit, min_limit=1, alpha=0.3, slowdown_factor=2.0):
+        """
+        Create a limiter.
+
+        Args:
+            scheduler (ConcurrencyScheduler): Scheduler whose resource limits are adjusted
+            initial_limit (int): Limit used for a resource before any task finishes
+            max_limit (int): Upper bound for additive increase
+            min_limit (int): Lower bound for multiplicative decrease
+            alpha (float): EWMA weight of the newest duration
+            slowdown_factor (float): Average/baseline ratio treated as congestion
+        """
+        self.scheduler = scheduler
+        self.initial_limit = initial_limit
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.alpha = alpha
+        self.slowdown_factor = slowdown_factor
+        self.averages = {}  # resource -> EWMA duration
+        self.baselines = {}  # resource -> lowest EWMA duration seen
+        self.completions = defaultdict(int)  # resource -> completions since last adjustment
+
+    def limit_for(self, resource):
+        """Return the current limit for a resource"""
+        limit = self.scheduler.resource_limits.get(resource)
+        return self.initial_limit if limit is None else limit
+
+    def record(self, resource, duration):
+        """
+        Record a finished task's duration and adjust the resource's limit.
+
+        Args:
+            resource (tuple): (scope, key) the task occupied
+            duration (float): Task duration in seconds
+
+        Returns:
+            int: The resource's limit after the update
+        """
+        average = self.averages.get(resource)
+        average = duration if average is None else self.alpha * duration + (1 - self.alpha) * average
+        self.averages[resource] = average
+        baseline = self.baselines[resource] = min(self.baselines.get(resource, average), average)
+
+        limit = self.limit_for(resource)
+        self.completions[resource] += 1
+        if self.completions[resource] < limit:
+            return limit  # Wait for a full window before adjusting again
+        self.completions[resource] = 0
+
+        if average > self.slowdown_factor * baseline:
+            limit = max(self.min_limit, limit // 2)
+        else:
+            limit = min(self.max_limit, limit + 1)
+        self.scheduler.set_resource_limit(resource, limit)
+        return limit
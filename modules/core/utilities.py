@@ -4,7 +4,10 @@ Utility Functions
 This module contains utility functions used throughout the application.
 """
 
-from datetime import timezone
+import os
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
 
 
 def format_vmware_time(vmware_datetime):
@@ -26,4 +29,155 @@ def format_vmware_time(vmware_datetime):
     local_time = vmware_datetime.astimezone()
     
     # Format as string
-    return local_time.strftime('%Y-%m-%d %H:%M')
\ No newline at end of file
+    return local_time.strftime('%Y-%m-%d %H:%M')
+
+
+class HolidayCalendar:
+    """
+    Set of non-working days excluded from business-day counts.
+    
+    Only holidays falling on weekdays are kept (weekends are never business
+    days anyway), stored as sorted date ordinals so the number of holidays in
+    any range is two binary searches.
+    """
+    
+    # DTSTART;VALUE=DATE:20241225 or DTSTART:20241225T000000Z
+    ICS_DTSTART_PATTERN = re.compile(r'^DTSTART[^:]*:(\d{8})', re.MULTILINE)
+    
+    def __init__(self, holidays=()):
+        """
+        Create a calendar from dates.
+        
+        Args:
+            holidays (iterable): date/datetime objects or 'YYYY-MM-DD' strings
+        """
+        ordinals = set()
+        for holiday in holidays:
+            if isinstance(holiday, str):
+                holiday = date.fromisoformat(holiday.strip())
+            elif isinstance(holiday, datetime):
+                holiday = holiday.date()
+            if holiday.weekday() < 5:
+                ordinals.add(holiday.toordinal())
+        self._ordinals = sorted(ordinals)
+    
+    def __len__(self):
+        return len(self._ordinals)
+    
+    @classmethod
+    def from_ics(cls, ics_text):
+        """
+        Create a calendar from the all-day events in iCalendar text.
+        
+        Args:
+            ics_text (str): Contents of an .ics file
+            
+        Returns:
+            HolidayCalendar: Calendar with one holiday per event start date
+        """
+        ics_text = ics_text.replace('\r\n', '\n')
+        return cls(datetime.strptime(value, '%Y%m%d').date()
+                   for value in cls.ICS_DTSTART_PATTERN.findall(ics_text))
+    
+    @classmethod
+    def from_setting(cls, value):
+        """
+        Create a calendar from the 'holiday_calendar' setting.
+        
+        Args:
+            value (str): Path to an .ics file, or ISO dates separated by commas/whitespace
+            
+        Returns:
+            HolidayCalendar: Parsed calendar (empty if value is empty)
+        """
+        if not value:
+            return cls()
+        value = value.strip()
+        if value.lower().endswith('.ics'):
+            with open(os.path.expanduser(value), encoding='utf-8') as ics_file:
+                return cls.from_ics(ics_file.read())
+        return cls(item for item in re.split(r'[,\s]+', value) if item)
+    
+    def count_between(self, first, last):
+        """
+        Count weekday holidays between two date ordinals, inclusive.
+        
+        Args:
+            first (int): Ordinal of the first day
+            last (int): Ordinal of the last day
+            
+        Returns:
+            int: Number of holidays in the range
+        """
+        return bisect_right(self._ordinals, last) - bisect_left(self._ordinals, first)
+
+
+def count_business_days(start_date, end_date, holidays=None):
+    """
+    Count business days from start_date to end_date in constant time.
+    
+    Counts the weekdays among start_date's day and each following day reached
+    in whole 24-hour steps up to end_date (so both ends are included when a
+    full number of days has elapsed), minus holidays.
+    
+    Args:
+        start_date (datetime): Start of the period (e.g. snapshot creation time)
+        end_date (datetime): End of the period (e.g. now)
+        holidays (HolidayCalendar): Optional calendar of non-working days
+        
+    Returns:
+        int: Number of business days, 0 if end_date is before start_date
+    """
+    elapsed_days = (end_date - start_date).days
+    if elapsed_days < 0:
+        return 0
+    first = start_date.toordinal()
+    return _count_weekdays(first, elapsed_days + 1, holidays)
+
+
+def count_business_days_many(start_dates, end_date, holidays=None):
+    """
+    Count business days for many start dates against the same end date.
+    
+    Results are memoized per (first day, length) within the call, so rows
+    created on the same day share one computation.
+    
+    Args:
+        start_dates (iterable): datetime objects, or None for unknown dates
+        end_date (datetime): End of the period (e.g. now)
+        holidays (HolidayCalendar): Optional calendar of non-working days
+        
+    Returns:
+        list: Business days per start date (None where the start date is None)
+    """
+    cache = {}
+    counts = []
+    for start_date in start_dates:
+        if start_date is None:
+            counts.append(None)
+            continue
+        elapsed_days = (end_date - start_date).days
+        if elapsed_days < 0:
+            counts.append(0)
+            continue
+        key = (start_date.toordinal(), elapsed_days)
+        count = cache.get(key)
+        if count is None:
+            count = cache[key] = _count_weekdays(key[0], elapsed_days + 1, holidays)
+        counts.append(count)
+    return counts
+
+
+def _count_weekdays(first, num_days, holidays=None):
+    """Count Monday-Friday days among num_days days starting at ordinal first"""
+    full_weeks, remainder = divmod(num_days, 7)
+    count = full_weeks * 5
+    # Ordinal 1 (0001-01-01) is a Monday, so (ordinal - 1) % 7 is the weekday
+    first_weekday = (first + full_weeks * 7 - 1) % 7
+    # Weekdays among the remaining days: positions first_weekday..first_weekday+remainder-1
+    count += max(0, min(5, first_weekday + remainder) - first_weekday)
+    if first_weekday + remainder > 7:
+        count += min(5, first_weekday + remainder - 7)
+    if holidays:
+        count -= holidays.count_between(first, first + num_days - 1)
+    return count
@@ -4,8 +4,10 @@ Dialog windows for pySnap.
 
 from .add_vcenter import AddVCenterDialog
 from .create_snapshots import CreateSnapshotsDialog
+from .confirm_delete import ConfirmDeleteDialog
 
 __all__ = [
     'AddVCenterDialog',
-    'CreateSnapshotsDialog'
+    'CreateSnapshotsDialog',
+    'ConfirmDeleteDialog'
 ]
\ No newline at end of file
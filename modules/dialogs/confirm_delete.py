@@ -0,0 +1,238 @@
+"""
+Confirm Delete Dialog
+
+This module contains the confirmation dialog shown before snapshots are
+deleted. The selection is grouped by vCenter and age bucket in a tree model
+that creates the snapshot rows of a group only as they are scrolled into
+view, so the dialog opens instantly for any number of snapshots.
+"""
+
+from PyQt6.QtWidgets import (QDialog, QLabel, QVBoxLayout, QHBoxLayout,
+                            QPushButton, QTreeView)
+from PyQt6.QtCore import Qt, QAbstractItemModel, QModelIndex
+
+
+DETAIL_HEADERS = ["VM / Group", "Snapshot", "Created", "Age"]
+
+# Upper bounds (inclusive) of the age buckets; older snapshots fall in the last bucket
+AGE_BUCKET_LIMITS = [5, 20, 60]
+
+# Snapshot rows added to an expanded group per fetchMore() call
+FETCH_CHUNK_SIZE = 200
+
+
+def age_bucket(age):
+    """
+    Return the bucket index of an age.
+
+    Buckets are numbered from youngest to oldest, with one more bucket
+    than AGE_BUCKET_LIMITS for the oldest snapshots and -1 for unknown ages.
+    """
+    if age is None:
+        return -1
+    for bucket, limit in enumerate(AGE_BUCKET_LIMITS):
+        if age <= limit:
+            return bucket
+    return len(AGE_BUCKET_LIMITS)
+
+
+def age_bucket_label(bucket, day_type):
+    """Describe an age bucket, e.g. '6-20 business days'"""
+    if bucket < 0:
+        return "Unknown age"
+    if bucket == 0:
+        return f"0-{AGE_BUCKET_LIMITS[0]} {day_type}"
+    if bucket == len(AGE_BUCKET_LIMITS):
+        return f"Over {AGE_BUCKET_LIMITS[-1]} {day_type}"
+    return f"{AGE_BUCKET_LIMITS[bucket - 1] + 1}-{AGE_BUCKET_LIMITS[bucket]} {day_type}"
+
+
+class DeletionGroup:
+    """Snapshots of one vCenter in one age bucket"""
+
+    def __init__(self, vcenter, bucket, label):
+        self.vcenter = vcenter
+        self.bucket = bucket
+        self.label = label
+        self.items = []  # (SnapshotRecord, age) tuples
+        self.loaded = 0  # Rows exposed to the view so far
+
+
+class DeletionSummaryModel(QAbstractItemModel):
+    """
+    Two-level tree of the snapshots selected for deletion.
+
+    Top-level rows are (vCenter, age bucket) groups with their counts. The
+    snapshot rows of a group are exposed FETCH_CHUNK_SIZE at a time through
+    canFetchMore()/fetchMore(), and their text is built in data() only for
+    the rows the view paints.
+    """
+
+    def __init__(self, selected_items, ages, day_type, parent=None):
+        """
+        Group the selection and compute its totals in one pass.
+
+        Args:
+            selected_items (list): (snapshot_id, SnapshotRecord) tuples
+            ages (list): Age of each selected snapshot (None if unknown)
+            day_type (str): Unit of the ages, e.g. "business days"
+        """
+        super().__init__(parent)
+        self.day_type = day_type
+
+        groups = {}
+        vcenters = set()
+        oldest = None
+        for (snapshot_id, data), age in zip(selected_items, ages):
+            bucket = age_bucket(age)
+            group = groups.get((data.vcenter, bucket))
+            if group is None:
+                group = DeletionGroup(data.vcenter, bucket, age_bucket_label(bucket, day_type))
+                groups[(data.vcenter, bucket)] = group
+            group.items.append((data, age))
+            vcenters.add(data.vcenter)
+            if age is not None and (oldest is None or age > oldest):
+                oldest = age
+
+        # vCenters in name order, oldest snapshots first within each
+        self.groups = sorted(groups.values(), key=lambda group: (group.vcenter, -group.bucket))
+        self.total = len(selected_items)
+        self.vcenter_count = len(vcenters)
+        self.oldest_age = oldest
+
+    # Tree structure: group rows have internal ID 0, snapshot rows their group row + 1
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self.groups[parent.row()].loaded
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(DETAIL_HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.groups)
+        return parent.internalId() == 0 and parent.column() == 0
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        group = self.groups[parent.row()]
+        return group.loaded < len(group.items)
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        group = self.groups[parent.row()]
+        count = min(FETCH_CHUNK_SIZE, len(group.items) - group.loaded)
+        self.beginInsertRows(parent, group.loaded, group.loaded + count - 1)
+        group.loaded += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return DETAIL_HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role != Qt.ItemDataRole.DisplayRole:
+            return None
+
+        if index.internalId() == 0:
+            if index.column() != 0:
+                return None
+            group = self.groups[index.row()]
+            count = len(group.items)
+            return f"{group.vcenter} - {group.label} ({count} snapshot{'s' if count != 1 else ''})"
+
+        data, age = self.groups[index.internalId() - 1].items[index.row()]
+        column = index.column()
+        if column == 0:
+            return data.vm_name
+        if column == 1:
+            return data.name
+        if column == 2:
+            return data.created
+        return "Unknown" if age is None else f"{age} {self.day_type}"
+
+    def summary_text(self):
+        """One-line description of the whole selection"""
+        text = (f"You are about to delete {self.total} snapshot{'s' if self.total != 1 else ''} "
+                f"on {self.vcenter_count} vCenter{'s' if self.vcenter_count != 1 else ''}.")
+        if self.oldest_age is not None:
+            text += f"\nThe oldest is {self.oldest_age} {self.day_type} old."
+        return text
+
+
+class ConfirmDeleteDialog(QDialog):
+    """Asks the user to confirm deleting the selected snapshots"""
+
+    def __init__(self, selected_items, ages, day_type, parent=None):
+        """
+        Args:
+            selected_items (list): (snapshot_id, SnapshotRecord) tuples
+            ages (list): Age of each selected snapshot (None if unknown)
+            day_type (str): Unit of the ages, e.g. "business days"
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Confirm Snapshot Deletion")
+        self.setModal(True)
+        self.resize(700, 450)
+
+        self.model = DeletionSummaryModel(selected_items, ages, day_type, self)
+
+        layout = QVBoxLayout(self)
+
+        # Warning icon and summary
+        warning_layout = QHBoxLayout()
+        warning_icon = QLabel("⚠️")
+        warning_icon.setStyleSheet("font-size: 24px;")
+        warning_text = QLabel(self.model.summary_text() + "\nPlease review the following snapshots carefully:")
+        warning_layout.addWidget(warning_icon)
+        warning_layout.addWidget(warning_text, 1)
+        layout.addLayout(warning_layout)
+
+        # Grouped snapshot list; rows are created as groups are expanded and scrolled
+        self.view = QTreeView()
+        self.view.setModel(self.model)
+        self.view.setUniformRowHeights(True)
+        self.view.setSelectionMode(QTreeView.SelectionMode.NoSelection)
+        self.view.setColumnWidth(0, 260)
+        for row in range(self.model.rowCount()):
+            self.view.setFirstColumnSpanned(row, QModelIndex(), True)
+        if len(self.model.groups) <= 10:
+            self.view.expandAll()
+        layout.addWidget(self.view)
+
+        final_warning = QLabel("WARNING: This action cannot be undone!")
+        final_warning.setStyleSheet("color: red; font-weight: bold;")
+        layout.addWidget(final_warning)
+
+        # Buttons
+        button_box = QHBoxLayout()
+
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+
+        delete_btn = QPushButton("Delete Snapshots")
+        delete_btn.clicked.connect(self.accept)
+        delete_btn.setStyleSheet("QPushButton { color: red; }")
+
+        button_box.addStretch()  # Right-align the buttons
+        button_box.addWidget(cancel_btn)
+        button_box.addWidget(delete_btn)
+        layout.addLayout(button_box)
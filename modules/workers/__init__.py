@@ -6,10 +6,14 @@ from .snapshot_fetch import SnapshotFetchWorker
 from .snapshot_delete import SnapshotDeleteWorker
 from .snapshot_create import SnapshotCreateWorker
 from .auto_connect import AutoConnectWorker
+from .connection_supervisor import ConnectionSupervisor
+from .live_inventory import LiveInventoryWorker
 
 __all__ = [
     'SnapshotFetchWorker',
     'SnapshotDeleteWorker', 
     'SnapshotCreateWorker',
-    'AutoConnectWorker'
+    'AutoConnectWorker',
+    'ConnectionSupervisor',
+    'LiveInventoryWorker'
 ]
\ No newline at end of file
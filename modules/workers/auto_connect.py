@@ -4,35 +4,42 @@ Auto-Connect Worker Thread
 This module contains the worker thread for auto-connecting to saved vCenters.
 """
 
-import ssl
+import logging
 import socket
-import urllib3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QThread, pyqtSignal
-from pyVim.connect import SmartConnect
+
+from ..core.connection import connect_vcenter, DEFAULT_CONNECT_TIMEOUT
 
 
 class AutoConnectWorker(QThread):
     """Worker thread for auto-connecting to saved vCenters"""
     progress = pyqtSignal(str)  # status message
     connection_made = pyqtSignal(str, object, dict)  # hostname, service_instance, credentials
+    connection_latency = pyqtSignal(str, float)  # hostname, login time in seconds
     finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, saved_servers, config_manager):
+    # Upper bound on logins in flight at once
+    MAX_PARALLEL_LOGINS = 8
+
+    def __init__(self, saved_servers, config_manager, timeout=DEFAULT_CONNECT_TIMEOUT):
         super().__init__()
         self.saved_servers = saved_servers
         self.config_manager = config_manager
+        self.timeout = timeout
+        self.latencies = {}  # hostname -> login time in seconds
+        self.progress_lock = threading.Lock()
+        self.attempted = 0
+        self.logger = logging.getLogger('pySnap')
 
     def run(self):
         try:
-            # Set socket timeout for all connections in this thread
-            socket.setdefaulttimeout(10.0)  # Increased to 10 seconds
-            
-            servers = list(self.saved_servers.items())
-            total = len(servers)
-            connected = 0
-            
-            for hostname, server_data in servers:
+            # Resolve credentials up front; only the logins run in parallel
+            logins = []
+            for hostname, server_data in self.saved_servers.items():
                 # Handle both old format (string) and new format (dict)
                 if isinstance(server_data, str):
                     username = server_data
@@ -40,62 +47,56 @@ class AutoConnectWorker(QThread):
                 else:
                     username = server_data.get('username', '')
                     verify_ssl = server_data.get('verify_ssl', False)
-                
+
                 secure_password = self.config_manager.get_password(hostname, username)
                 if secure_password and not secure_password.is_empty():
-                    try:
-                        connected += 1
-                        self.progress.emit(f"Auto-connecting to {hostname}... ({connected}/{total})")
-                        
-                        # Create SSL context based on saved preference
-                        context = ssl.create_default_context()
-                        if not verify_ssl:
-                            context.check_hostname = False
-                            context.verify_mode = ssl.CERT_NONE
-                            # Disable SSL verification warnings
-                            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-                        
-                        # Get password string briefly for connection
-                        password_str = secure_password.get_password()
-                        try:
-                            si = SmartConnect(
-                                host=hostname,
-                                user=username,
-                                pwd=password_str,
-                                sslContext=context,
-                                disableSslCertValidation=not verify_ssl
-                            )
-                        finally:
-                            # Clear the temporary password string
-                            password_str = '\0' * len(password_str)
-                            del password_str
-                        
-                        if si:
-                            credentials = {
-                                'username': username, 
-                                'password': secure_password,
-                                'verify_ssl': verify_ssl
-                            }
-                            self.connection_made.emit(hostname, si, credentials)
-                        else:
-                            self.error.emit(f"Failed to connect to {hostname}: No service instance returned")
-                    except socket.timeout:
-                        self.error.emit(f"Connection to {hostname} timed out after 10 seconds")
-                        # Continue with next server
-                    except socket.gaierror as e:
-                        self.error.emit(f"Cannot resolve hostname {hostname}: {str(e)}")
-                        # Continue with next server
-                    except ConnectionRefusedError as e:
-                        self.error.emit(f"Connection refused by {hostname}: {str(e)}")
-                        # Continue with next server
-                    except Exception as e:
-                        # Log but don't crash - continue with next server
-                        self.error.emit(f"Failed to auto-connect to {hostname}: {type(e).__name__}: {str(e)}")
-                        # Continue with next server
-            
+                    logins.append((hostname, username, secure_password, verify_ssl))
+
+            if logins:
+                self.attempted = 0
+                self.progress.emit(f"Auto-connecting to {len(logins)} vCenters...")
+                max_workers = min(self.MAX_PARALLEL_LOGINS, len(logins))
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pysnap-login') as executor:
+                    for login in logins:
+                        executor.submit(self.connect_one, *login, len(logins))
+
             self.finished.emit()
         except Exception as e:
             self.error.emit(f"Auto-connect error: {str(e)}")
+
+    def connect_one(self, hostname, username, secure_password, verify_ssl, total):
+        """Log in to one vCenter on a pool thread, emitting the result as soon as it is known"""
+        started = time.monotonic()
+        try:
+            si = connect_vcenter(hostname, username, secure_password, verify_ssl, self.timeout)
+
+            if si:
+                self.record_latency(hostname, time.monotonic() - started)
+                credentials = {
+                    'username': username,
+                    'password': secure_password,
+                    'verify_ssl': verify_ssl
+                }
+                self.connection_made.emit(hostname, si, credentials)
+            else:
+                self.error.emit(f"Failed to connect to {hostname}: No service instance returned")
+        except socket.timeout:
+            self.error.emit(f"Connection to {hostname} timed out after {self.timeout} seconds")
+        except socket.gaierror as e:
+            self.error.emit(f"Cannot resolve hostname {hostname}: {str(e)}")
+        except ConnectionRefusedError as e:
+            self.error.emit(f"Connection refused by {hostname}: {str(e)}")
+        except Exception as e:
+            # Log but don't crash - the other logins continue
+            self.error.emit(f"Failed to auto-connect to {hostname}: {type(e).__name__}: {str(e)}")
         finally:
-            # Reset socket timeout to default
-            socket.setdefaulttimeout(None)
\ No newline at end of file
+            with self.progress_lock:
+                self.attempted += 1
+                attempted = self.attempted
+            self.progress.emit(f"Auto-connecting... ({attempted}/{total} done)")
+
+    def record_latency(self, hostname, seconds):
+        """Remember and publish how long a login took"""
+        self.latencies[hostname] = seconds
+        self.logger.info(f"Login to {hostname} took {seconds:.2f}s")
+        self.connection_latency.emit(hostname, seconds)
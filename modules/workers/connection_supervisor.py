@@ -0,0 +1,255 @@
+"""
+Connection Supervisor Thread
+
+This module contains the background thread that watches vCenter sessions.
+Sessions are kept warm with keepalives sent concurrently on a small pool.
+When a keepalive fails, the session is re-attached by its cookie if the server
+still has it and logged in again only when it does not, with exponential
+backoff between attempts. Health changes are published to the UI through
+signals so the GUI thread never waits on the network.
+"""
+
+import logging
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from ..core.connection import (connect_vcenter, attach_session, get_session_id,
+                               session_is_active, DEFAULT_CONNECT_TIMEOUT)
+
+
+class SupervisedSession:
+    """Supervisor bookkeeping for one vCenter session"""
+
+    def __init__(self, si, credentials):
+        self.si = si
+        self.credentials = credentials  # None if the session cannot be logged in again
+        self.session_id = get_session_id(si)  # Cookie used to re-attach
+        self.healthy = True
+        self.detail = 'Connected'
+        self.failures = 0  # Consecutive failed reconnects
+        self.next_check = 0.0  # time.monotonic() of the next keepalive
+        self.checking = False  # A keepalive is running on the pool
+
+
+class ConnectionSupervisor(QThread):
+    """Worker thread that keeps vCenter sessions alive and re-establishes lost ones"""
+    health_changed = pyqtSignal(str, bool, str)  # hostname, healthy, detail
+    reconnected = pyqtSignal(str, object)  # hostname, new service_instance
+    connection_lost = pyqtSignal(str, str)  # hostname, reason; the session was dropped
+
+    # Seconds between keepalives of a healthy session; well inside the
+    # default 30 minute vCenter idle-session timeout
+    KEEPALIVE_INTERVAL = 120
+
+    # Reconnect delays grow from BACKOFF_BASE, doubling up to BACKOFF_MAX seconds
+    BACKOFF_BASE = 5
+    BACKOFF_MAX = 300
+
+    # Upper bound on keepalives and logins in flight at once
+    MAX_PARALLEL_PROBES = 8
+
+    def __init__(self, keepalive_interval=KEEPALIVE_INTERVAL, timeout=DEFAULT_CONNECT_TIMEOUT,
+                 backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX):
+        super().__init__()
+        self.keepalive_interval = keepalive_interval
+        self.timeout = timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.sessions = {}  # hostname -> SupervisedSession
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopped = threading.Event()
+        self.logger = logging.getLogger('pySnap')
+
+    def add_session(self, hostname, si, credentials=None):
+        """
+        Start supervising a session, replacing any previous one for the host.
+
+        Args:
+            hostname (str): vCenter hostname
+            si: vim.ServiceInstance for the session
+            credentials (dict): username, password (SecurePassword) and verify_ssl
+                used to log in again, or None to drop the session once it expires
+        """
+        session = SupervisedSession(si, credentials)
+        session.next_check = time.monotonic() + self.keepalive_interval
+        with self.lock:
+            self.sessions[hostname] = session
+
+    def remove_session(self, hostname):
+        """Stop supervising a session"""
+        with self.lock:
+            self.sessions.pop(hostname, None)
+
+    def clear(self):
+        """Stop supervising all sessions"""
+        with self.lock:
+            self.sessions.clear()
+
+    def health(self, hostname):
+        """
+        Return the last known health of a session.
+
+        Returns:
+            tuple: (healthy, detail), or (False, 'Not connected') for unknown hosts
+        """
+        with self.lock:
+            session = self.sessions.get(hostname)
+            if session is None:
+                return False, 'Not connected'
+            return session.healthy, session.detail
+
+    def request_probe(self):
+        """Check every session now instead of waiting for the next keepalive"""
+        with self.lock:
+            for session in self.sessions.values():
+                session.next_check = 0.0
+        self.wake.set()
+
+    def stop(self):
+        """Ask the supervisor to exit; probes in flight finish in the background"""
+        self.stopped.set()
+        self.wake.set()
+
+    def run(self):
+        executor = ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_PROBES,
+                                      thread_name_prefix='pysnap-probe')
+        try:
+            while not self.stopped.is_set():
+                for hostname in self.take_due(time.monotonic()):
+                    executor.submit(self.check, hostname)
+                self.wake.wait(self.seconds_until_next_check(time.monotonic()))
+                self.wake.clear()
+        finally:
+            executor.shutdown(wait=False)
+
+    def take_due(self, now):
+        """Mark and return the hosts whose next keepalive is due"""
+        due = []
+        with self.lock:
+            for hostname, session in self.sessions.items():
+                if not session.checking and session.next_check <= now:
+                    session.checking = True
+                    due.append(hostname)
+        return due
+
+    def seconds_until_next_check(self, now):
+        """Return how long the scheduler can sleep before a keepalive is due"""
+        with self.lock:
+            waiting = [s.next_check for s in self.sessions.values() if not s.checking]
+        if not waiting:
+            return self.keepalive_interval
+        return max(0.0, min(waiting) - now)
+
+    def backoff_delay(self, failures):
+        """Return the jittered delay before recovery attempt number failures + 1"""
+        delay = min(self.backoff_max, self.backoff_base * 2 ** max(0, failures - 1))
+        return delay * random.uniform(0.8, 1.2)
+
+    def check(self, hostname):
+        """
+        Send a keepalive on one session and re-establish it if that fails. Runs on the pool.
+
+        Args:
+            hostname (str): vCenter hostname
+        """
+        with self.lock:
+            session = self.sessions.get(hostname)
+            if session is None:
+                return
+            si, credentials, session_id = session.si, session.credentials, session.session_id
+
+        try:
+            if session_is_active(si):
+                self.finish_check(hostname, session, True, 'Connected')
+                return
+            reason = 'Session expired'
+            session_id = None  # The server dropped it; only a login can help
+        except Exception as e:
+            reason = str(e)  # Transport failure; the session may still be valid
+        if session.healthy:
+            self.logger.warning(f"Connection to {hostname} lost: {reason}")
+
+        if not credentials and not session_id:
+            with self.lock:
+                if self.sessions.get(hostname) is not session:
+                    return
+                del self.sessions[hostname]
+            self.connection_lost.emit(hostname, reason)
+            return
+
+        new_si = detail = None
+        try:
+            new_si, detail = self.reestablish(hostname, session_id, credentials)
+        except Exception as e:
+            reason = str(e)
+
+        if new_si is None:
+            self.finish_check(hostname, session, False, f"Reconnect failed: {reason}")
+            return
+
+        with self.lock:
+            current = self.sessions.get(hostname) is session
+            if current:
+                session.si = new_si
+                session.session_id = get_session_id(new_si)
+        if not current:
+            return  # Removed while logging in; the UI no longer wants this session
+        self.logger.info(f"Successfully reconnected to {hostname} ({detail.lower()})")
+        self.reconnected.emit(hostname, new_si)
+        self.finish_check(hostname, session, True, detail)
+
+    def reestablish(self, hostname, session_id, credentials):
+        """
+        Re-attach to a session the server still knows, falling back to a login.
+
+        Args:
+            hostname (str): vCenter hostname
+            session_id (str): Cookie of the lost session, or None if it expired
+            credentials (dict): Login credentials, or None
+
+        Returns:
+            tuple: (service_instance, detail), or (None, None) if neither worked
+        """
+        verify_ssl = (credentials or {}).get('verify_ssl', False)
+        if session_id:
+            try:
+                si = attach_session(hostname, session_id, verify_ssl, self.timeout)
+            except Exception as e:
+                if not credentials:
+                    raise
+                self.logger.debug(f"Could not re-attach to {hostname}: {str(e)}")
+                si = None
+            if si is not None:
+                return si, 'Session re-attached'
+
+        if credentials:
+            si = connect_vcenter(hostname, credentials['username'], credentials['password'],
+                                 verify_ssl, self.timeout)
+            if si is not None:
+                return si, 'Logged in again'
+        return None, None
+
+    def finish_check(self, hostname, session, healthy, detail):
+        """Record a check result, schedule the next keepalive and publish changes"""
+        with self.lock:
+            if self.sessions.get(hostname) is not session:
+                return
+            changed = healthy != session.healthy or not healthy
+            session.healthy = healthy
+            session.detail = detail
+            session.checking = False
+            if healthy:
+                session.failures = 0
+                session.next_check = time.monotonic() + self.keepalive_interval
+            else:
+                session.failures += 1
+                session.next_check = time.monotonic() + self.backoff_delay(session.failures)
+        if not healthy:
+            self.logger.error(f"{hostname}: {detail}")
+        if changed:
+            self.health_changed.emit(hostname, healthy, detail)
+        self.wake.set()  # Let the scheduler pick up the new next_check
@@ -0,0 +1,123 @@
+"""
+Live Inventory Worker Thread
+
+This module contains the worker thread behind live mode. It keeps an
+InventoryWatch open on every connected vCenter: the first updates deliver
+the inventory like a fetch, and after that only the snapshots that were
+added, changed or removed are sent to the GUI.
+"""
+
+import queue
+import threading
+import time
+from PyQt6.QtCore import pyqtSignal
+
+from ..core import ProgressTracker
+from ..core.inventory_watch import InventoryWatch, DEFAULT_WAIT_SECONDS
+from ..core.property_collector import DEFAULT_PAGE_SIZE
+from .snapshot_fetch import SnapshotFetchWorker
+
+
+class LiveInventoryWorker(SnapshotFetchWorker):
+    """
+    Worker thread that streams snapshot changes until stopped.
+
+    Snapshot records are built exactly as SnapshotFetchWorker builds them.
+    vcenter_complete is emitted once a vCenter's inventory is complete;
+    finished is emitted when live mode ends.
+    """
+    snapshots_changed = pyqtSignal(str, list, list)  # hostname, added or changed records, removed records
+    vcenter_failed = pyqtSignal(str, str)  # hostname, reason; the vCenter is no longer watched
+
+    # Seconds between checks for stop and watch requests
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, vcenter_connections, page_size=DEFAULT_PAGE_SIZE, wait_seconds=DEFAULT_WAIT_SECONDS):
+        super().__init__(vcenter_connections, page_size)
+        self.wait_seconds = wait_seconds
+        self.requests = queue.Queue()  # (hostname, si), or (hostname, None) to stop watching
+        self.stopped = threading.Event()
+        for hostname, si in vcenter_connections.items():
+            self.requests.put((hostname, si))
+
+    def watch_vcenter(self, hostname, si):
+        """Start watching a vCenter, or restart its watch on a new session. Thread-safe."""
+        self.requests.put((hostname, si))
+
+    def unwatch_vcenter(self, hostname):
+        """Stop watching a vCenter. Thread-safe."""
+        self.requests.put((hostname, None))
+
+    def stop(self):
+        """Ask the worker to close its watches and finish"""
+        self.stopped.set()
+
+    def run(self):
+        watch = InventoryWatch(self.build_snapshot_data, self.wait_seconds, self.page_size)
+        syncing = {}  # hostname -> POSIX time its watch started, until the inventory is complete
+        watched = set()
+        try:
+            while not self.stopped.is_set():
+                self.apply_requests(watch, syncing, watched)
+                change = watch.next_change(timeout=self.POLL_INTERVAL)
+                if change is None:
+                    continue
+
+                hostname = change.vcenter
+                if change.error:
+                    watched.discard(hostname)
+                    syncing.pop(hostname, None)
+                    watch.unwatch(hostname)
+                    self.emit_sync_progress(syncing, watched, hostname)
+                    self.vcenter_progress.emit(hostname, "Failed")
+                    self.vcenter_failed.emit(hostname, change.error)
+                    continue
+
+                if change.added or change.removed:
+                    self.snapshots_changed.emit(hostname, change.added, change.removed)
+                if change.synced and hostname in syncing:
+                    started = syncing.pop(hostname)
+                    self.emit_sync_progress(syncing, watched, hostname)
+                    self.vcenter_progress.emit(hostname, "Live")
+                    self.vcenter_complete.emit(hostname, started)
+        except Exception as e:
+            self.logger.error(f"Fatal error in live inventory worker: {str(e)}")
+            self.error.emit(str(e))
+        finally:
+            watch.stop()
+        self.finished.emit()
+
+    def apply_requests(self, watch, syncing, watched):
+        """Start and stop the watches requested since the last poll"""
+        while True:
+            try:
+                hostname, si = self.requests.get_nowait()
+            except queue.Empty:
+                return
+
+            if si is None:
+                watch.unwatch(hostname)
+                watched.discard(hostname)
+                syncing.pop(hostname, None)
+                continue
+
+            self.vcenter_progress.emit(hostname, "Connecting")
+            try:
+                started = time.time()
+                watch.watch(hostname, si)
+            except Exception as e:
+                self.logger.error(f"Could not watch {hostname}: {str(e)}")
+                watched.discard(hostname)
+                syncing.pop(hostname, None)
+                self.vcenter_progress.emit(hostname, "Failed")
+                self.vcenter_failed.emit(hostname, str(e))
+                continue
+            watched.add(hostname)
+            syncing[hostname] = started
+            self.emit_sync_progress(syncing, watched, hostname)
+
+    def emit_sync_progress(self, syncing, watched, hostname):
+        """Report how many watched vCenters have delivered their inventory"""
+        total = len(watched)
+        if total:
+            ProgressTracker.emit_progress(self.progress, total - len(syncing), total, "Syncing", hostname)
@@ -4,28 +4,44 @@ Snapshot Create Worker Thread
 This module contains the worker thread for creating snapshots in bulk.
 """
 
-import time
+import logging
 import getpass
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtCore import QThread, pyqtSignal
 from pyVmomi import vim
-from ..core import ProgressTracker, format_vmware_time
+from ..core import ProgressTracker
+from ..core.creator_parser import extract_creator
+from ..core.snapshot_record import SnapshotRecord, walk_snapshot_tree
+from ..core.property_collector import iter_container_properties
+from ..core.task_monitor import TaskMonitor
+from ..core.task_scheduler import ConcurrencyScheduler
 
 
 class SnapshotCreateWorker(QThread):
     progress = pyqtSignal(int, int, str)  # completed, total, message
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    snapshot_created = pyqtSignal(dict)  # Changed from str to dict to include snapshot details for caching
+    snapshot_created = pyqtSignal(object)  # SnapshotRecord, or the server name if it can't be read back
 
-    def __init__(self, vcenter_connections, servers, description, memory=False, vcenter_username=None):
+    # VM properties needed to find VMs by name and place them on clusters/datastores
+    VM_PROPERTIES = ['name', 'runtime.host', 'datastore']
+
+    # Maximum snapshot creations in flight per vCenter, per cluster and per datastore
+    DEFAULT_LIMITS = {'vcenter': 10, 'cluster': 5, 'datastore': 3}
+
+    # Upper bound on vCenters indexed concurrently
+    MAX_PARALLEL_VCENTERS = 8
+
+    def __init__(self, vcenter_connections, servers, description, memory=False, vcenter_username=None,
+                 limits=None):
         super().__init__()
         self.vcenter_connections = vcenter_connections
         self.servers = servers
         self.description = description
         self.memory = memory
         self.vcenter_username = vcenter_username or getpass.getuser()  # Fallback to system user
-        self.batch_size = 5  # Process 5 servers per vCenter at a time
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.logger = logging.getLogger('pySnap')
 
     def run(self):
         total = len(self.servers)
@@ -38,134 +54,81 @@ class SnapshotCreateWorker(QThread):
             "Locating", "VMs"
         )
         
-        # Group servers by vCenter
-        servers_by_vcenter = {}
-        for i, server in enumerate(self.servers, 1):
-            # Update progress during VM discovery
-            ProgressTracker.emit_progress(
-                self.progress, i-1, total,
-                "Finding", f"{server}"
-            )
-            
-            # Find which vCenter the VM belongs to
-            found = False
-            for si in self.vcenter_connections.values():
-                vm = self.find_vm_in_vcenter(si, server)
-                if vm:
-                    vcenter = si._stub.host
-                    if vcenter not in servers_by_vcenter:
-                        servers_by_vcenter[vcenter] = []
-                    servers_by_vcenter[vcenter].append((vm, server))
-                    found = True
+        # Index VM names and placement once per vCenter, all vCenters in parallel
+        vm_indexes = {}
+        if self.vcenter_connections:
+            max_workers = min(self.MAX_PARALLEL_VCENTERS, len(self.vcenter_connections))
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pysnap-index') as executor:
+                futures = {
+                    vcenter: executor.submit(self.build_placement_index, vcenter, si)
+                    for vcenter, si in self.vcenter_connections.items()
+                }
+            for vcenter, future in futures.items():
+                try:
+                    vm_indexes[vcenter] = future.result()
+                except Exception as e:
+                    failed.append(f"Error listing VMs on {vcenter}: {str(e)}")
+        
+        # Queue each server with the resources its snapshot will load
+        scheduler = ConcurrencyScheduler(self.limits)
+        for server in self.servers:
+            # Find which vCenter the VM belongs to (first match in connection order)
+            for vcenter, vm_index in vm_indexes.items():
+                entry = vm_index.get(server.lower())
+                if entry:
+                    vm, resources = entry
+                    scheduler.add((vm, server, vcenter), resources)
                     break
-            if not found:
+            else:
                 failed.append(f"Server not found: {server}")
 
-        if not servers_by_vcenter:
+        if not scheduler.has_work():
             self.error.emit("No VMs were found in any connected vCenter")
             self.finished.emit()
             return
 
         # Show how many VMs were found
-        found_count = sum(len(servers) for servers in servers_by_vcenter.values())
         ProgressTracker.emit_progress(
             self.progress, 0, total,
-            "Creating", f"Found {found_count}"
+            "Creating", f"Found {scheduler.pending_count}"
         )
 
-        # Process each vCenter's servers in batches
-        active_tasks = {}  # {task: (server_name, vcenter_name)}
-        
-        for vcenter, server_list in servers_by_vcenter.items():
-            ProgressTracker.emit_progress(
-                self.progress, completed, total,
-                "Creating", f"{vcenter}"
-            )
-            
-            for i in range(0, len(server_list), self.batch_size):
-                batch = server_list[i:i + self.batch_size]
-                batch_servers = [s[1] for s in batch]
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Batch", f"{len(batch_servers)} VMs"
-                )
+        # Sliding window: start whatever fits the limits, then start more as tasks finish
+        monitor = TaskMonitor()
+        try:
+            while scheduler.has_work():
+                ready = scheduler.take_ready()
+                while ready:
+                    for item in ready:
+                        if not self.start_snapshot(monitor, item, failed):
+                            scheduler.release(item)
+                    # Failed starts free their slots for the next pending items
+                    ready = scheduler.take_ready()
                 
-                # Start snapshot creation for batch
-                for vm, server in batch:
-                    try:
-                        # Add creator information to description using vCenter username
-                        description_with_creator = f"{self.description} (Created by: {self.vcenter_username})"
-                        
-                        task = vm.CreateSnapshot_Task(
-                            name=f"Monthly OS Patching",
-                            description=description_with_creator,
-                            memory=self.memory,
-                            quiesce=False
-                        )
-                        active_tasks[task] = (server, vcenter)
-                    except Exception as e:
-                        failed.append(f"Error creating snapshot for {server}: {str(e)}")
-
-                # Monitor tasks
-                while active_tasks:
-                    for task in list(active_tasks.keys()):
-                        server, vcenter = active_tasks[task]
-                        try:
-                            if task.info.state == vim.TaskInfo.State.success:
-                                completed += 1
-                                # Get the snapshot we just created
-                                snapshot_obj = None
-                                if vm.snapshot:
-                                    # Find the snapshot that was just created
-                                    for snapshot in self.get_snapshots(vm.snapshot.rootSnapshotList):
-                                        if snapshot.name == "Monthly OS Patching" and format_vmware_time(snapshot.createTime)[:10] == datetime.now().strftime('%Y-%m-%d'):
-                                            snapshot_obj = snapshot
-                                            break
-                                
-                                if snapshot_obj:
-                                    # Get creator information from description
-                                    # VMware snapshots don't have a built-in createdBy property
-                                    created_by = self.extract_creator_from_description(snapshot_obj.description)
-                                    
-                                    # Emit snapshot details in the same format as SnapshotFetchWorker
-                                    # This enables caching by directly adding to the tree without refetching
-                                    self.snapshot_created.emit({
-                                        'vm_name': vm.name,
-                                        'vcenter': vcenter,
-                                        'name': snapshot_obj.name,
-                                        'created': format_vmware_time(snapshot_obj.createTime),
-                                        'created_by': created_by,
-                                        'description': snapshot_obj.description or '',
-                                        'snapshot': snapshot_obj,
-                                        'vm': vm,
-                                        'has_children': bool(snapshot_obj.childSnapshotList),
-                                        'is_child': hasattr(snapshot_obj, 'parent') and snapshot_obj.parent is not None
-                                    })
-                                else:
-                                    # If we can't find the snapshot object, just emit the server name
-                                    # This ensures backward compatibility
-                                    self.snapshot_created.emit({'vm_name': server})
-                                
-                                ProgressTracker.emit_progress(
-                                    self.progress, completed, total,
-                                    "Created", f"{(completed/total)*100:.1f}%"
-                                )
-                                del active_tasks[task]
-                            elif task.info.state == vim.TaskInfo.State.error:
-                                failed.append(f"Failed: {server}: {task.info.error.msg}")
-                                del active_tasks[task]
-                            else:
-                                # Show individual task progress
-                                task_progress = task.info.progress or 0
-                                active_count = len(active_tasks)
-                                ProgressTracker.emit_progress(
-                                    self.progress, completed, total,
-                                    "Working", f"{server} ({task_progress}%)"
-                                )
-                        except Exception as e:
-                            failed.append(f"Error monitoring {server}: {str(e)}")
-                            del active_tasks[task]
-                    time.sleep(0.5)
+                if not scheduler.running_count:
+                    continue
+                
+                event = monitor.next_event()
+                vm, server, vcenter = event.context
+                if event.state == vim.TaskInfo.State.success:
+                    scheduler.release(event.context)
+                    completed += 1
+                    self.emit_created_snapshot(vcenter, vm, server, event.result)
+                    ProgressTracker.emit_progress(
+                        self.progress, completed, total,
+                        "Created", f"{(completed/total)*100:.1f}%"
+                    )
+                elif event.state == vim.TaskInfo.State.error:
+                    scheduler.release(event.context)
+                    failed.append(f"Failed: {server}: {event.error}")
+                else:
+                    # Show individual task progress
+                    ProgressTracker.emit_progress(
+                        self.progress, completed, total,
+                        "Working", f"{server} ({event.progress}%)"
+                    )
+        finally:
+            monitor.stop()
 
         # Final status
         if failed:
@@ -176,63 +139,143 @@ class SnapshotCreateWorker(QThread):
         )
         self.finished.emit()
 
-    def find_vm_in_vcenter(self, si, name):
-        """Find VM by name in a specific vCenter"""
-        content = si.RetrieveContent()
-        container = content.viewManager.CreateContainerView(
-            content.rootFolder, [vim.VirtualMachine], True
-        )
-        for vm in container.view:
-            if vm.name.lower() == name.lower():
-                return vm
-        container.Destroy()
-        return None
-
-    def find_vm(self, name):
-        """Find VM by name across all connected vCenters"""
-        for si in self.vcenter_connections.values():
-            vm = self.find_vm_in_vcenter(si, name)
-            if vm:
-                return vm
-        return None
+    def start_snapshot(self, monitor, item, failed):
+        """
+        Start the snapshot task for a scheduled VM and watch it.
         
-    def get_snapshots(self, snapshots):
-        """Helper method to traverse snapshot tree"""
-        result = []
-        for snapshot in snapshots:
-            result.append(snapshot)
-            result.extend(self.get_snapshots(snapshot.childSnapshotList))
-        return result
-    
-    def extract_creator_from_description(self, description):
+        Returns:
+            bool: True if the task was started
         """
-        Extract creator information from snapshot description.
+        vm, server, vcenter = item
+        try:
+            # Add creator information to description using vCenter username
+            description_with_creator = f"{self.description} (Created by: {self.vcenter_username})"
+            
+            task = vm.CreateSnapshot_Task(
+                name=f"Monthly OS Patching",
+                description=description_with_creator,
+                memory=self.memory,
+                quiesce=False
+            )
+            monitor.watch(vcenter, self.vcenter_connections[vcenter], task, item)
+            return True
+        except Exception as e:
+            failed.append(f"Error creating snapshot for {server}: {str(e)}")
+            return False
+
+    def build_vm_index(self, si):
+        """
+        Map lowercase VM names to VMs with one paged PropertyCollector retrieval.
         
-        VMware snapshots don't have a built-in createdBy property,
-        so we look for creator information in the description field.
+        Args:
+            si: vim.ServiceInstance for the vCenter
+            
+        Returns:
+            dict: Lowercase VM name -> (vim.VirtualMachine, dict of VM_PROPERTIES values);
+                the first VM wins on duplicate names
+        """
+        vm_index = {}
+        for vm, properties in iter_container_properties(si, vim.VirtualMachine, self.VM_PROPERTIES):
+            vm_index.setdefault(properties.get('name', '').lower(), (vm, properties))
+        return vm_index
+
+    def build_placement_index(self, vcenter, si):
+        """
+        Map lowercase VM names to VMs and the scheduler resources they use.
         
         Args:
-            description (str): The snapshot description
+            vcenter (str): vCenter hostname (used to namespace MoRef IDs)
+            si: vim.ServiceInstance for the vCenter
             
         Returns:
-            str: The username who created the snapshot, or 'Unknown'
+            dict: Lowercase VM name -> (vim.VirtualMachine, list of (scope, key) resources)
+        """
+        vm_index = self.build_vm_index(si)
+        host_clusters = {
+            host._moId: properties['parent']._moId
+            for host, properties in iter_container_properties(si, vim.HostSystem, ['parent'])
+            if properties.get('parent') is not None
+        }
+        return {
+            name: (vm, self.placement_resources(vcenter, properties, host_clusters))
+            for name, (vm, properties) in vm_index.items()
+        }
+
+    @staticmethod
+    def placement_resources(vcenter, properties, host_clusters):
         """
-        if not description:
-            return 'Unknown'
+        Return the scheduler resources a VM's snapshot occupies.
         
-        import re
+        Args:
+            vcenter (str): vCenter hostname
+            properties (dict): VM_PROPERTIES values for the VM
+            host_clusters (dict): Host MoRef ID -> cluster (compute resource) MoRef ID
+            
+        Returns:
+            list: (scope, key) tuples; keys are prefixed with the vCenter
+        """
+        resources = [('vcenter', vcenter)]
+        host = properties.get('runtime.host')
+        cluster = host_clusters.get(host._moId) if host is not None else None
+        if cluster:
+            resources.append(('cluster', f"{vcenter}:{cluster}"))
+        for datastore in properties.get('datastore') or []:
+            resources.append(('datastore', f"{vcenter}:{datastore._moId}"))
+        return resources
+
+    def emit_created_snapshot(self, vcenter, vm, server, snapshot_ref):
+        """Emit the record for a newly created snapshot (or the server name if it can't be read)"""
+        try:
+            # The task result is the new snapshot's MoRef
+            record = self.build_created_record(vcenter, vm, snapshot_ref)
+        except Exception as e:
+            self.logger.warning(f"Could not read new snapshot on {server}: {str(e)}")
+            record = None
         
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'Created by:\s*(\w+)',
-            r'\(Created by:\s*(\w+)\)',
-            r'User:\s*(\w+)',
-            r'By:\s*(\w+)'
-        ]
+        if record:
+            # Emit the same record type as SnapshotFetchWorker
+            # This enables caching by directly adding to the tree without refetching
+            self.snapshot_created.emit(record)
+        else:
+            # If we can't find the snapshot object, just emit the server name
+            self.snapshot_created.emit(server)
+
+    def build_created_record(self, vcenter, vm, snapshot_ref):
+        """
+        Build the SnapshotRecord for a snapshot this worker just created.
         
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1)
+        Args:
+            vcenter (str): vCenter hostname the VM belongs to
+            vm: vim.VirtualMachine the snapshot was taken of
+            snapshot_ref: vim.vm.Snapshot returned by CreateSnapshot_Task
+            
+        Returns:
+            SnapshotRecord: Record for the new snapshot, or None if it isn't in the VM's tree
+        """
+        snapshot_info = vm.snapshot
+        if not snapshot_info or snapshot_ref is None:
+            return None
         
-        return 'Unknown'
\ No newline at end of file
+        for snapshot, parent in walk_snapshot_tree(snapshot_info.rootSnapshotList):
+            if snapshot.snapshot._moId == snapshot_ref._moId:
+                # Get creator information from description
+                # VMware snapshots don't have a built-in createdBy property
+                created_by = self.extract_creator_from_description(snapshot.description)
+                return SnapshotRecord.from_snapshot_tree(
+                    vcenter, vm._moId, vm.name, snapshot,
+                    is_child=parent is not None,
+                    created_by=created_by
+                )
+        return None
+    
+    def extract_creator_from_description(self, description):
+        """
+        Extract creator information from snapshot description.
+
+        Args:
+            description (str): The snapshot description
+
+        Returns:
+            str: The username who created the snapshot, or 'Unknown'
+        """
+        return extract_creator(description)
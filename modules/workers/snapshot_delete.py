@@ -4,11 +4,14 @@ Snapshot Delete Worker Thread
 This module contains the worker thread for deleting snapshots in bulk.
 """
 
+import logging
 import time
 from PyQt6.QtCore import QThread, pyqtSignal
-from PyQt6.QtWidgets import QTreeWidgetItem
 from pyVmomi import vim
 from ..core import ProgressTracker
+from ..core.property_collector import iter_object_properties
+from ..core.task_monitor import TaskMonitor
+from ..core.task_scheduler import ConcurrencyScheduler, AdaptiveLimiter
 
 
 class SnapshotDeleteWorker(QThread):
@@ -16,70 +19,165 @@ class SnapshotDeleteWorker(QThread):
     progress = pyqtSignal(int, int, str)  # completed, total, message
     finished = pyqtSignal()
     error = pyqtSignal(str)
-    item_complete = pyqtSignal(QTreeWidgetItem)
+    item_complete = pyqtSignal(object)  # snapshot ID
 
-    def __init__(self, items_to_delete):
+    # VM properties used to place deletions on hosts and datastores
+    VM_PROPERTIES = ['runtime.host', 'datastore']
+
+    # Maximum deletions (disk consolidations) in flight per vCenter, host and datastore
+    DEFAULT_LIMITS = {'vcenter': 16, 'host': 4, 'datastore': 2}
+
+    # Datastore limits adapt between 1 and this value based on task durations
+    MAX_DATASTORE_LIMIT = 8
+
+    def __init__(self, vcenter_connections, items_to_delete, limits=None, adaptive=True):
         super().__init__()
-        self.items_to_delete = items_to_delete
+        self.vcenter_connections = vcenter_connections
+        self.items_to_delete = items_to_delete  # [(snapshot_id, SnapshotRecord)]
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.adaptive = adaptive
+        self.logger = logging.getLogger('pySnap')
 
     def run(self):
         total = len(self.items_to_delete)
         completed = 0
-        active_tasks = {}  # Store active deletion tasks
+        task_progress = {}  # Progress of tasks still running, by task MoRef ID
+        started_at = {}  # Start time of running tasks, by task MoRef ID
         
-        # Start all deletion tasks
-        for item, data in self.items_to_delete:
-            try:
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Deleting", f"{data['vm_name']}"
-                )
+        # Queue each deletion with the vCenter, host and datastores it loads
+        scheduler = ConcurrencyScheduler(self.limits)
+        limiter = None
+        if self.adaptive:
+            limiter = AdaptiveLimiter(
+                scheduler, self.limits['datastore'],
+                max(self.limits['datastore'], self.MAX_DATASTORE_LIMIT)
+            )
+        self.schedule_items(scheduler)
+        
+        monitor = TaskMonitor()
+        try:
+            while scheduler.has_work():
+                # Start every deletion that fits the current limits
+                ready = scheduler.take_ready()
+                while ready:
+                    for item in ready:
+                        task = self.start_delete(monitor, item)
+                        if task is None:
+                            scheduler.release(item)
+                        else:
+                            task_progress[task._moId] = 0
+                            started_at[task._moId] = time.monotonic()
+                            ProgressTracker.emit_progress(
+                                self.progress, completed, total,
+                                "Deleting", f"{item[1].vm_name}"
+                            )
+                    # Failed starts free their slots for the next pending items
+                    ready = scheduler.take_ready()
                 
-                # Get the VM and snapshot objects
-                snapshot = data['snapshot']
+                if not scheduler.running_count:
+                    continue
                 
-                # Create deletion task
-                task = snapshot.snapshot.RemoveSnapshot_Task(removeChildren=False)
-                active_tasks[task] = (item, data)
+                # Handle task updates as vCenter reports them
+                event = monitor.next_event()
+                snapshot_id, data, si = event.context
+                task_id = event.task._moId
                 
-            except Exception as e:
-                self.error.emit(f"Error starting deletion of {data['name']}: {str(e)}")
-        
-        # Monitor all tasks until completion
-        while active_tasks:
-            total_progress = 0
-            
-            for task in list(active_tasks.keys()):
-                item, data = active_tasks[task]
-                try:
-                    if task.info.state == vim.TaskInfo.State.success:
-                        self.item_complete.emit(item)
+                if event.is_done:
+                    resources = scheduler.release(event.context)
+                    duration = time.monotonic() - started_at.pop(task_id)
+                    del task_progress[task_id]
+                    
+                    if event.state == vim.TaskInfo.State.success:
+                        self.item_complete.emit(snapshot_id)
                         completed += 1
-                        del active_tasks[task]
-                    elif task.info.state == vim.TaskInfo.State.error:
-                        self.error.emit(f"Failed to delete {data['name']}: {task.info.error.msg}")
-                        del active_tasks[task]
+                        if limiter:
+                            # Slow consolidations mean the datastore is struggling
+                            for resource in resources:
+                                if resource[0] == 'datastore':
+                                    limiter.record(resource, duration)
                     else:
-                        # Task still in progress, add to total progress
-                        task_progress = task.info.progress or 0
-                        total_progress += task_progress
-                except Exception as e:
-                    self.error.emit(f"Error monitoring {data['name']}: {str(e)}")
-                    del active_tasks[task]
-            
-            # Calculate and show overall progress
-            if active_tasks:
-                overall_progress = (completed * 100 + total_progress) / total
-                ProgressTracker.emit_progress(
-                    self.progress, completed, total,
-                    "Deleting", f"{overall_progress:.0f}%"
-                )
-            
-            # Small delay before next check
-            time.sleep(0.5)
+                        self.error.emit(f"Failed to delete {data.name}: {event.error}")
+                else:
+                    # Task still in progress
+                    task_progress[task_id] = event.progress
+                
+                # Calculate and show overall progress
+                if task_progress:
+                    overall_progress = (completed * 100 + sum(task_progress.values())) / total
+                    ProgressTracker.emit_progress(
+                        self.progress, completed, total,
+                        "Deleting", f"{overall_progress:.0f}%"
+                    )
+        finally:
+            monitor.stop()
         
         ProgressTracker.emit_progress(
             self.progress, total, total,
             "Complete", "All deleted"
         )
-        self.finished.emit()
\ No newline at end of file
+        self.finished.emit()
+
+    def schedule_items(self, scheduler):
+        """Queue every snapshot whose vCenter is connected, with its placement resources"""
+        by_vcenter = {}
+        for snapshot_id, data in self.items_to_delete:
+            by_vcenter.setdefault(data.vcenter, []).append((snapshot_id, data))
+        
+        for vcenter, items in by_vcenter.items():
+            si = self.vcenter_connections.get(vcenter)
+            if si is None:
+                for snapshot_id, data in items:
+                    self.error.emit(f"Error starting deletion of {data.name}: Not connected to {vcenter}")
+                continue
+            
+            try:
+                placements = self.vm_placements(vcenter, si, {data.vm_moref for _, data in items})
+            except Exception as e:
+                # Without placement data, only the vCenter limit applies
+                self.logger.warning(f"Could not read VM placement on {vcenter}: {str(e)}")
+                placements = {}
+            
+            for snapshot_id, data in items:
+                resources = [('vcenter', vcenter)] + placements.get(data.vm_moref, [])
+                scheduler.add((snapshot_id, data, si), resources)
+
+    def vm_placements(self, vcenter, si, vm_morefs):
+        """
+        Read the host and datastores of VMs in one PropertyCollector retrieval.
+        
+        Args:
+            vcenter (str): vCenter hostname (used to namespace MoRef IDs)
+            si: vim.ServiceInstance for the vCenter
+            vm_morefs (set): MoRef IDs of the VMs
+            
+        Returns:
+            dict: VM MoRef ID -> list of ('host'|'datastore', key) resources
+        """
+        vms = [vim.VirtualMachine(moref, si._stub) for moref in sorted(vm_morefs)]
+        placements = {}
+        for vm, properties in iter_object_properties(si, vms, vim.VirtualMachine, self.VM_PROPERTIES):
+            resources = []
+            host = properties.get('runtime.host')
+            if host is not None:
+                resources.append(('host', f"{vcenter}:{host._moId}"))
+            for datastore in properties.get('datastore') or []:
+                resources.append(('datastore', f"{vcenter}:{datastore._moId}"))
+            placements[vm._moId] = resources
+        return placements
+
+    def start_delete(self, monitor, item):
+        """
+        Start the removal task for a scheduled snapshot and watch it.
+        
+        Returns:
+            vim.Task: The started task, or None if it could not be started
+        """
+        snapshot_id, data, si = item
+        try:
+            # Rebuild the snapshot reference from its MoRef ID on the owning vCenter
+            task = data.snapshot_ref(si).RemoveSnapshot_Task(removeChildren=False)
+            monitor.watch(data.vcenter, si, task, item)
+            return task
+        except Exception as e:
+            self.error.emit(f"Error starting deletion of {data.name}: {str(e)}")
+            return None
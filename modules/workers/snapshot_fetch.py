@@ -5,97 +5,71 @@ This module contains the worker thread for fetching snapshots from vCenter serve
 """
 
 import logging
-import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from PyQt6.QtCore import QThread, pyqtSignal
 from pyVmomi import vim
 
 
-from ..core import format_vmware_time, ProgressTracker
+from ..core import ProgressTracker
+from ..core.creator_parser import extract_creator
+from ..core.property_collector import iter_container_pages, DEFAULT_PAGE_SIZE
+from ..core.snapshot_record import SnapshotRecord, walk_snapshot_tree
 
 
 class SnapshotFetchWorker(QThread):
     """Worker thread for fetching snapshots"""
     finished = pyqtSignal()
     progress = pyqtSignal(int, int, str)  # completed, total, message
-    snapshot_found = pyqtSignal(dict)
+    snapshots_batch = pyqtSignal(list)  # list of SnapshotRecord
     error = pyqtSignal(str)
+    vcenter_progress = pyqtSignal(str, str)  # hostname, status message
+    vcenter_complete = pyqtSignal(str, float)  # hostname, POSIX time its fetch started
 
-    def __init__(self, vcenter_connections):
+    # Only the VM name and its snapshot tree are needed to build snapshot rows
+    VM_PROPERTIES = ['name', 'snapshot.rootSnapshotList']
+
+    # Upper bound on vCenters fetched concurrently
+    MAX_PARALLEL_VCENTERS = 8
+
+    # Snapshots are delivered to the GUI thread in batches, flushed when either limit is hit
+    BATCH_SIZE = 500
+    BATCH_INTERVAL = 0.1  # seconds
+
+    def __init__(self, vcenter_connections, page_size=DEFAULT_PAGE_SIZE, max_workers=MAX_PARALLEL_VCENTERS):
         super().__init__()
         self.vcenter_connections = vcenter_connections
+        self.page_size = page_size
+        self.max_workers = max(1, max_workers)
+        self.progress_lock = threading.Lock()
+        self.completed_vcenters = 0
+        self.batch_lock = threading.Lock()
+        self.pending_batch = []
+        self.last_flush = time.monotonic()
         self.logger = logging.getLogger('pySnap')
 
     def run(self):
         try:
             total_vcenters = len(self.vcenter_connections)
-            completed_vcenters = 0
+            self.completed_vcenters = 0
             
-            for hostname, si in self.vcenter_connections.items():
-                container = None
-                try:
-                    ProgressTracker.emit_progress(
-                        self.progress, completed_vcenters, total_vcenters,
-                        "Connecting", f"{hostname}"
-                    )
-                    
-                    content = si.RetrieveContent()
-                    container = content.viewManager.CreateContainerView(
-                        content.rootFolder, [vim.VirtualMachine], True
-                    )
-                    self.logger.info(f"Created container view for {hostname}")
-                    
-                    # Count VMs with snapshots for more detailed progress
-                    snapshot_vms = 0
-                    processed_vms = 0
-                    
-                    # First count VMs with snapshots
-                    for vm in container.view:
-                        if vm.snapshot:
-                            snapshot_vms += 1
-                    
-                    if snapshot_vms > 0:
-                        # Now process VMs with progress updates
-                        for vm in container.view:
-                            if vm.snapshot:
-                                processed_vms += 1
-                                ProgressTracker.emit_progress(
-                                    self.progress, processed_vms, snapshot_vms,
-                                    "Processing", f"{vm.name}"
-                                )
-                                
-                                for snapshot in self.get_snapshots(vm.snapshot.rootSnapshotList):
-                                    # Get creator information from snapshot description
-                                    # VMware snapshots don't have a built-in createdBy property
-                                    created_by = self.extract_creator_from_description(snapshot.description)
-                                    
-                                    self.snapshot_found.emit({
-                                        'vm_name': vm.name,
-                                        'vcenter': hostname,
-                                        'name': snapshot.name,
-                                        'created': format_vmware_time(snapshot.createTime),
-                                        'created_by': created_by,
-                                        'description': snapshot.description or '',
-                                        'snapshot': snapshot,
-                                        'vm': vm,
-                                        'has_children': bool(snapshot.childSnapshotList),
-                                        'is_child': hasattr(snapshot, 'parent') and snapshot.parent is not None
-                                    })
-                    
-                    completed_vcenters += 1
-                    
-                except Exception as e:
-                    self.logger.error(f"Error processing vCenter {hostname}: {str(e)}")
-                    self.error.emit(f"Error processing {hostname}: {str(e)}")
-                    
-                finally:
-                    # CRITICAL: Always destroy the container view to prevent resource leaks
-                    if container:
-                        try:
-                            container.Destroy()
-                            self.logger.info(f"Destroyed container view for {hostname}")
-                        except Exception as destroy_error:
-                            self.logger.error(f"Failed to destroy container view for {hostname}: {str(destroy_error)}")
-                            # Don't re-raise - we don't want destroy failure to mask original error
+            if total_vcenters:
+                ProgressTracker.emit_progress(
+                    self.progress, 0, total_vcenters,
+                    "Fetching", f"{total_vcenters} vCenters"
+                )
+                
+                # One worker per ServiceInstance, so total time is set by the slowest vCenter
+                max_workers = min(self.max_workers, total_vcenters)
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='pysnap-fetch') as executor:
+                    futures = [
+                        executor.submit(self.fetch_vcenter_safe, hostname, si, total_vcenters)
+                        for hostname, si in self.vcenter_connections.items()
+                    ]
+                    wait(futures)
+            
+            self.flush_batch()
             
             # Final progress update
             ProgressTracker.emit_progress(
@@ -108,66 +82,118 @@ class SnapshotFetchWorker(QThread):
             self.logger.error(f"Fatal error in snapshot fetch worker: {str(e)}")
             self.error.emit(str(e))
 
-    def get_snapshots(self, snapshots):
-        result = []
-        for snapshot in snapshots:
-            result.append(snapshot)
-            result.extend(self.get_snapshots(snapshot.childSnapshotList))
-        return result
-    
-    def extract_creator_from_description(self, description):
+    def fetch_vcenter_safe(self, hostname, si, total_vcenters):
+        """Fetch a single vCenter on a pool thread, reporting errors instead of raising"""
+        try:
+            self.vcenter_progress.emit(hostname, "Connecting")
+            started = time.time()
+            vm_count, snapshot_count = self.fetch_vcenter(hostname, si)
+            self.logger.info(
+                f"Retrieved {snapshot_count} snapshots from {vm_count} VMs on {hostname}"
+            )
+            self.flush_batch(complete_vcenter=(hostname, started))
+            self.vcenter_progress.emit(hostname, f"Complete ({snapshot_count} snapshots)")
+        except Exception as e:
+            self.logger.error(f"Error processing vCenter {hostname}: {str(e)}")
+            self.vcenter_progress.emit(hostname, "Failed")
+            self.error.emit(f"Error processing {hostname}: {str(e)}")
+        finally:
+            with self.progress_lock:
+                self.completed_vcenters += 1
+                completed = self.completed_vcenters
+            ProgressTracker.emit_progress(
+                self.progress, completed, total_vcenters,
+                "Fetched", f"{hostname}"
+            )
+
+    def fetch_vcenter(self, hostname, si):
         """
-        Extract creator information from snapshot description.
-        VMware snapshots don't have a built-in 'createdBy' property,
-        so we need to parse it from the description field.
+        Fetch every snapshot on a vCenter with paged PropertyCollector calls.
+        
+        Snapshot rows are built entirely from the returned snapshot trees, so no
+        lazy pyVmomi property reads (and no extra round trips) happen per VM.
+        
+        Args:
+            hostname (str): vCenter hostname the connection belongs to
+            si: vim.ServiceInstance for the vCenter
+            
+        Returns:
+            tuple: (number of VMs scanned, number of snapshots emitted)
         """
-        if not description:
-            return 'Unknown'
+        vm_count = 0
+        snapshot_count = 0
         
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'\(Created by:\s*([^)]+)\)',  # (Created by: username)
-            r'Created by:\s*([^\n,;]+)',   # Created by: username
-            r'\[Created by:\s*([^\]]+)\]', # [Created by: username]
-            r'User:\s*([^\n,;]+)',         # User: username
-        ]
+        for page in iter_container_pages(si, vim.VirtualMachine, self.VM_PROPERTIES, self.page_size):
+            for vm, properties in page:
+                root_snapshots = properties.get('snapshot.rootSnapshotList')
+                if not root_snapshots:
+                    continue
+                
+                vm_name = properties.get('name', '')
+                for snapshot, parent in walk_snapshot_tree(root_snapshots):
+                    self.queue_snapshot(self.build_snapshot_data(hostname, vm, vm_name, snapshot, parent))
+                    snapshot_count += 1
+            
+            # Deliver this page's rows before blocking on the next page retrieval
+            self.flush_batch()
+            
+            # Report progress once per retrieved page rather than once per VM
+            vm_count += len(page)
+            self.vcenter_progress.emit(
+                hostname, f"Processing ({vm_count} VMs scanned, {snapshot_count} snapshots)"
+            )
         
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1).strip()
+        return vm_count, snapshot_count
+
+    def queue_snapshot(self, data):
+        """Add a snapshot to the pending batch, flushing when the size or time limit is reached"""
+        with self.batch_lock:
+            self.pending_batch.append(data)
+            if (len(self.pending_batch) < self.BATCH_SIZE
+                    and time.monotonic() - self.last_flush < self.BATCH_INTERVAL):
+                return
+            batch, self.pending_batch = self.pending_batch, []
+            self.last_flush = time.monotonic()
+            # Emit under the lock so batches arrive in the order they were taken
+            self.snapshots_batch.emit(batch)
+
+    def flush_batch(self, complete_vcenter=None):
+        """
+        Emit any snapshots still waiting in the pending batch.
+
+        Args:
+            complete_vcenter (tuple): Optional (hostname, fetch start time) to
+                report with vcenter_complete once every snapshot queued so far
+                has been emitted
+        """
+        with self.batch_lock:
+            batch, self.pending_batch = self.pending_batch, []
+            self.last_flush = time.monotonic()
+            if batch:
+                self.snapshots_batch.emit(batch)
+            if complete_vcenter:
+                self.vcenter_complete.emit(*complete_vcenter)
+
+    def build_snapshot_data(self, hostname, vm, vm_name, snapshot, parent):
+        """Build the SnapshotRecord for a VirtualMachineSnapshotTree node"""
+        # Get creator information from snapshot description
+        # VMware snapshots don't have a built-in createdBy property
+        created_by = self.extract_creator_from_description(snapshot.description)
         
-        return 'Unknown'
-    
+        return SnapshotRecord.from_snapshot_tree(
+            hostname, vm._moId, vm_name, snapshot,
+            is_child=parent is not None,
+            created_by=created_by
+        )
+
     def extract_creator_from_description(self, description):
         """
         Extract creator information from snapshot description.
-        
-        VMware snapshots don't have a built-in createdBy property,
-        so we look for creator information in the description field.
-        
+
         Args:
             description (str): The snapshot description
-            
+
         Returns:
             str: The username who created the snapshot, or 'Unknown'
         """
-        if not description:
-            return 'Unknown'
-        
-        import re
-        
-        # Look for patterns like "Created by: username" or "(Created by: username)"
-        patterns = [
-            r'Created by:\s*(\w+)',
-            r'\(Created by:\s*(\w+)\)',
-            r'User:\s*(\w+)',
-            r'By:\s*(\w+)'
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, description, re.IGNORECASE)
-            if match:
-                return match.group(1)
-        
-        return 'Unknown'
\ No newline at end of file
+        return extract_creator(description)
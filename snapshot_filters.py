@@ -11,9 +11,103 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
 from PyQt6.QtCore import Qt, pyqtSignal, QDate
 from PyQt6.QtGui import QIcon
 from datetime import datetime, timedelta
+from collections import Counter
 import re
 
 
+# (has_children, is_child) flags for each Snapshot Type filter option
+SNAPSHOT_TYPE_FLAGS = {
+    "Independent Snapshot": (False, False),
+    "Has Child Snapshots (Delete Manually)": (True, False),
+    "Child Snapshot": (False, True),
+    "Part of Chain (Middle)": (True, True)
+}
+
+
+class CompiledFilter:
+    """
+    Snapshot filter compiled from a snapshot of the filter panel state.
+    
+    Search terms are lowercased and date bounds converted to ISO strings once,
+    so evaluating a row is a handful of string comparisons.
+    """
+    
+    def __init__(self, filters, patching_only=False):
+        """
+        Compile filter values.
+        
+        Args:
+            filters (dict): Filter values as returned by SnapshotFilterPanel.get_active_filters()
+            patching_only (bool): Only accept snapshots with 'patch' in their name
+        """
+        self.vm_name = filters['vm_name'].lower()
+        self.snapshot_search = filters['snapshot_search'].lower()
+        self.vcenter = filters['vcenter']
+        self.created_by = filters['created_by']
+        self.snapshot_type = SNAPSHOT_TYPE_FLAGS.get(filters['snapshot_type'])
+        # ISO dates compare correctly as strings against the 'YYYY-MM-DD' prefix of 'created'
+        self.date_from = filters['date_from'].isoformat()
+        self.date_to = filters['date_to'].isoformat()
+        self.patching_only = patching_only
+    
+    def matches(self, snapshot_data):
+        """
+        Check if a snapshot matches the compiled filters.
+        
+        Args:
+            snapshot_data (SnapshotRecord): Snapshot to test
+            
+        Returns:
+            bool: True if snapshot matches all filters
+        """
+        # Text filters (case-insensitive contains)
+        if self.vm_name and self.vm_name not in snapshot_data.vm_name.lower():
+            return False
+        
+        snapshot_name = snapshot_data.name.lower()
+        
+        # Combined snapshot name/description search
+        if (self.snapshot_search and self.snapshot_search not in snapshot_name
+                and self.snapshot_search not in snapshot_data.description.lower()):
+            return False
+        
+        # Dropdown filters (exact match)
+        if self.vcenter and self.vcenter != snapshot_data.vcenter:
+            return False
+        
+        if self.created_by and self.created_by != snapshot_data.created_by:
+            return False
+        
+        # Snapshot type filter
+        if self.snapshot_type is not None and self.snapshot_type != (
+                snapshot_data.has_children, snapshot_data.is_child):
+            return False
+        
+        # Date range filter on the 'YYYY-MM-DD' prefix of the display timestamp
+        created_date = snapshot_data.created[:10]
+        if created_date < self.date_from or created_date > self.date_to:
+            return False
+        
+        # Patching filter
+        if self.patching_only and 'patch' not in snapshot_name:
+            return False
+        
+        return True
+    
+    def evaluate(self, snapshots_data):
+        """
+        Evaluate the filters for many snapshots in one pass.
+        
+        Args:
+            snapshots_data (iterable): SnapshotRecord objects
+            
+        Returns:
+            list: One bool per snapshot, True if it matches
+        """
+        matches = self.matches
+        return [matches(snapshot_data) for snapshot_data in snapshots_data]
+
+
 class SnapshotFilterPanel(QWidget):
     """
     A collapsible filter panel for snapshot filtering.
@@ -26,6 +120,12 @@ class SnapshotFilterPanel(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.is_expanded = False
+        
+        # Reference counts of dropdown values, maintained as snapshots are added and removed
+        self.vcenter_counts = Counter()
+        self.creator_counts = Counter()
+        self.dropdowns_dirty = False
+        
         self.setup_ui()
         self.connect_signals()
         
@@ -205,45 +305,89 @@ class SnapshotFilterPanel(QWidget):
         
     def update_dropdown_options(self, snapshots_data):
         """
-        Update dropdown filter options based on available snapshot data.
+        Rebuild dropdown filter options from scratch based on snapshot data.
         
         Args:
-            snapshots_data (dict): Dictionary of snapshot data keyed by snapshot ID
+            snapshots_data (iterable): SnapshotRecord objects
+        """
+        self.reset_dropdown_values()
+        self.add_dropdown_values(snapshots_data)
+        self.refresh_dropdowns()
+    
+    def reset_dropdown_values(self):
+        """Forget all tracked dropdown values (the combo boxes update on the next refresh)"""
+        self.vcenter_counts.clear()
+        self.creator_counts.clear()
+        self.dropdowns_dirty = True
+    
+    def add_dropdown_values(self, snapshots_data):
         """
-        # Get unique values for dropdown filters
-        vcenters = set()
-        creators = set()
+        Count the vCenter and creator of newly added snapshots.
         
-        for snapshot_data in snapshots_data.values():
-            vcenters.add(snapshot_data.get('vcenter', ''))
-            creators.add(snapshot_data.get('created_by', 'Unknown'))
+        Args:
+            snapshots_data (iterable): SnapshotRecord objects that were added
+        """
+        for snapshot_data in snapshots_data:
+            for counts, value in ((self.vcenter_counts, snapshot_data.vcenter),
+                                  (self.creator_counts, snapshot_data.created_by)):
+                counts[value] += 1
+                if counts[value] == 1:
+                    self.dropdowns_dirty = True
+    
+    def remove_dropdown_values(self, snapshots_data):
+        """
+        Release the vCenter and creator of removed snapshots.
         
-        # Update vCenter dropdown
-        current_vcenter = self.vcenter_filter.currentText()
-        self.vcenter_filter.clear()
-        self.vcenter_filter.addItem("All vCenters")
-        for vcenter in sorted(vcenters):
-            if vcenter:  # Only add non-empty values
-                self.vcenter_filter.addItem(vcenter)
+        Args:
+            snapshots_data (iterable): SnapshotRecord objects that were removed
+        """
+        for snapshot_data in snapshots_data:
+            for counts, value in ((self.vcenter_counts, snapshot_data.vcenter),
+                                  (self.creator_counts, snapshot_data.created_by)):
+                if counts[value] <= 1:
+                    del counts[value]
+                    self.dropdowns_dirty = True
+                else:
+                    counts[value] -= 1
+    
+    def refresh_dropdowns(self):
+        """
+        Repopulate the vCenter and Created By dropdowns if their value sets changed.
+        
+        Signals are blocked while the combo boxes are rebuilt; filters_changed is
+        emitted once only if a selected value is no longer available.
+        """
+        if not self.dropdowns_dirty:
+            return
+        self.dropdowns_dirty = False
         
-        # Restore selection if it still exists
-        index = self.vcenter_filter.findText(current_vcenter)
-        if index >= 0:
-            self.vcenter_filter.setCurrentIndex(index)
+        # Update vCenter dropdown
+        vcenters = [vcenter for vcenter in sorted(self.vcenter_counts) if vcenter]  # Only add non-empty values
+        vcenter_changed = self._repopulate_combo(self.vcenter_filter, ["All vCenters"] + vcenters)
         
         # Update Created By dropdown
-        current_creator = self.created_by_filter.currentText()
-        self.created_by_filter.clear()
-        self.created_by_filter.addItem("All Users")
-        for creator in sorted(creators):
-            if creator and creator != 'Unknown':  # Add Unknown at the end
-                self.created_by_filter.addItem(creator)
-        self.created_by_filter.addItem("Unknown")
-        
-        # Restore selection if it still exists
-        index = self.created_by_filter.findText(current_creator)
-        if index >= 0:
-            self.created_by_filter.setCurrentIndex(index)
+        creators = [creator for creator in sorted(self.creator_counts)
+                    if creator and creator != 'Unknown']  # Add Unknown at the end
+        creator_changed = self._repopulate_combo(self.created_by_filter, ["All Users"] + creators + ["Unknown"])
+        
+        if vcenter_changed or creator_changed:
+            self.filters_changed.emit()
+    
+    def _repopulate_combo(self, combo, items):
+        """
+        Replace a combo box's items, restoring the selection if it still exists.
+        
+        Returns:
+            bool: True if the selected text changed
+        """
+        current = combo.currentText()
+        combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(items)
+        index = combo.findText(current)
+        combo.setCurrentIndex(index if index >= 0 else 0)
+        combo.blockSignals(False)
+        return combo.currentText() != current
     
     def get_active_filters(self):
         """
@@ -264,71 +408,31 @@ class SnapshotFilterPanel(QWidget):
             'date_to': self.date_to_filter.date().toPyDate()
         }
     
-    def matches_filters(self, snapshot_data):
+    def compile_filters(self, patching_only=False):
         """
-        Check if a snapshot matches all active filters.
+        Compile the current filter values into a reusable predicate.
         
         Args:
-            snapshot_data (dict): Snapshot data to test
+            patching_only (bool): Only accept snapshots with 'patch' in their name
             
         Returns:
-            bool: True if snapshot matches all filters
+            CompiledFilter: Predicate for the current filter state
         """
-        filters = self.get_active_filters()
-        
-        # Text filters (case-insensitive contains)
-        if filters['vm_name'] and filters['vm_name'].lower() not in snapshot_data.get('vm_name', '').lower():
-            return False
-            
-        # Combined snapshot name/description search
-        if filters['snapshot_search']:
-            search_term = filters['snapshot_search'].lower()
-            snapshot_name = snapshot_data.get('name', '').lower()
-            description = snapshot_data.get('description', '').lower()
-            
-            # Search term must match either snapshot name OR description
-            if search_term not in snapshot_name and search_term not in description:
-                return False
+        return CompiledFilter(self.get_active_filters(), patching_only)
+    
+    def matches_filters(self, snapshot_data):
+        """
+        Check if a snapshot matches all active filters.
         
-        # Dropdown filters (exact match)
-        if filters['vcenter'] and filters['vcenter'] != snapshot_data.get('vcenter', ''):
-            return False
-            
-        if filters['created_by'] and filters['created_by'] != snapshot_data.get('created_by', 'Unknown'):
-            return False
+        Prefer compile_filters() when testing more than one snapshot.
         
-        # Snapshot type filter
-        if filters['snapshot_type']:
-            # Get the snapshot type from the data
-            has_children = snapshot_data.get('has_children', False)
-            is_child = snapshot_data.get('is_child', False)
+        Args:
+            snapshot_data (SnapshotRecord): Snapshot to test
             
-            if has_children and is_child:
-                snapshot_type = "Part of Chain (Middle)"
-            elif has_children:
-                snapshot_type = "Has Child Snapshots (Delete Manually)"
-            elif is_child:
-                snapshot_type = "Child Snapshot"
-            else:
-                snapshot_type = "Independent Snapshot"
-                
-            if filters['snapshot_type'] != snapshot_type:
-                return False
-        
-        # Date range filter
-        try:
-            created_str = snapshot_data.get('created', '')
-            if created_str:
-                # Parse the created date (format: 'YYYY-MM-DD HH:MM')
-                created_date = datetime.strptime(created_str, '%Y-%m-%d %H:%M').date()
-                
-                if created_date < filters['date_from'] or created_date > filters['date_to']:
-                    return False
-        except (ValueError, TypeError):
-            # If date parsing fails, don't filter based on date
-            pass
-        
-        return True
+        Returns:
+            bool: True if snapshot matches all filters
+        """
+        return self.compile_filters().matches(snapshot_data)
     
     def reset_all_filters_to_defaults(self):
         """
@@ -21,7 +21,23 @@ def run_all_tests():
     test_modules = [
         'test_config_manager',
         'test_progress_tracker', 
-        'test_utilities'
+        'test_utilities',
+        'test_snapshot_model',
+        'test_property_collector',
+        'test_snapshot_fetch',
+        'test_snapshot_filters',
+        'test_business_days',
+        'test_snapshot_create',
+        'test_task_monitor',
+        'test_task_scheduler',
+        'test_snapshot_delete',
+        'test_auto_connect',
+        'test_connection_supervisor',
+        'test_encrypted_config_manager',
+        'test_inventory_cache',
+        'test_inventory_watch',
+        'test_confirm_delete',
+        'test_creator_parser'
     ]
     
     suite = unittest.TestSuite()
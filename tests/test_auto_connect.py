@@ -0,0 +1,72 @@
+import os
+import socket
+import sys
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.workers.auto_connect import AutoConnectWorker
+
+
+class FakePassword:
+    def is_empty(self):
+        return False
+
+    def get_password(self):
+        return 'secret'
+
+
+class FakeConfigManager:
+    def get_password(self, hostname, username):
+        return FakePassword()
+
+
+class TestAutoConnectWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_logins_run_concurrently_with_scoped_timeout(self):
+        """Test a slow vCenter doesn't delay the others and no global timeout is set."""
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fake_smart_connect(host, httpConnectionTimeout, **kwargs):
+            with lock:
+                in_flight.append(host)
+                peak.append(len(in_flight))
+            time.sleep(0.2 if host == 'slow' else 0.05)
+            with lock:
+                in_flight.remove(host)
+            if host == 'dead':
+                raise socket.timeout()
+            return f'si-{host}-{httpConnectionTimeout}'
+
+        servers = {'fast': {'username': 'u'}, 'slow': {'username': 'u'}, 'dead': {'username': 'u'}}
+        worker = AutoConnectWorker(servers, FakeConfigManager(), timeout=7)
+        made, errors, latencies = [], [], {}
+        worker.connection_made.connect(lambda hostname, si, creds: made.append((hostname, si)))
+        worker.error.connect(errors.append)
+        worker.connection_latency.connect(latencies.__setitem__)
+
+        with patch('modules.core.connection.SmartConnect', side_effect=fake_smart_connect):
+            worker.run()
+        self.app.processEvents()  # Deliver signals queued from the login threads
+
+        self.assertEqual(max(peak), 3)
+        self.assertEqual(made, [('fast', 'si-fast-7'), ('slow', 'si-slow-7')])  # Emitted as each succeeds
+        self.assertEqual(errors, ["Connection to dead timed out after 7 seconds"])
+        self.assertEqual(sorted(latencies), ['fast', 'slow'])
+        self.assertGreater(latencies['slow'], latencies['fast'])
+        self.assertIsNone(socket.getdefaulttimeout())
+
+
+if __name__ == '__main__':
+    unittest.main()
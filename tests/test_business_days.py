@@ -0,0 +1,80 @@
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime, date, timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.core.utilities import HolidayCalendar, count_business_days, count_business_days_many
+
+
+def loop_business_days(start_date, end_date):
+    """Reference implementation: the original day-by-day loop."""
+    current = start_date
+    business_days = 0
+    while current <= end_date:
+        if current.weekday() < 5:
+            business_days += 1
+        current += timedelta(days=1)
+    return business_days
+
+
+class TestCountBusinessDays(unittest.TestCase):
+    def test_matches_day_loop(self):
+        """Test the closed form agrees with the day-by-day loop."""
+        base = datetime(2024, 3, 4, 9, 30)  # Monday
+        for start_offset in range(0, 14):
+            for length_hours in range(-30, 24 * 45, 7):
+                start = base + timedelta(days=start_offset, hours=start_offset * 5)
+                end = start + timedelta(hours=length_hours)
+                with self.subTest(start=start, end=end):
+                    self.assertEqual(count_business_days(start, end), loop_business_days(start, end))
+
+    def test_known_values(self):
+        """Test a few hand-checked ranges."""
+        friday = datetime(2024, 3, 8, 12, 0)
+        self.assertEqual(count_business_days(friday, friday), 1)
+        self.assertEqual(count_business_days(friday, friday + timedelta(days=3)), 2)  # Fri..Mon
+        self.assertEqual(count_business_days(friday, friday - timedelta(hours=1)), 0)
+        self.assertEqual(count_business_days(friday, friday + timedelta(days=364)), 261)
+
+    def test_holidays_are_excluded(self):
+        """Test weekday holidays in range are subtracted and weekend ones ignored."""
+        calendar = HolidayCalendar(['2024-03-08', '2024-03-09', date(2024, 3, 11), '2024-04-01'])
+        self.assertEqual(len(calendar), 3)  # Saturday dropped
+        friday = datetime(2024, 3, 8, 12, 0)
+        self.assertEqual(count_business_days(friday, friday + timedelta(days=3), calendar), 0)
+
+    def test_many_matches_single(self):
+        """Test vectorized evaluation returns the same results, with None passthrough."""
+        now = datetime(2024, 6, 14, 17, 0)
+        starts = [now - timedelta(days=d, hours=h) for d in range(0, 60, 3) for h in (0, 20)]
+        starts.append(None)
+        expected = [count_business_days(start, now) for start in starts[:-1]] + [None]
+        self.assertEqual(count_business_days_many(starts, now), expected)
+
+
+class TestHolidayCalendar(unittest.TestCase):
+    def test_from_ics(self):
+        """Test all-day and timed DTSTART lines are parsed."""
+        ics = ("BEGIN:VCALENDAR\r\nBEGIN:VEVENT\r\nDTSTART;VALUE=DATE:20241225\r\nEND:VEVENT\r\n"
+               "BEGIN:VEVENT\r\nDTSTART:20241226T000000Z\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n")
+        calendar = HolidayCalendar.from_ics(ics)
+        self.assertEqual(calendar.count_between(date(2024, 12, 1).toordinal(), date(2024, 12, 31).toordinal()), 2)
+
+    def test_from_setting(self):
+        """Test the setting accepts date lists and .ics paths."""
+        self.assertEqual(len(HolidayCalendar.from_setting('')), 0)
+        self.assertEqual(len(HolidayCalendar.from_setting('2024-12-25, 2024-12-26')), 2)
+
+        with tempfile.NamedTemporaryFile('w', suffix='.ics', delete=False) as ics_file:
+            ics_file.write("BEGIN:VEVENT\nDTSTART;VALUE=DATE:20240101\nEND:VEVENT\n")
+        try:
+            self.assertEqual(len(HolidayCalendar.from_setting(ics_file.name)), 1)
+        finally:
+            os.unlink(ics_file.name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication, QModelIndex
+from modules.core.snapshot_record import SnapshotRecord
+from modules.dialogs.confirm_delete import (DeletionSummaryModel, age_bucket, age_bucket_label,
+                                            FETCH_CHUNK_SIZE)
+
+
+def make_item(i, vcenter='vc1'):
+    data = SnapshotRecord(vcenter=vcenter, vm_name=f'vm{i}', name=f'snap{i}', created_ts=0.0,
+                          created='2024-01-15 10:30', snapshot_moref=f'snapshot-{i}')
+    return data.key, data
+
+
+class TestAgeBuckets(unittest.TestCase):
+    def test_buckets_and_labels(self):
+        """Test ages map to buckets with readable, non-overlapping labels."""
+        self.assertEqual([age_bucket(age) for age in (None, 0, 5, 6, 20, 21, 60, 61)],
+                         [-1, 0, 0, 1, 1, 2, 2, 3])
+        self.assertEqual([age_bucket_label(bucket, 'business days') for bucket in (-1, 0, 1, 3)],
+                         ['Unknown age', '0-5 business days', '6-20 business days', 'Over 60 business days'])
+
+
+class TestDeletionSummaryModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_groups_and_totals(self):
+        """Test the selection is grouped by vCenter and age, oldest first, with totals."""
+        items = [make_item(i, 'vc2' if i % 2 else 'vc1') for i in range(6)]
+        ages = [1, 90, 30, 2, None, 90]
+
+        model = DeletionSummaryModel(items, ages, 'business days')
+
+        groups = [model.index(row, 0).data() for row in range(model.rowCount())]
+        self.assertEqual(groups, [
+            'vc1 - 21-60 business days (1 snapshot)',
+            'vc1 - 0-5 business days (1 snapshot)',
+            'vc1 - Unknown age (1 snapshot)',
+            'vc2 - Over 60 business days (2 snapshots)',
+            'vc2 - 0-5 business days (1 snapshot)',
+        ])
+        self.assertEqual(model.summary_text(),
+                         'You are about to delete 6 snapshots on 2 vCenters.\n'
+                         'The oldest is 90 business days old.')
+
+    def test_snapshot_rows_are_fetched_lazily(self):
+        """Test a group exposes its snapshot rows a chunk at a time."""
+        count = FETCH_CHUNK_SIZE + 50
+        model = DeletionSummaryModel([make_item(i) for i in range(count)], [3] * count, 'business days')
+        group = model.index(0, 0)
+
+        self.assertTrue(model.hasChildren(group))
+        self.assertEqual(model.rowCount(group), 0)
+        self.assertTrue(model.canFetchMore(group))
+
+        model.fetchMore(group)
+        self.assertEqual(model.rowCount(group), FETCH_CHUNK_SIZE)
+        model.fetchMore(group)
+        self.assertEqual(model.rowCount(group), count)
+        self.assertFalse(model.canFetchMore(group))
+
+        row = model.index(count - 1, 3, group)
+        self.assertEqual(model.parent(row).row(), 0)
+        self.assertEqual(row.siblingAtColumn(0).data(), f'vm{count - 1}')
+        self.assertEqual(row.data(), '3 business days')
+        self.assertFalse(model.parent(group).isValid())
+        self.assertEqual(model.rowCount(row), 0)
+        self.assertFalse(model.canFetchMore(QModelIndex()))
+
+
+if __name__ == '__main__':
+    unittest.main()
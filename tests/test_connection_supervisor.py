@@ -0,0 +1,204 @@
+import os
+import sys
+import time
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.core.connection import attach_session
+from modules.workers.connection_supervisor import ConnectionSupervisor
+
+
+class FakeStub:
+    def __init__(self, session_id):
+        self.session_id = session_id
+
+    def GetSessionId(self):
+        return self.session_id
+
+
+class FakeServiceInstance:
+    """Service instance whose keepalive reads content.sessionManager.currentSession"""
+
+    def __init__(self, name, alive=True, expired=False, delay=0.0):
+        self.name = name
+        self.alive = alive
+        self.expired = expired
+        self.delay = delay
+        self.probes = 0
+        self._stub = FakeStub(f'cookie-{name}')
+
+    @property
+    def content(self):
+        self.probes += 1
+        time.sleep(self.delay)
+        if not self.alive:
+            raise ConnectionError(f"{self.name} is gone")
+        session = None if self.expired else 'session'
+        return SimpleNamespace(sessionManager=SimpleNamespace(currentSession=session))
+
+
+CREDENTIALS = {'username': 'u', 'password': object(), 'verify_ssl': False}
+
+
+class TestConnectionSupervisor(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def make_supervisor(self, **kwargs):
+        supervisor = ConnectionSupervisor(**kwargs)
+        self.events = []
+        supervisor.health_changed.connect(lambda h, ok, detail: self.events.append(('health', h, ok, detail)))
+        supervisor.reconnected.connect(lambda h, si: self.events.append(('reconnected', h, si.name)))
+        supervisor.connection_lost.connect(lambda h, reason: self.events.append(('lost', h)))
+        return supervisor
+
+    def test_healthy_probe_emits_nothing(self):
+        """Test a healthy session stays quiet and is rescheduled."""
+        supervisor = self.make_supervisor(keepalive_interval=60)
+        si = FakeServiceInstance('vc1')
+        supervisor.add_session('vc1', si, CREDENTIALS)
+        supervisor.check('vc1')
+
+        self.assertEqual(si.probes, 1)
+        self.assertEqual(self.events, [])
+        self.assertEqual(supervisor.health('vc1'), (True, 'Connected'))
+        self.assertGreater(supervisor.seconds_until_next_check(time.monotonic()), 50)
+
+    def test_unreachable_session_is_reattached(self):
+        """Test a transport failure re-attaches the same session instead of logging in."""
+        supervisor = self.make_supervisor()
+        supervisor.add_session('vc1', FakeServiceInstance('old', alive=False), CREDENTIALS)
+
+        with patch('modules.workers.connection_supervisor.attach_session',
+                   return_value=FakeServiceInstance('reattached')) as attach, \
+                patch('modules.workers.connection_supervisor.connect_vcenter') as connect:
+            supervisor.check('vc1')
+
+        attach.assert_called_once_with('vc1', 'cookie-old', False, supervisor.timeout)
+        connect.assert_not_called()
+        self.assertEqual(self.events, [('reconnected', 'vc1', 'reattached')])
+        self.assertEqual(supervisor.health('vc1'), (True, 'Session re-attached'))
+        self.assertEqual(supervisor.sessions['vc1'].session_id, 'cookie-reattached')
+
+    def test_expired_session_logs_in_again(self):
+        """Test an expired session skips re-attaching and logs in."""
+        supervisor = self.make_supervisor()
+        supervisor.add_session('vc1', FakeServiceInstance('old', expired=True), CREDENTIALS)
+
+        with patch('modules.workers.connection_supervisor.attach_session') as attach, \
+                patch('modules.workers.connection_supervisor.connect_vcenter',
+                      return_value=FakeServiceInstance('new')) as connect:
+            supervisor.check('vc1')
+
+        attach.assert_not_called()
+        connect.assert_called_once_with('vc1', 'u', CREDENTIALS['password'], False, supervisor.timeout)
+        self.assertEqual(self.events, [('reconnected', 'vc1', 'new')])
+        self.assertEqual(supervisor.sessions['vc1'].si.name, 'new')
+
+    def test_failed_reattach_falls_back_to_login(self):
+        """Test a session the server no longer knows is replaced by a login."""
+        supervisor = self.make_supervisor()
+        supervisor.add_session('vc1', FakeServiceInstance('old', alive=False), CREDENTIALS)
+
+        with patch('modules.workers.connection_supervisor.attach_session', return_value=None), \
+                patch('modules.workers.connection_supervisor.connect_vcenter',
+                      return_value=FakeServiceInstance('new')):
+            supervisor.check('vc1')
+
+        self.assertEqual(supervisor.health('vc1'), (True, 'Logged in again'))
+
+    def test_reconnect_failures_back_off(self):
+        """Test failed reconnects report unhealthy and wait longer each time."""
+        supervisor = self.make_supervisor(backoff_base=10, backoff_max=35)
+        supervisor.add_session('vc1', FakeServiceInstance('old', alive=False), CREDENTIALS)
+
+        delays = []
+        with patch('modules.workers.connection_supervisor.attach_session', side_effect=OSError('refused')), \
+                patch('modules.workers.connection_supervisor.connect_vcenter', side_effect=OSError('refused')):
+            for _ in range(4):
+                supervisor.take_due(float('inf'))
+                supervisor.check('vc1')
+                delays.append(supervisor.sessions['vc1'].next_check - time.monotonic())
+
+        self.assertEqual(supervisor.health('vc1'), (False, 'Reconnect failed: refused'))
+        self.assertEqual(self.events[0], ('health', 'vc1', False, 'Reconnect failed: refused'))
+        for delay, base in zip(delays, [10, 20, 35, 35]):
+            self.assertTrue(0.75 * base <= delay <= 1.2 * base, (delay, base))
+
+    def test_expired_session_without_credentials_is_dropped(self):
+        """Test an expired session that cannot log in again is reported lost."""
+        supervisor = self.make_supervisor()
+        supervisor.add_session('vc1', FakeServiceInstance('old', expired=True), None)
+        supervisor.check('vc1')
+
+        self.assertEqual(self.events, [('lost', 'vc1')])
+        self.assertNotIn('vc1', supervisor.sessions)
+
+    def test_probes_run_concurrently(self):
+        """Test a slow vCenter doesn't hold up probes of the others."""
+        supervisor = self.make_supervisor(keepalive_interval=60)
+        sessions = {f'vc{i}': FakeServiceInstance(f'vc{i}', delay=0.3) for i in range(4)}
+        sessions['down'] = FakeServiceInstance('down', expired=True)
+        for hostname, si in sessions.items():
+            supervisor.add_session(hostname, si, None)
+
+        started = time.monotonic()
+        supervisor.start()
+        supervisor.request_probe()
+        while 'down' in supervisor.sessions and time.monotonic() - started < 5:
+            time.sleep(0.01)
+        while any(s.checking for s in list(supervisor.sessions.values())) and time.monotonic() - started < 5:
+            time.sleep(0.01)
+        elapsed = time.monotonic() - started
+        supervisor.stop()
+        self.assertTrue(supervisor.wait(2000))
+        self.app.processEvents()  # Deliver signals queued from the probe threads
+
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(self.events, [('lost', 'down')])
+        self.assertTrue(all(si.probes == 1 for si in sessions.values()))
+
+    def test_removed_session_ignores_late_reconnect(self):
+        """Test a session cleared while logging in is not resurrected."""
+        supervisor = self.make_supervisor()
+        supervisor.add_session('vc1', FakeServiceInstance('old', expired=True), CREDENTIALS)
+
+        def slow_login(*args):
+            supervisor.clear()
+            return FakeServiceInstance('new')
+
+        with patch('modules.workers.connection_supervisor.connect_vcenter', side_effect=slow_login):
+            supervisor.check('vc1')
+
+        self.assertEqual(self.events, [])
+        self.assertEqual(supervisor.health('vc1'), (False, 'Not connected'))
+
+
+class TestAttachSession(unittest.TestCase):
+    def test_attach_reuses_cookie_without_login(self):
+        """Test re-attaching passes the session cookie and checks it is still valid."""
+        with patch('modules.core.connection.SmartConnect',
+                   return_value=FakeServiceInstance('vc1')) as smart_connect:
+            si = attach_session('vc1', 'cookie', timeout=3)
+
+        self.assertEqual(si.name, 'vc1')
+        kwargs = smart_connect.call_args.kwargs
+        self.assertEqual((kwargs['sessionId'], kwargs['httpConnectionTimeout']), ('cookie', 3))
+        self.assertNotIn('user', kwargs)
+
+    def test_attach_to_expired_session_returns_none(self):
+        """Test a cookie the server no longer knows is reported as unusable."""
+        with patch('modules.core.connection.SmartConnect',
+                   return_value=FakeServiceInstance('vc1', expired=True)):
+            self.assertIsNone(attach_session('vc1', 'cookie'))
+
+
+if __name__ == '__main__':
+    unittest.main()
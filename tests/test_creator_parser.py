@@ -0,0 +1,87 @@
+import os
+import random
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.core.creator_parser import CreatorParser, DEFAULT_RULES, extract_creator
+
+
+def sequential_search(description):
+    """The rule-by-rule search the parser replaces."""
+    if not description:
+        return 'Unknown'
+    for pattern in DEFAULT_RULES:
+        match = re.search(pattern, description, re.IGNORECASE)
+        if match:
+            return match.group(1)
+    return 'Unknown'
+
+
+class TestCreatorParser(unittest.TestCase):
+    def setUp(self):
+        self.parser = CreatorParser()
+
+    def test_patterns(self):
+        """Test the supported description formats."""
+        cases = {
+            "Created by: admin": "admin",
+            "Backup snapshot (Created by: jsmith)": "jsmith",
+            "created BY: Operator": "Operator",
+            "User: guest - nightly": "guest",
+            "Taken By: svc_backup": "svc_backup",
+            "Created by: user@domain.com": "user",
+            "Created by:": "Unknown",
+            "Routine maintenance": "Unknown",
+            "": "Unknown",
+            None: "Unknown",
+        }
+        for description, creator in cases.items():
+            with self.subTest(description=description):
+                self.assertEqual(self.parser.parse(description), creator)
+
+    def test_rule_priority_beats_position(self):
+        """Test a higher-priority rule wins even when a lower one matches earlier."""
+        self.assertEqual(self.parser.parse("Created by: admin, also mentions User: guest"), "admin")
+        self.assertEqual(self.parser.parse("User: guest, Created by: admin"), "admin")
+        self.assertEqual(self.parser.parse("User: Created by: bob"), "bob")
+
+    def test_matches_sequential_search(self):
+        """Test random descriptions parse exactly as the rules searched one by one."""
+        rng = random.Random(7)
+        fragments = ['Created by:', 'created by: ', '(Created by: ', 'User:', 'user: ', 'By:', ' by ',
+                     'admin', 'jsmith', ')', ', ', '\n', '@corp', '  ', 'x']
+        for _ in range(2000):
+            description = ''.join(rng.choice(fragments) for _ in range(rng.randint(0, 8)))
+            self.assertEqual(self.parser.parse(description), sequential_search(description), description)
+
+    def test_repeated_descriptions_are_cached(self):
+        """Test a repeated description is parsed once."""
+        for _ in range(1000):
+            self.parser.parse("Pre-patch (Created by: jsmith)")
+        info = self.parser.parse.cache_info()
+        self.assertEqual((info.misses, info.hits), (1, 999))
+
+    def test_add_rule(self):
+        """Test added rules take their priority and clear cached results."""
+        self.assertEqual(self.parser.parse("Owner=alice User: bob"), "bob")
+        self.parser.add_rule(r'Owner=(\w+)', priority=0)
+        self.assertEqual(self.parser.parse("Owner=alice User: bob"), "alice")
+        self.parser.add_rule(r'Requested for (\w+)')
+        self.assertEqual(self.parser.rules[-1], r'Requested for (\w+)')
+        self.assertEqual(self.parser.parse("Requested for carol"), "carol")
+
+    def test_rule_without_group_rejected(self):
+        """Test a rule that captures nothing is refused."""
+        with self.assertRaises(ValueError):
+            CreatorParser(rules=[r'Created by:\s*\w+'])
+
+    def test_shared_parser(self):
+        """Test the module-level helper uses the default rules."""
+        self.assertEqual(extract_creator("Created by: admin"), "admin")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,281 @@
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptography.fernet import Fernet
+from encrypted_config_manager import EncryptedConfigManager
+from secure_password import SecurePassword
+
+
+class FakeKeyring:
+    """In-memory keyring that counts lookups"""
+
+    def __init__(self):
+        self.entries = {}
+        self.get_calls = 0
+
+    def get_password(self, service, key):
+        self.get_calls += 1
+        return self.entries.get((service, key))
+
+    def set_password(self, service, key, value):
+        self.entries[(service, key)] = value
+
+
+class ConfigManagerTestCase(unittest.TestCase):
+    """Runs each test against a temporary database and a fake keyring"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.keyring = FakeKeyring()
+        patchers = [
+            patch('encrypted_config_manager.keyring', self.keyring),
+            patch.object(EncryptedConfigManager, '_get_db_path',
+                         return_value=os.path.join(self.temp_dir, 'config.db')),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = EncryptedConfigManager()
+        self.addCleanup(self.manager.close)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+
+class TestKeyCache(ConfigManagerTestCase):
+    def test_key_is_read_from_keyring_once(self):
+        """Test many config operations share one keyring lookup."""
+        self.manager.save_servers({f'vc{i}.example.com': {'username': 'admin'} for i in range(20)})
+        self.manager.save_password('vc1.example.com', 'admin', SecurePassword('secret'))
+        self.keyring.get_calls = 0
+
+        servers = self.manager.get_servers()
+        self.manager.get_setting('missing')
+        self.manager.save_setting('theme', 'dark')
+
+        self.assertEqual(len(servers), 20)
+        self.assertEqual(self.manager.get_setting('theme'), 'dark')
+        self.assertEqual(self.keyring.get_calls, 0)
+
+    def test_clear_sensitive_data_zeroes_key(self):
+        """Test clearing zeroes the cached key and the next operation reloads it."""
+        self.manager.save_setting('theme', 'dark')
+        key = self.manager._key
+        self.assertTrue(any(key))
+
+        self.manager.clear_sensitive_data()
+
+        self.assertEqual(key, bytearray(len(key)))
+        self.assertIsNone(self.manager._fernet)
+        self.keyring.get_calls = 0
+        self.assertEqual(self.manager.get_setting('theme'), 'dark')
+        self.assertEqual(self.keyring.get_calls, 1)
+
+    def test_replaced_keyring_key_is_picked_up(self):
+        """Test a key replaced in the keyring invalidates the cached cipher."""
+        self.manager._get_cipher()
+        key_name = (self.manager.keyring_service, 'database_encryption_key')
+        new_key = Fernet.generate_key()
+        self.keyring.set_password(*key_name, new_key.decode('utf-8'))
+
+        token = Fernet(new_key).encrypt(b'value')
+
+        self.assertEqual(self.manager._decrypt_data(token), 'value')
+        self.assertEqual(bytes(self.manager._key), new_key)
+
+
+class TestBlindIndex(ConfigManagerTestCase):
+    def test_save_server_updates_existing_row(self):
+        """Test saving a known server updates it instead of inserting a duplicate."""
+        self.manager.save_server('vc1.example.com', 'admin', verify_ssl=False)
+        self.manager.save_server('vc1.example.com', 'admin', verify_ssl=True, password=SecurePassword('pw'))
+
+        servers = self.manager.get_servers()
+        self.assertEqual(len(servers), 1)
+        self.assertTrue(servers[0]['verify_ssl'])
+        self.assertEqual(servers[0]['password'].get_password(), 'pw')
+
+    def test_point_lookups(self):
+        """Test lookups by hostname and username find the matching row only."""
+        self.manager.save_password('vc1.example.com', 'admin', SecurePassword('one'))
+        self.manager.save_password('vc1.example.com', 'other', SecurePassword('two'))
+        self.manager.save_password('vc2.example.com', 'admin', SecurePassword('three'))
+
+        self.assertEqual(self.manager.get_password('vc1.example.com', 'other').get_password(), 'two')
+        self.assertIsNone(self.manager.get_password('vc3.example.com', 'admin'))
+        self.assertEqual(self.manager.get_server('vc2.example.com')['username'], 'admin')
+
+        self.manager.delete_password('vc1.example.com', 'admin')
+        self.assertIsNone(self.manager.get_password('vc1.example.com', 'admin'))
+
+        self.manager.delete_server('vc1.example.com')
+        self.assertEqual([s['hostname'] for s in self.manager.get_servers()], ['vc2.example.com'])
+
+    def test_lookup_uses_index(self):
+        """Test password lookups are answered from the blind index."""
+        conn = self.manager._get_connection()
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT password FROM servers WHERE hostname_index = ? AND username_index = ?",
+            ('a', 'b')
+        ).fetchall()
+        conn.close()
+        self.assertIn('idx_servers_lookup', ' '.join(str(row[-1]) for row in plan))
+
+    def test_existing_rows_are_backfilled(self):
+        """Test rows written before blind indexes existed become searchable."""
+        key = self.keyring.entries[(self.manager.keyring_service, 'database_encryption_key')]
+        fernet = Fernet(key.encode('utf-8'))
+        conn = sqlite3.connect(self.manager.db_path)
+        conn.execute("DROP TABLE servers")
+        conn.execute("""
+            CREATE TABLE servers (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                hostname TEXT NOT NULL UNIQUE,
+                username TEXT NOT NULL,
+                password TEXT,
+                verify_ssl BOOLEAN DEFAULT 0,
+                display_order INTEGER DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        conn.execute("INSERT INTO servers (hostname, username, password) VALUES (?, ?, ?)",
+                     (fernet.encrypt(b'old.example.com'), fernet.encrypt(b'admin'), fernet.encrypt(b'pw')))
+        conn.commit()
+        conn.close()
+
+        manager = EncryptedConfigManager()
+        self.addCleanup(manager.close)
+
+        self.assertEqual(manager.get_password('old.example.com', 'admin').get_password(), 'pw')
+        manager.save_server('old.example.com', 'admin', verify_ssl=True)
+        self.assertEqual(len(manager.get_servers()), 1)
+
+
+class TestSharedConnection(ConfigManagerTestCase):
+    def test_connection_is_reused_in_wal_mode(self):
+        """Test operations share one WAL-mode connection."""
+        conn = self.manager._get_connection()
+        self.manager.save_setting('theme', 'dark')
+        self.manager.get_setting('theme')
+
+        self.assertIs(self.manager._get_connection(), conn)
+        self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+
+    def test_startup_does_not_rewrite_config(self):
+        """Test reopening the database leaves unchanged config rows alone."""
+        conn = self.manager._get_connection()
+        before = conn.execute("SELECT key, value, updated_at FROM config ORDER BY key").fetchall()
+        self.manager.close()
+
+        self.manager = EncryptedConfigManager()
+        self.addCleanup(self.manager.close)
+        conn = self.manager._get_connection()
+        after = conn.execute("SELECT key, value, updated_at FROM config ORDER BY key").fetchall()
+
+        self.assertEqual([tuple(row) for row in after], [tuple(row) for row in before])
+
+    def test_settings_from_worker_threads(self):
+        """Test settings can be written and read from several threads at once."""
+        errors = []
+
+        def worker(n):
+            try:
+                for i in range(20):
+                    self.manager.save_setting(f'key{n}', str(i), 'int')
+                    self.assertEqual(self.manager.get_setting(f'key{n}'), i)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(self.manager.get_all_settings(), {f'key{n}': 19 for n in range(4)})
+
+    def test_failed_transaction_rolls_back(self):
+        """Test a failing block leaves the database unchanged."""
+        with self.assertRaises(RuntimeError):
+            with self.manager._transaction() as conn:
+                conn.execute("INSERT INTO settings (key, value) VALUES ('partial', 'x')")
+                raise RuntimeError('boom')
+
+        self.assertIsNone(self.manager.get_setting('partial'))
+
+
+class TestSaveServers(ConfigManagerTestCase):
+    def rows(self):
+        conn = self.manager._get_connection()
+        return {row['id']: tuple(row) for row in conn.execute(
+            "SELECT id, hostname, password, verify_ssl, updated_at FROM servers")}
+
+    def test_only_changed_rows_are_written(self):
+        """Test adding a server leaves the other rows and their passwords untouched."""
+        self.manager.save_servers({'vc1': {'username': 'admin'}, 'vc2': 'admin', 'vc3': {'username': 'ops'}})
+        self.manager.save_password('vc1', 'admin', SecurePassword('pw'))
+        before = self.rows()
+
+        self.manager.save_servers({
+            'vc1': {'username': 'admin'},  # unchanged
+            'vc2': {'username': 'admin', 'verify_ssl': True},  # updated
+            'vc4': {'username': 'admin'},  # added; vc3 removed
+        })
+        after = self.rows()
+
+        vc1_id = next(s['id'] for s in self.manager.get_servers() if s['hostname'] == 'vc1')
+        self.assertEqual(after[vc1_id], before[vc1_id])
+        self.assertEqual(len(after), 3)
+        self.assertEqual(self.manager.get_password('vc1', 'admin').get_password(), 'pw')
+        self.assertEqual(self.manager.load_servers(), {
+            'vc1': {'username': 'admin', 'verify_ssl': False},
+            'vc2': {'username': 'admin', 'verify_ssl': True},
+            'vc4': {'username': 'admin', 'verify_ssl': False},
+        })
+
+    def test_changing_username_replaces_row(self):
+        """Test a server saved under a new username drops the old login."""
+        self.manager.save_servers({'vc1': 'admin'})
+        self.manager.save_password('vc1', 'admin', SecurePassword('pw'))
+
+        self.manager.save_servers({'vc1': 'ops'})
+
+        self.assertIsNone(self.manager.get_password('vc1', 'admin'))
+        self.assertEqual(self.manager.load_servers(), {'vc1': {'username': 'ops', 'verify_ssl': False}})
+
+    def test_removed_hostnames_are_reported(self):
+        """Test listeners get the lookup keys of hostnames that are no longer saved."""
+        removed = []
+        self.manager.add_server_removed_listener(removed.append)
+        self.manager.save_servers({'vc1': 'admin', 'vc2': 'admin', 'vc3': 'admin'})
+
+        self.manager.save_servers({'vc1': 'ops', 'vc2': 'admin'})  # vc1 is still saved
+        self.manager.delete_server('vc2')
+        self.manager.delete_server('missing')
+
+        self.assertEqual(removed, [[self.manager.lookup_key('vc3')], [self.manager.lookup_key('vc2')]])
+
+    def test_failure_leaves_servers_unchanged(self):
+        """Test an error part way through rolls the whole save back."""
+        self.manager.save_servers({'vc1': 'admin', 'vc2': 'admin'})
+        before = self.rows()
+
+        with patch.object(self.manager, '_insert_server', side_effect=RuntimeError('disk full')):
+            with self.assertRaises(Exception):
+                self.manager.save_servers({'vc1': 'admin', 'vc3': 'admin'})
+
+        self.assertEqual(self.rows(), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
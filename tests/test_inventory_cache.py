@@ -0,0 +1,111 @@
+import hashlib
+import hmac
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cryptography.fernet import Fernet
+from modules.core.inventory_cache import InventoryCache
+from modules.core.snapshot_record import SnapshotRecord
+
+
+class FakeConfigManager:
+    """Provides the encryption interface of EncryptedConfigManager with a throwaway key"""
+
+    def __init__(self):
+        self.key = Fernet.generate_key()
+
+    def encrypt_bytes(self, data):
+        return Fernet(self.key).encrypt(data)
+
+    def decrypt_bytes(self, token):
+        return Fernet(self.key).decrypt(token)
+
+    def lookup_key(self, value):
+        return hmac.new(self.key, value.encode('utf-8'), hashlib.sha256).hexdigest()
+
+
+def make_record(vcenter, vm_name):
+    return SnapshotRecord(vcenter=vcenter, vm_name=vm_name, name='Patching',
+                          created_ts=1700000000.0, created='2023-11-14 22:13', created_by='admin')
+
+
+class TestInventoryCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'inventory.db')
+        self.config = FakeConfigManager()
+        self.cache = InventoryCache(self.path, self.config)
+
+    def tearDown(self):
+        self.cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip(self):
+        """Test saved inventories load back per vCenter and survive reopening."""
+        vc1 = [make_record('vc1', f'vm{i}') for i in range(3)]
+        self.cache.save_vcenter('vc1', vc1, 100.0)
+        self.cache.save_vcenter('vc2', [make_record('vc2', 'db01')], 200.0)
+        self.cache.save_vcenter('vc1', vc1[:2], 300.0)  # Replaces the earlier entry
+        self.cache.close()
+
+        self.cache = InventoryCache(self.path, self.config)
+        inventory = self.cache.load()
+
+        self.assertEqual(inventory['vc1'], (300.0, vc1[:2]))
+        self.assertEqual(inventory['vc2'][1][0].vm_name, 'db01')
+
+        self.cache.remove_vcenter('vc2')
+        self.assertEqual(list(self.cache.load()), ['vc1'])
+
+    def test_remove_vcenter(self):
+        """Test removed vCenters are purged by hostname or by lookup key."""
+        for vcenter in ('vc1', 'vc2', 'vc3'):
+            self.cache.save_vcenter(vcenter, [make_record(vcenter, 'web01')], 100.0)
+
+        self.cache.remove_vcenter('vc1')
+        self.cache.remove_vcenter_keys([self.config.lookup_key('vc3')])
+
+        self.assertEqual(list(self.cache.load()), ['vc2'])
+
+    def test_nothing_readable_is_stored(self):
+        """Test hostnames and VM names are not stored in plain text."""
+        self.cache.save_vcenter('vc1.example.com', [make_record('vc1.example.com', 'secret-vm')], 100.0)
+
+        with open(self.path, 'rb') as f:
+            contents = f.read()
+        conn = sqlite3.connect(self.path)
+        rows = conn.execute("SELECT vcenter_key, payload FROM inventory").fetchall()
+        conn.close()
+
+        for row in rows:
+            self.assertNotIn('vc1.example.com', str(row))
+        self.assertNotIn(b'secret-vm', contents)
+
+    def test_unreadable_entry_is_skipped(self):
+        """Test entries encrypted with another key are ignored."""
+        self.cache.save_vcenter('vc1', [make_record('vc1', 'vm1')], 100.0)
+        self.cache.config_manager = FakeConfigManager()  # As if the database key was replaced
+        self.cache.save_vcenter('vc2', [make_record('vc2', 'vm2')], 200.0)
+
+        self.assertEqual(list(self.cache.load()), ['vc2'])
+
+    def test_records_from_older_layout(self):
+        """Test records saved with a different field list still decode."""
+        document = {
+            'fields': ['vcenter', 'vm_name', 'name', 'created_ts', 'created', 'retired_field'],
+            'records': [['vc1', 'vm1', 'Patching', 1700000000.0, '2023-11-14 22:13', 'x']]
+        }
+        record, = InventoryCache.decode_records(document)
+
+        self.assertEqual((record.vcenter, record.vm_name, record.name), ('vc1', 'vm1', 'Patching'))
+        self.assertEqual(record.created_by, 'Unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,227 @@
+import os
+import queue
+import sys
+import time
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import QCoreApplication
+from pyVmomi import vim
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.core.inventory_watch import InventoryWatch
+from modules.core.snapshot_record import SnapshotRecord
+from modules.workers.live_inventory import LiveInventoryWorker
+
+
+def make_tree(moref, name, children=()):
+    """Build a VirtualMachineSnapshotTree node."""
+    return vim.vm.SnapshotTree(
+        name=name,
+        description='',
+        createTime=datetime(2024, 1, 15, 10, 30),
+        childSnapshotList=list(children),
+        snapshot=vim.vm.Snapshot(moref),
+        vm=vim.VirtualMachine('vm-1'),
+        id=1,
+        state='poweredOff',
+        quiesced=False
+    )
+
+
+def build_record(vcenter, vm, vm_name, snapshot, parent):
+    return SnapshotRecord.from_snapshot_tree(vcenter, vm._moId, vm_name, snapshot,
+                                             is_child=parent is not None, created_by='admin')
+
+
+def vm_update(vm_id, kind='modify', **properties):
+    """Build an ObjectUpdate for a VM; a property set to None is reported as removed."""
+    names = {'name': 'name', 'snapshots': 'snapshot.rootSnapshotList'}
+    change_set = [SimpleNamespace(name=names[key], op='assign' if value is not None else 'remove', val=value)
+                  for key, value in properties.items()]
+    return SimpleNamespace(kind=kind, obj=vim.VirtualMachine(vm_id), changeSet=change_set)
+
+
+class FakeCollector:
+    """PropertyCollector whose WaitForUpdatesEx returns scripted update sets."""
+
+    def __init__(self):
+        self.updates = queue.Queue()
+        self.versions = []
+        self.destroyed = False
+
+    def CreatePropertyCollector(self):
+        return self
+
+    def CreateFilter(self, spec, partialUpdates):
+        self.spec = spec
+
+    def WaitForUpdatesEx(self, version, options):
+        self.versions.append(version)
+        try:
+            update = self.updates.get(timeout=0.05)
+        except queue.Empty:
+            return None
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+    def CancelWaitForUpdates(self):
+        pass
+
+    def DestroyPropertyCollector(self):
+        self.destroyed = True
+
+    def push(self, *object_updates, truncated=False):
+        self.updates.put(SimpleNamespace(
+            version=str(self.updates.qsize() + len(self.versions) + 1), truncated=truncated,
+            filterSet=[SimpleNamespace(objectSet=list(object_updates))]
+        ))
+
+
+def make_si(collector):
+    content = SimpleNamespace(
+        propertyCollector=collector,
+        rootFolder=None,
+        viewManager=SimpleNamespace(CreateContainerView=lambda *args: vim.view.ContainerView('view-1'))
+    )
+    return SimpleNamespace(RetrieveContent=lambda: content)
+
+
+class TestInventoryWatch(unittest.TestCase):
+    def setUp(self):
+        self.collector = FakeCollector()
+        self.watch = InventoryWatch(build_record, wait_seconds=1, page_size=2)
+
+    def tearDown(self):
+        self.watch.stop()
+
+    def start(self):
+        self.watch.watch('vc1', make_si(self.collector))
+
+    def test_initial_inventory_arrives_in_pages(self):
+        """Test truncated update sets load the inventory before it is reported synced."""
+        self.collector.push(vm_update('vm-1', 'enter', name='web01',
+                                      snapshots=[make_tree('snap-1', 'a', [make_tree('snap-2', 'b')])]),
+                            vm_update('vm-2', 'enter', name='idle'), truncated=True)
+        self.collector.push(vm_update('vm-3', 'enter', name='db01', snapshots=[make_tree('snap-3', 'c')]))
+        self.start()
+
+        first = self.watch.next_change(timeout=2)
+        second = self.watch.next_change(timeout=2)
+
+        self.assertEqual([data.name for data in first.added], ['a', 'b'])
+        self.assertFalse(first.synced)
+        self.assertEqual([(data.vm_name, data.name) for data in second.added], [('db01', 'c')])
+        self.assertTrue(second.synced)
+        self.assertEqual(self.collector.versions[:2], ['', '1'])
+
+    def test_changes_are_diffs(self):
+        """Test later updates report only the snapshots that changed."""
+        self.collector.push(vm_update('vm-1', 'enter', name='web01',
+                                      snapshots=[make_tree('snap-1', 'a'), make_tree('snap-2', 'b')]))
+        self.start()
+        self.watch.next_change(timeout=2)
+
+        # Snapshot b renamed
+        self.collector.push(vm_update('vm-1', snapshots=[make_tree('snap-1', 'a'), make_tree('snap-2', 'b2')]))
+        renamed = self.watch.next_change(timeout=2)
+        self.assertEqual([data.name for data in renamed.added], ['b2'])
+        self.assertEqual([data.name for data in renamed.removed], ['b'])
+
+        # All snapshots deleted, then the VM itself
+        self.collector.push(vm_update('vm-1', snapshots=None))
+        self.assertEqual(sorted(data.name for data in self.watch.next_change(timeout=2).removed), ['a', 'b2'])
+        self.collector.push(vm_update('vm-1', 'leave'))
+        self.collector.push(vm_update('vm-2', 'enter', name='new', snapshots=[make_tree('snap-9', 'z')]))
+        change = self.watch.next_change(timeout=2)
+        self.assertEqual(([data.name for data in change.added], change.removed), (['z'], []))
+
+    def test_vm_rename_updates_its_snapshots(self):
+        """Test a VM name change re-reports its snapshots under the new name."""
+        self.collector.push(vm_update('vm-1', 'enter', name='web01', snapshots=[make_tree('snap-1', 'a')]))
+        self.start()
+        self.watch.next_change(timeout=2)
+
+        self.collector.push(vm_update('vm-1', name='web01-renamed'))
+        change = self.watch.next_change(timeout=2)
+
+        self.assertEqual([data.vm_name for data in change.added], ['web01-renamed'])
+        self.assertEqual([data.vm_name for data in change.removed], ['web01'])
+
+    def test_empty_inventory_is_synced(self):
+        """Test a vCenter without VMs still reports its inventory complete."""
+        self.start()
+        change = self.watch.next_change(timeout=2)
+        self.assertEqual((change.added, change.removed, change.synced), ([], [], True))
+
+    def test_failure_is_reported(self):
+        """Test a failed long-poll is reported once and the collector destroyed."""
+        self.collector.updates.put(ConnectionError('session lost'))
+        self.start()
+
+        change = self.watch.next_change(timeout=2)
+
+        self.assertEqual(change.error, 'session lost')
+        self.watch.stop()
+        self.assertTrue(self.collector.destroyed)
+
+    def test_replaced_watch_drops_stale_changes(self):
+        """Test changes still queued from a replaced watch are discarded."""
+        self.collector.push(vm_update('vm-1', 'enter', name='old', snapshots=[make_tree('snap-1', 'a')]))
+        self.start()
+        deadline = time.monotonic() + 2
+        while self.watch.changes.empty() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        new_collector = FakeCollector()
+        new_collector.push(vm_update('vm-1', 'enter', name='new', snapshots=[make_tree('snap-1', 'a')]))
+        self.watch.watch('vc1', make_si(new_collector))
+
+        change = self.watch.next_change(timeout=2)
+        self.assertEqual([data.vm_name for data in change.added], ['new'])
+
+
+class TestLiveInventoryWorker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_worker_streams_inventory_then_changes(self):
+        """Test the worker reports the loaded inventory, then diffs, then stops."""
+        collector = FakeCollector()
+        collector.push(vm_update('vm-1', 'enter', name='web01', snapshots=[make_tree('snap-1', 'a')]))
+        worker = LiveInventoryWorker({'vc1': make_si(collector)}, wait_seconds=1)
+        worker.POLL_INTERVAL = 0.02
+        events = []
+        worker.snapshots_changed.connect(
+            lambda h, added, removed: events.append(('changed', h, [d.name for d in added], [d.name for d in removed])))
+        worker.vcenter_complete.connect(lambda h, started: events.append(('complete', h)))
+        worker.finished.connect(lambda: events.append(('finished',)))
+
+        worker.start()
+        deadline = time.monotonic() + 3
+        while len(events) < 2 and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        collector.push(vm_update('vm-1', snapshots=None))
+        while len(events) < 3 and time.monotonic() < deadline:
+            self.app.processEvents()
+            time.sleep(0.01)
+        worker.stop()
+        self.assertTrue(worker.wait(3000))
+        self.app.processEvents()
+
+        self.assertEqual(events, [
+            ('changed', 'vc1', ['a'], []),
+            ('complete', 'vc1'),
+            ('changed', 'vc1', [], ['a']),
+            ('finished',),
+        ])
+
+
+if __name__ == '__main__':
+    unittest.main()
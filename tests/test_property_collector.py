@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyVmomi import vim, vmodl
+from modules.core.property_collector import (retrieve_properties, object_properties,
+                                             build_container_filter_spec)
+
+
+def make_object_content(moid, name):
+    """Build an ObjectContent for a VM with a single 'name' property."""
+    return vmodl.query.PropertyCollector.ObjectContent(
+        obj=vim.VirtualMachine(moid),
+        propSet=[vmodl.DynamicProperty(name='name', val=name)]
+    )
+
+
+class TestPropertyCollector(unittest.TestCase):
+    def setUp(self):
+        """Set up a filter spec over a detached container view."""
+        container = vim.view.ContainerView('session[test]view-1', None)
+        self.filter_spec = build_container_filter_spec(container, vim.VirtualMachine, ['name'])
+
+    def test_filter_spec_traverses_container_view(self):
+        """Test the filter spec selects VMs through the container view."""
+        object_spec = self.filter_spec.objectSet[0]
+        self.assertTrue(object_spec.skip)
+        self.assertEqual(object_spec.selectSet[0].path, 'view')
+        self.assertEqual(list(self.filter_spec.propSet[0].pathSet), ['name'])
+
+    def test_retrieve_properties_follows_continuation_tokens(self):
+        """Test every page is retrieved until no continuation token is returned."""
+        RetrieveResult = vmodl.query.PropertyCollector.RetrieveResult
+        collector = MagicMock()
+        collector.RetrievePropertiesEx.return_value = RetrieveResult(
+            objects=[make_object_content('vm-1', 'web01'), make_object_content('vm-2', 'web02')],
+            token='page-2'
+        )
+        collector.ContinueRetrievePropertiesEx.side_effect = [
+            RetrieveResult(objects=[make_object_content('vm-3', 'db01')], token='page-3'),
+            RetrieveResult(objects=[make_object_content('vm-4', 'db02')]),
+        ]
+
+        names = [object_properties(content)['name']
+                 for content in retrieve_properties(collector, self.filter_spec, page_size=2)]
+
+        self.assertEqual(names, ['web01', 'web02', 'db01', 'db02'])
+        options = collector.RetrievePropertiesEx.call_args[0][1]
+        self.assertEqual(options.maxObjects, 2)
+        self.assertEqual([call[0][0] for call in collector.ContinueRetrievePropertiesEx.call_args_list],
+                         ['page-2', 'page-3'])
+
+    def test_retrieve_properties_empty_result(self):
+        """Test an empty inventory yields nothing."""
+        collector = MagicMock()
+        collector.RetrievePropertiesEx.return_value = None
+
+        self.assertEqual(list(retrieve_properties(collector, self.filter_spec)), [])
+        collector.ContinueRetrievePropertiesEx.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import os
+import sys
+import unittest
+from collections import deque
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyVmomi import vim
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.core.task_monitor import TaskEvent
+from modules.workers.snapshot_create import SnapshotCreateWorker
+
+
+def inventory(*names, datastore='datastore-1'):
+    """Build (vm, properties) tuples as returned by iter_container_properties."""
+    return [(FakeVM(f'vm-{i}'), {'name': name, 'runtime.host': vim.HostSystem('host-1'),
+                                 'datastore': [vim.Datastore(datastore)]})
+            for i, name in enumerate(names)]
+
+
+def fake_properties(vms):
+    """Side effect for iter_container_properties serving VMs and one host in one cluster."""
+    def properties(si, obj_type, path_set):
+        if obj_type is vim.HostSystem:
+            return iter([(vim.HostSystem('host-1'), {'parent': vim.ClusterComputeResource('domain-c1')})])
+        return iter(vms)
+    return properties
+
+
+class FakeVM:
+    """VM whose snapshot tasks are tracked by FakeMonitor."""
+    snapshot = None
+
+    def __init__(self, moid):
+        self._moId = moid
+
+    def CreateSnapshot_Task(self, **kwargs):
+        return vim.Task(f'task-{self._moId}')
+
+
+class FakeMonitor:
+    """Completes watched tasks in start order, recording peak concurrency."""
+    instances = []
+
+    def __init__(self):
+        self.running = deque()
+        self.peak = 0
+        FakeMonitor.instances.append(self)
+
+    def watch(self, vcenter, si, task, context=None):
+        self.running.append((task, context))
+        self.peak = max(self.peak, len(self.running))
+
+    def next_event(self, timeout=None):
+        task, context = self.running.popleft()
+        return TaskEvent(task, context, 'success', 100)
+
+    def stop(self):
+        pass
+
+
+class TestVmIndex(unittest.TestCase):
+    @patch('modules.workers.snapshot_create.iter_container_properties')
+    def test_build_vm_index_is_case_insensitive(self, mock_properties):
+        """Test the index maps lowercase names and keeps the first VM on duplicates."""
+        mock_properties.return_value = inventory('Web01', 'db01', 'WEB01')
+        worker = SnapshotCreateWorker({}, [], 'patching')
+
+        vm_index = worker.build_vm_index(object())
+
+        self.assertEqual(sorted(vm_index), ['db01', 'web01'])
+        self.assertEqual(vm_index['web01'][0]._moId, 'vm-0')
+        mock_properties.assert_called_once()
+
+    @patch('modules.workers.snapshot_create.iter_container_properties')
+    def test_placement_resources(self, mock_properties):
+        """Test VMs are placed on their vCenter, cluster and datastores."""
+        mock_properties.side_effect = fake_properties(inventory('web01'))
+        worker = SnapshotCreateWorker({}, [], 'patching')
+
+        vm, resources = worker.build_placement_index('vc1', object())['web01']
+
+        self.assertEqual(resources, [('vcenter', 'vc1'), ('cluster', 'vc1:domain-c1'),
+                                     ('datastore', 'vc1:datastore-1')])
+
+    @patch('modules.workers.snapshot_create.iter_container_properties')
+    def test_run_indexes_each_vcenter_once(self, mock_properties):
+        """Test discovery costs a fixed number of retrievals per vCenter, not per server."""
+        mock_properties.side_effect = fake_properties(inventory('other01', 'other02'))
+        servers = [f'missing{i:02d}' for i in range(20)]
+        worker = SnapshotCreateWorker({'vc1': object(), 'vc2': object()}, servers, 'patching')
+        errors = []
+        worker.error.connect(errors.append)
+
+        worker.run()
+
+        self.assertEqual(mock_properties.call_count, 4)  # VMs and hosts, per vCenter
+        self.assertEqual(errors, ["No VMs were found in any connected vCenter"])
+
+
+class TestCreateScheduling(unittest.TestCase):
+    @patch('modules.workers.snapshot_create.TaskMonitor', FakeMonitor)
+    @patch('modules.workers.snapshot_create.iter_container_properties')
+    def test_datastore_limit_caps_concurrency(self, mock_properties):
+        """Test no more tasks than the datastore limit run at once, yet every VM completes."""
+        names = [f'web{i:02d}' for i in range(12)]
+        mock_properties.side_effect = fake_properties(inventory(*names))
+        worker = SnapshotCreateWorker({'vc1': object()}, names, 'patching', limits={'datastore': 2})
+        created = []
+        worker.snapshot_created.connect(created.append)
+
+        worker.run()
+
+        self.assertEqual(FakeMonitor.instances[-1].peak, 2)
+        self.assertEqual(sorted(created), names)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import os
+import sys
+import unittest
+from collections import Counter, deque
+from types import SimpleNamespace
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyVmomi import vim
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.core.snapshot_record import SnapshotRecord
+from modules.core.task_monitor import TaskEvent
+from modules.workers.snapshot_delete import SnapshotDeleteWorker
+
+
+class FakeMonitor:
+    """Completes watched tasks in start order, recording peak deletions per datastore."""
+    instances = []
+
+    def __init__(self):
+        self.running = deque()
+        self.peak_per_datastore = Counter()
+        FakeMonitor.instances.append(self)
+
+    def watch(self, vcenter, si, task, context=None):
+        self.running.append((task, context))
+        per_datastore = Counter(ctx[1].vm_moref[-1] for _, ctx in self.running)
+        for datastore, count in per_datastore.items():
+            self.peak_per_datastore[datastore] = max(self.peak_per_datastore[datastore], count)
+
+    def next_event(self, timeout=None):
+        task, context = self.running.popleft()
+        return TaskEvent(task, context, 'success', 100)
+
+    def stop(self):
+        pass
+
+
+def make_record(i, vcenter='vc1'):
+    """Snapshot on VM vm-<i>-<a|b>, whose last letter names its datastore."""
+    return SnapshotRecord(vcenter, f'web{i:02d}', 'patch', 0.0, '2024-01-15 10:00',
+                          vm_moref=f'vm-{i}-{"ab"[i % 2]}', snapshot_moref=f'snapshot-{i}')
+
+
+def fake_placements(si, vms, obj_type, path_set):
+    for vm in vms:
+        yield vm, {'runtime.host': vim.HostSystem('host-1'),
+                   'datastore': [vim.Datastore(f'datastore-{vm._moId[-1]}')]}
+
+
+class FakeSnapshot:
+    started = 0
+
+    def RemoveSnapshot_Task(self, removeChildren):
+        FakeSnapshot.started += 1
+        return vim.Task(f'task-{FakeSnapshot.started}')
+
+
+class TestSnapshotDeleteWorker(unittest.TestCase):
+    def setUp(self):
+        self.si = SimpleNamespace(_stub=None)
+        patcher = patch.object(SnapshotRecord, 'snapshot_ref', lambda record, si: FakeSnapshot())
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch('modules.workers.snapshot_delete.TaskMonitor', FakeMonitor)
+    @patch('modules.workers.snapshot_delete.iter_object_properties', side_effect=fake_placements)
+    def test_datastore_limit_caps_consolidations(self, mock_properties):
+        """Test in-flight deletions per datastore never exceed the limit and all complete."""
+        items = [(f'id{i}', make_record(i)) for i in range(10)]
+        worker = SnapshotDeleteWorker({'vc1': self.si}, items, limits={'datastore': 2}, adaptive=False)
+        completed = []
+        worker.item_complete.connect(completed.append)
+
+        worker.run()
+
+        self.assertEqual(sorted(completed), sorted(snapshot_id for snapshot_id, _ in items))
+        self.assertEqual(FakeMonitor.instances[-1].peak_per_datastore, Counter({'a': 2, 'b': 2}))
+        mock_properties.assert_called_once()
+
+    @patch('modules.workers.snapshot_delete.TaskMonitor', FakeMonitor)
+    @patch('modules.workers.snapshot_delete.iter_object_properties', side_effect=fake_placements)
+    def test_disconnected_vcenter_reports_error(self, mock_properties):
+        """Test snapshots on vCenters without a connection are reported, not started."""
+        worker = SnapshotDeleteWorker({'vc1': self.si}, [('id0', make_record(0, vcenter='vc2'))])
+        errors = []
+        worker.error.connect(errors.append)
+
+        worker.run()
+
+        self.assertEqual(errors, ["Error starting deletion of patch: Not connected to vc2"])
+
+
+if __name__ == '__main__':
+    unittest.main()
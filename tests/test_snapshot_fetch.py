@@ -0,0 +1,163 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyVmomi import vim
+import modules.core  # noqa: F401 - initializes the package before the workers import it
+from modules.workers.snapshot_fetch import SnapshotFetchWorker
+from modules.core.snapshot_record import SnapshotRecord, walk_snapshot_tree
+
+
+def make_tree(name, children=(), description="Created by: admin"):
+    """Build a VirtualMachineSnapshotTree node."""
+    return vim.vm.SnapshotTree(
+        name=name,
+        description=description,
+        createTime=datetime(2024, 1, 15, 10, 30),
+        childSnapshotList=list(children),
+        snapshot=vim.vm.Snapshot(f'snapshot-{name}'),
+        vm=vim.VirtualMachine('vm-1'),
+        id=1,
+        state='poweredOff',
+        quiesced=False
+    )
+
+
+class TestSnapshotFetchWorker(unittest.TestCase):
+    def setUp(self):
+        """Set up a worker with no connections."""
+        self.worker = SnapshotFetchWorker({})
+
+    def test_walk_snapshot_tree_reports_parents(self):
+        """Test depth-first traversal yields each node with its parent."""
+        root = make_tree('root', [make_tree('child', [make_tree('grandchild')]), make_tree('sibling')])
+
+        walked = [(snapshot.name, parent.name if parent else None)
+                  for snapshot, parent in walk_snapshot_tree([root])]
+
+        self.assertEqual(walked, [
+            ('root', None),
+            ('child', 'root'),
+            ('grandchild', 'child'),
+            ('sibling', 'root'),
+        ])
+
+    def test_build_snapshot_data_chain_flags(self):
+        """Test chain flags are derived from the tree position."""
+        child = make_tree('child')
+        root = make_tree('root', [child])
+        vm = vim.VirtualMachine('vm-1')
+
+        root_data = self.worker.build_snapshot_data('vc1', vm, 'web01', root, None)
+        child_data = self.worker.build_snapshot_data('vc1', vm, 'web01', child, root)
+
+        self.assertTrue(root_data.has_children)
+        self.assertFalse(root_data.is_child)
+        self.assertFalse(child_data.has_children)
+        self.assertTrue(child_data.is_child)
+        self.assertEqual(child_data.vm_name, 'web01')
+        self.assertEqual(child_data.created_by, 'admin')
+        self.assertEqual((child_data.vm_moref, child_data.snapshot_moref), ('vm-1', 'snapshot-child'))
+
+    @patch('modules.workers.snapshot_fetch.iter_container_pages')
+    def test_fetch_vcenter_reports_progress_per_page(self, mock_pages):
+        """Test per-vCenter progress is emitted once per page, not once per VM."""
+        vm = vim.VirtualMachine('vm-1')
+        page = [(vm, {'name': f'web{i:02d}', 'snapshot.rootSnapshotList': [make_tree(f's{i}')]})
+                for i in range(50)]
+        mock_pages.return_value = iter([page, page[:10] + [(vm, {'name': 'idle'})]])
+
+        progress = []
+        self.worker.vcenter_progress.connect(lambda hostname, message: progress.append(message))
+
+        vm_count, snapshot_count = self.worker.fetch_vcenter('vc1', None)
+
+        self.assertEqual((vm_count, snapshot_count), (61, 60))
+        self.assertEqual(progress, [
+            "Processing (50 VMs scanned, 50 snapshots)",
+            "Processing (61 VMs scanned, 60 snapshots)",
+        ])
+
+    @patch('modules.workers.snapshot_fetch.iter_container_pages')
+    def test_rows_are_flushed_after_each_page(self, mock_pages):
+        """Test no rows are left pending while the next page is being retrieved."""
+        vm = vim.VirtualMachine('vm-1')
+        batches = []
+        pending_between_pages = []
+
+        def pages():
+            yield [(vm, {'name': 'web01', 'snapshot.rootSnapshotList': [make_tree('a', [make_tree('b')])]})]
+            pending_between_pages.append(len(self.worker.pending_batch))
+            yield [(vm, {'name': 'web02', 'snapshot.rootSnapshotList': [make_tree('c')]})]
+
+        mock_pages.return_value = pages()
+        self.worker.BATCH_INTERVAL = 3600
+        self.worker.snapshots_batch.connect(batches.append)
+
+        self.worker.fetch_vcenter('vc1', None)
+
+        self.assertEqual(pending_between_pages, [0])
+        self.assertEqual([[data.name for data in batch] for batch in batches], [['a', 'b'], ['c']])
+
+    def test_batch_size_limit_flushes(self):
+        """Test a full batch is emitted as soon as it reaches BATCH_SIZE rows."""
+        batches = []
+        self.worker.BATCH_SIZE = 3
+        self.worker.BATCH_INTERVAL = 3600
+        self.worker.snapshots_batch.connect(batches.append)
+
+        for i in range(7):
+            self.worker.queue_snapshot({'name': str(i)})
+
+        self.assertEqual([len(batch) for batch in batches], [3, 3])
+
+        self.worker.flush_batch()
+        self.assertEqual([len(batch) for batch in batches], [3, 3, 1])
+
+    @patch('modules.workers.snapshot_fetch.iter_container_pages')
+    def test_vcenter_complete_follows_its_rows(self, mock_pages):
+        """Test a vCenter is reported complete only after all of its rows were emitted."""
+        vm = vim.VirtualMachine('vm-1')
+        mock_pages.return_value = iter([[(vm, {'name': 'web01', 'snapshot.rootSnapshotList': [make_tree('a')]})]])
+        events = []
+        self.worker.BATCH_INTERVAL = 3600
+        self.worker.snapshots_batch.connect(lambda batch: events.append(('batch', len(batch))))
+        self.worker.vcenter_complete.connect(lambda hostname, started: events.append(('complete', hostname)))
+
+        self.worker.fetch_vcenter_safe('vc1', None, 1)
+
+        self.assertEqual(events, [('batch', 1), ('complete', 'vc1')])
+
+
+class TestSnapshotRecord(unittest.TestCase):
+    def test_from_snapshot_tree(self):
+        """Test creation time is stored once as a UTC-based timestamp and MoRefs as IDs."""
+        record = SnapshotRecord.from_snapshot_tree('vc1', 'vm-1', 'web01', make_tree('root'),
+                                                   is_child=False, created_by='admin')
+
+        expected = datetime(2024, 1, 15, 10, 30, tzinfo=timezone.utc)
+        self.assertEqual(record.created_ts, expected.timestamp())
+        self.assertEqual(record.created, expected.astimezone().strftime('%Y-%m-%d %H:%M'))
+        self.assertEqual(record.created_datetime, expected.astimezone().replace(tzinfo=None))
+        self.assertEqual(record.snapshot_type, "Independent Snapshot")
+        self.assertFalse(record.is_in_chain)
+
+    def test_refs_are_bound_to_connection(self):
+        """Test MoRef IDs are turned back into managed objects on a connection's stub."""
+        record = SnapshotRecord('vc1', 'web01', 'snap', 0.0, '1970-01-01 00:00',
+                                vm_moref='vm-7', snapshot_moref='snapshot-9')
+        stub = object()
+        si = type('ServiceInstance', (), {'_stub': stub})()
+
+        self.assertEqual(record.snapshot_ref(si)._moId, 'snapshot-9')
+        self.assertIs(record.snapshot_ref(si)._stub, stub)
+        self.assertEqual(record.vm_ref(si)._moId, 'vm-7')
+
+
+if __name__ == '__main__':
+    unittest.main()
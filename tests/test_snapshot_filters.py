@@ -0,0 +1,127 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtWidgets import QApplication
+from snapshot_filters import SnapshotFilterPanel, CompiledFilter
+from modules.core.snapshot_record import SnapshotRecord
+
+
+app = QApplication.instance() or QApplication([])
+
+
+def make_snapshot(vcenter, created_by):
+    return SnapshotRecord(vcenter=vcenter, vm_name='web01', name='snap', created_ts=0.0,
+                          created='2024-01-15 10:00', created_by=created_by)
+
+
+def combo_items(combo):
+    return [combo.itemText(i) for i in range(combo.count())]
+
+
+class TestDropdownMaintenance(unittest.TestCase):
+    def setUp(self):
+        self.panel = SnapshotFilterPanel()
+        self.emitted = []
+        self.panel.filters_changed.connect(lambda: self.emitted.append(True))
+
+    def test_values_are_reference_counted(self):
+        """Test that a value stays listed until its last snapshot is removed."""
+        first = make_snapshot('vc1', 'alice')
+        second = make_snapshot('vc1', 'bob')
+        self.panel.add_dropdown_values([first, second])
+        self.panel.refresh_dropdowns()
+        self.assertEqual(combo_items(self.panel.vcenter_filter), ["All vCenters", "vc1"])
+        self.assertEqual(combo_items(self.panel.created_by_filter), ["All Users", "alice", "bob", "Unknown"])
+
+        self.panel.remove_dropdown_values([first])
+        self.panel.refresh_dropdowns()
+        self.assertEqual(combo_items(self.panel.vcenter_filter), ["All vCenters", "vc1"])
+        self.assertEqual(combo_items(self.panel.created_by_filter), ["All Users", "bob", "Unknown"])
+
+    def test_refresh_without_changes_does_not_rebuild(self):
+        """Test that repeated values don't mark the dropdowns dirty."""
+        self.panel.add_dropdown_values([make_snapshot('vc1', 'alice')])
+        self.panel.refresh_dropdowns()
+        self.panel.add_dropdown_values([make_snapshot('vc1', 'alice')])
+        self.assertFalse(self.panel.dropdowns_dirty)
+
+    def test_rebuild_keeps_selection_without_emitting(self):
+        """Test that rebuilding the combos preserves the selection silently."""
+        self.panel.add_dropdown_values([make_snapshot('vc1', 'alice')])
+        self.panel.refresh_dropdowns()
+        self.panel.vcenter_filter.setCurrentText('vc1')
+        self.emitted.clear()
+
+        self.panel.add_dropdown_values([make_snapshot('vc2', 'bob')])
+        self.panel.refresh_dropdowns()
+        self.assertEqual(self.panel.vcenter_filter.currentText(), 'vc1')
+        self.assertEqual(self.emitted, [])
+
+    def test_removing_selected_value_emits_once(self):
+        """Test that losing the selected value resets the filter and notifies once."""
+        snapshot = make_snapshot('vc1', 'alice')
+        self.panel.add_dropdown_values([snapshot])
+        self.panel.refresh_dropdowns()
+        self.panel.vcenter_filter.setCurrentText('vc1')
+        self.emitted.clear()
+
+        self.panel.remove_dropdown_values([snapshot])
+        self.panel.refresh_dropdowns()
+        self.assertEqual(self.panel.vcenter_filter.currentText(), 'All vCenters')
+        self.assertEqual(len(self.emitted), 1)
+
+
+def make_filters(**overrides):
+    filters = {
+        'vm_name': '', 'snapshot_search': '', 'vcenter': '', 'created_by': '',
+        'snapshot_type': '', 'age_threshold': 3, 'day_type': 'business days',
+        'date_from': date(2024, 1, 1), 'date_to': date(2024, 1, 31)
+    }
+    filters.update(overrides)
+    return filters
+
+
+def make_row(vm_name='Web01', name='Monthly OS Patching', created='2024-01-15 10:00',
+             has_children=False, is_child=False, description=''):
+    return SnapshotRecord(vcenter='vc1', vm_name=vm_name, name=name, created_ts=0.0, created=created,
+                          created_by='alice', description=description,
+                          has_children=has_children, is_child=is_child)
+
+
+class TestCompiledFilter(unittest.TestCase):
+    def test_text_filters_are_case_insensitive(self):
+        """Test VM name and name/description search terms ignore case."""
+        compiled = CompiledFilter(make_filters(vm_name='WEB', snapshot_search='Before'))
+        self.assertTrue(compiled.matches(make_row(description='taken BEFORE upgrade')))
+        self.assertFalse(compiled.matches(make_row(vm_name='db01', description='before')))
+        self.assertFalse(compiled.matches(make_row()))
+
+    def test_date_bounds_are_inclusive(self):
+        """Test the date range compares whole days."""
+        compiled = CompiledFilter(make_filters())
+        self.assertTrue(compiled.matches(make_row(created='2024-01-01 00:00')))
+        self.assertTrue(compiled.matches(make_row(created='2024-01-31 23:59')))
+        self.assertFalse(compiled.matches(make_row(created='2024-02-01 00:00')))
+        self.assertFalse(compiled.matches(make_row(created='2023-12-31 23:59')))
+
+    def test_snapshot_type_and_patching(self):
+        """Test the snapshot type option and the patching-only flag."""
+        compiled = CompiledFilter(make_filters(snapshot_type='Part of Chain (Middle)'), patching_only=True)
+        self.assertTrue(compiled.matches(make_row(has_children=True, is_child=True)))
+        self.assertFalse(compiled.matches(make_row(is_child=True)))
+        self.assertFalse(compiled.matches(make_row(name='manual', has_children=True, is_child=True)))
+
+    def test_evaluate_returns_mask(self):
+        """Test evaluate() returns one result per snapshot in order."""
+        compiled = CompiledFilter(make_filters(vm_name='web'))
+        rows = [make_row(), make_row(vm_name='db01'), make_row(vm_name='web02')]
+        self.assertEqual(compiled.evaluate(rows), [True, False, True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,353 @@
+import os
+import sys
+import unittest
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PyQt6.QtCore import Qt, QCoreApplication, QPersistentModelIndex
+from modules.core.snapshot_record import SnapshotRecord, snapshot_type_label
+from modules.core.snapshot_model import (SnapshotTableModel, SnapshotFilterProxyModel, ChunkedFilterRunner,
+                                         chain_tooltip, CHECK_COLUMN, COLUMN_HEADERS)
+
+
+def make_snapshot(vm_name, name='Monthly OS Patching', days_old=0, has_children=False, is_child=False):
+    """Build a snapshot record in the format emitted by the workers."""
+    created = datetime.now() - timedelta(days=days_old)
+    return SnapshotRecord(
+        vcenter='vcenter1.example.com',
+        vm_name=vm_name,
+        name=name,
+        created_ts=created.timestamp(),
+        created=created.strftime('%Y-%m-%d %H:%M'),
+        created_by='admin',
+        has_children=has_children,
+        is_child=is_child
+    )
+
+
+class PrefixFilter:
+    """Minimal filter accepting VM names with a given prefix."""
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def matches(self, data):
+        return data.vm_name.startswith(self.prefix)
+
+    def evaluate(self, records):
+        return [self.matches(data) for data in records]
+
+
+def calendar_age(created_dates, current_date, day_type):
+    return [(current_date - created_date).days for created_date in created_dates]
+
+
+class TestSnapshotLabels(unittest.TestCase):
+    def test_snapshot_type_label(self):
+        """Test snapshot type classification for every chain position."""
+        self.assertEqual(snapshot_type_label(False, False), "Independent Snapshot")
+        self.assertEqual(snapshot_type_label(True, False), "Has Child Snapshots (Delete Manually)")
+        self.assertEqual(snapshot_type_label(False, True), "Child Snapshot")
+        self.assertEqual(snapshot_type_label(True, True), "Part of Chain (Middle)")
+
+    def test_chain_tooltip(self):
+        """Test chain tooltip lists each reason the snapshot is protected."""
+        self.assertTrue(chain_tooltip(True, False).startswith("Cannot delete: Has child snapshots\n"))
+        self.assertTrue(chain_tooltip(False, True).startswith("Cannot delete: Is a child snapshot\n"))
+        self.assertIn("Has child snapshots and Is a child snapshot", chain_tooltip(True, True))
+
+
+class TestSnapshotTableModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.model = SnapshotTableModel()
+        self.model.set_age_policy(3, "calendar days", calendar_age)
+
+    def test_add_snapshots_populates_columns(self):
+        """Test added snapshots are exposed through the display role."""
+        self.model.add_snapshots([('a', make_snapshot('vm1')), ('b', make_snapshot('vm2', is_child=True))])
+
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.index(0, 1).data(), 'vm1')
+        self.assertEqual(self.model.index(1, 7).data(), 'Child Snapshot')
+
+    def test_duplicate_id_replaces_row(self):
+        """Test re-adding an existing ID replaces the row instead of duplicating it."""
+        replaced = self.model.add_snapshots([('a', make_snapshot('vm1')), ('a', make_snapshot('vm1', name='first'))])
+        self.assertEqual([data.name for data in replaced], ['Monthly OS Patching'])
+        replaced = self.model.add_snapshots([('a', make_snapshot('vm1', name='second'))])
+        self.assertEqual([data.name for data in replaced], ['first'])
+
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.model.index(0, 3).data(), 'second')
+        self.assertEqual(self.model.get_snapshot('a').name, 'second')
+        self.assertIsNone(self.model.get_snapshot('missing'))
+
+    def test_replacements_are_applied_per_batch(self):
+        """Test a refreshed batch updates changed rows in place with one dataChanged per run of rows."""
+        self.model.add_snapshots([(key, make_snapshot(key)) for key in 'abcde'])
+        changes = []
+        self.model.dataChanged.connect(lambda first, last, roles: changes.append(
+            ((first.row(), first.column()), (last.row(), last.column()))))
+        revision = self.model.revision
+        unchanged = self.model.get_snapshot('e')
+
+        replaced = self.model.add_snapshots([(key, make_snapshot(key, name='Refreshed')) for key in 'dabf']
+                                            + [('e', unchanged)])
+
+        self.assertEqual(sorted(data.vm_name for data in replaced), ['a', 'b', 'd', 'e'])
+        self.assertEqual(changes, [((0, 3), (1, 3)), ((3, 3), (3, 3))])  # Only the name column changed
+        self.assertEqual(self.model.revision, revision)
+        self.assertEqual([self.model.index(row, 3).data() for row in range(6)],
+                         ['Refreshed', 'Refreshed', 'Monthly OS Patching', 'Refreshed',
+                          'Monthly OS Patching', 'Refreshed'])
+
+    def test_replacement_joining_a_chain_repaints_the_row(self):
+        """Test a row that becomes part of a chain is unchecked and repainted across all columns."""
+        self.model.add_snapshots([('a', make_snapshot('a'))])
+        self.model.setData(self.model.index(0, CHECK_COLUMN), Qt.CheckState.Checked.value,
+                           Qt.ItemDataRole.CheckStateRole)
+        changes = []
+        self.model.dataChanged.connect(lambda first, last, roles: changes.append((first.column(), last.column())))
+
+        self.model.add_snapshots([('a', make_snapshot('a', has_children=True))])
+
+        self.assertEqual(changes, [(0, len(COLUMN_HEADERS) - 1)])
+        self.assertEqual(self.model.checked_count(), 0)
+
+    def test_remove_snapshot_keeps_lookup_consistent(self):
+        """Test removing a row keeps the remaining IDs addressable."""
+        self.model.add_snapshots([(key, make_snapshot(key)) for key in ('a', 'b', 'c')])
+
+        self.assertTrue(self.model.remove_snapshot('a'))
+        self.assertFalse(self.model.remove_snapshot('a'))
+        self.assertTrue(self.model.remove_snapshot('c'))
+
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.model.snapshot_id(0), 'b')
+        self.assertTrue(self.model.contains('b'))
+
+    def test_remove_snapshot_keeps_row_identity(self):
+        """Test a removal shifts later rows up and persistent indexes follow their snapshots."""
+        self.model.add_snapshots([(key, make_snapshot(key, has_children=key == 'a')) for key in 'abcd'])
+        self.model.setData(self.model.index(3, CHECK_COLUMN), Qt.CheckState.Checked.value,
+                           Qt.ItemDataRole.CheckStateRole)
+        last = QPersistentModelIndex(self.model.index(3, 1))
+        removed = QPersistentModelIndex(self.model.index(1, 1))
+
+        self.assertTrue(self.model.remove_snapshot('b'))
+
+        self.assertEqual([self.model.snapshot_id(row) for row in range(3)], ['a', 'c', 'd'])
+        self.assertFalse(removed.isValid())
+        self.assertEqual((last.row(), last.data()), (2, 'd'))
+        self.assertEqual(self.model.index(2, CHECK_COLUMN).data(Qt.ItemDataRole.CheckStateRole),
+                         Qt.CheckState.Checked)
+        self.assertIsNotNone(self.model.index(0, 1).data(Qt.ItemDataRole.BackgroundRole))
+        self.assertEqual(self.model.checked_snapshots()[0][0], 'd')
+        self.assertTrue(self.model.remove_snapshot('d'))
+        self.assertEqual(self.model.checked_count(), 0)
+
+    def test_many_single_removals_keep_lookup_consistent(self):
+        """Test lookups stay correct across deferred and completed renumbering."""
+        keys = [f'vm{i:02}' for i in range(40)]
+        self.model.add_snapshots([(key, make_snapshot(key)) for key in keys])
+
+        with patch('modules.core.snapshot_model.REINDEX_THRESHOLD', 5):
+            for key in keys[::3]:
+                self.assertTrue(self.model.remove_snapshot(key))
+                self.model.add_snapshots([(key + 'x', make_snapshot(key + 'x'))])
+
+        remaining = [key for key in keys if key not in keys[::3]] + [key + 'x' for key in keys[::3]]
+        self.assertEqual([self.model.snapshot_id(row) for row in range(self.model.rowCount())], remaining)
+        for key in remaining:
+            self.assertEqual(self.model.get_snapshot(key).vm_name, key)
+        self.assertEqual(sorted(data.vm_name for data in self.model.remove_snapshots(remaining[::2])),
+                         sorted(remaining[::2]))
+        self.assertEqual(self.model.get_snapshot(remaining[-1]).vm_name, remaining[-1])
+
+    def test_same_name_snapshots_do_not_collide(self):
+        """Test snapshots sharing a VM and name stay separate rows under their MoRef keys."""
+        first = make_snapshot('vm1')._replace(snapshot_moref='snapshot-1')
+        second = make_snapshot('vm1')._replace(snapshot_moref='snapshot-2')
+
+        self.model.add_snapshots([(first.key, first), (second.key, second)])
+
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.get_snapshot(('vcenter1.example.com', 'snapshot-2')), second)
+
+    def test_remove_snapshots_in_blocks(self):
+        """Test removing scattered rows at once keeps order, lookups and the checked count."""
+        counts = []
+        self.model.checked_count_changed.connect(counts.append)
+        keys = 'abcdefg'
+        self.model.add_snapshots([(key, make_snapshot(key)) for key in keys])
+        self.model.setData(self.model.index(2, CHECK_COLUMN), Qt.CheckState.Checked.value,
+                           Qt.ItemDataRole.CheckStateRole)
+
+        removed = self.model.remove_snapshots(['b', 'c', 'f', 'missing'])
+
+        self.assertEqual(sorted(data.vm_name for data in removed), ['b', 'c', 'f'])
+        self.assertEqual([self.model.snapshot_id(row) for row in range(self.model.rowCount())],
+                         ['a', 'd', 'e', 'g'])
+        self.assertEqual(self.model.get_snapshot('g').vm_name, 'g')
+        self.assertFalse(self.model.contains('c'))
+        self.assertEqual(counts, [1, 0])
+        self.assertEqual(self.model.remove_snapshots([]), [])
+
+    def test_checked_bookkeeping(self):
+        """Test checking rows updates the checked set and chain rows cannot be checked."""
+        counts = []
+        self.model.checked_count_changed.connect(counts.append)
+        self.model.add_snapshots([('a', make_snapshot('vm1')), ('b', make_snapshot('vm2', has_children=True))])
+
+        checked = Qt.CheckState.Checked.value
+        self.assertTrue(self.model.setData(self.model.index(0, CHECK_COLUMN), checked, Qt.ItemDataRole.CheckStateRole))
+        self.assertFalse(self.model.setData(self.model.index(1, CHECK_COLUMN), checked, Qt.ItemDataRole.CheckStateRole))
+        self.assertIsNone(self.model.index(1, CHECK_COLUMN).data(Qt.ItemDataRole.CheckStateRole))
+
+        self.assertEqual([snapshot_id for snapshot_id, _ in self.model.checked_snapshots()], ['a'])
+        self.assertEqual(counts, [1])
+
+        self.model.remove_snapshot('a')
+        self.assertEqual(self.model.checked_count(), 0)
+        self.assertEqual(counts, [1, 0])
+
+    def test_chain_tooltip(self):
+        """Test chain rows explain why they cannot be checked, even when old."""
+        self.model.add_snapshots([('parent', make_snapshot('vm1', days_old=10, has_children=True)),
+                                  ('child', make_snapshot('vm1', is_child=True))])
+
+        self.assertEqual(self.model.index(0, CHECK_COLUMN).data(Qt.ItemDataRole.ToolTipRole),
+                         chain_tooltip(True, False))
+        self.assertEqual(self.model.index(1, CHECK_COLUMN).data(Qt.ItemDataRole.ToolTipRole),
+                         chain_tooltip(False, True))
+
+    def test_age_highlighting(self):
+        """Test old snapshots get a tooltip and the threshold can be changed."""
+        self.model.add_snapshots([('old', make_snapshot('vm1', days_old=10)), ('new', make_snapshot('vm2'))])
+
+        self.assertIn("10 calendar days old", self.model.index(0, CHECK_COLUMN).data(Qt.ItemDataRole.ToolTipRole))
+        self.assertIsNone(self.model.index(1, CHECK_COLUMN).data(Qt.ItemDataRole.ToolTipRole))
+        self.assertIsNotNone(self.model.index(0, 1).data(Qt.ItemDataRole.BackgroundRole))
+
+        self.model.set_age_policy(30, "calendar days", calendar_age)
+        self.assertIsNone(self.model.index(0, 1).data(Qt.ItemDataRole.BackgroundRole))
+
+
+class TestSnapshotFilterProxyModel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def test_filter_mask(self):
+        """Test the proxy only shows rows accepted by the filter, including rows added later."""
+        model = SnapshotTableModel()
+        model.add_snapshots([(name, make_snapshot(name)) for name in ('web01', 'web02', 'db01')])
+        proxy = SnapshotFilterProxyModel()
+        proxy.setSourceModel(model)
+
+        self.assertEqual(proxy.rowCount(), 3)
+
+        proxy.set_filter(PrefixFilter('web'))
+        self.assertEqual(proxy.rowCount(), 2)
+
+        model.add_snapshots([('web03', make_snapshot('web03')), ('db02', make_snapshot('db02'))])
+        self.assertEqual(proxy.rowCount(), 3)
+
+        model.remove_snapshot('web01')
+        self.assertEqual(proxy.rowCount(), 2)
+        self.assertEqual({model.snapshot_id(row): model.is_visible(row) for row in range(model.rowCount())},
+                         {'web02': True, 'db01': False, 'web03': True, 'db02': False})
+
+        proxy.set_filter(None)
+        self.assertEqual(proxy.rowCount(), 4)
+
+
+class TestChunkedFilterRunner(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QCoreApplication.instance() or QCoreApplication([])
+
+    def setUp(self):
+        self.model = SnapshotTableModel()
+        names = ['web%02d' % i for i in range(5)] + ['db%02d' % i for i in range(5)]
+        self.model.add_snapshots([(name, make_snapshot(name)) for name in names])
+        self.proxy = SnapshotFilterProxyModel()
+        self.proxy.setSourceModel(self.model)
+        self.runner = ChunkedFilterRunner(self.proxy, chunk_size=3)
+        self.finished = []
+        self.runner.finished.connect(lambda: self.finished.append(self.proxy.rowCount()))
+
+    def run_until_idle(self):
+        for _ in range(100):
+            if not self.runner.is_running:
+                break
+            self.app.processEvents()
+
+    def test_chunked_pass_applies_when_complete(self):
+        """Test large models are filtered across event-loop iterations."""
+        self.runner.start(PrefixFilter('web'))
+        self.assertTrue(self.runner.is_running)
+        self.assertEqual(self.proxy.rowCount(), 10)
+
+        self.run_until_idle()
+        self.assertEqual(self.finished, [5])
+
+    def test_newer_pass_supersedes_older(self):
+        """Test starting a new pass abandons the one in progress."""
+        self.runner.start(PrefixFilter('web'))
+        self.runner.start(PrefixFilter('db'))
+        self.run_until_idle()
+
+        self.assertEqual(self.finished, [5])
+        self.assertTrue(all(self.model.snapshot_id(self.proxy.mapToSource(self.proxy.index(row, 0)).row()).startswith('db')
+                            for row in range(self.proxy.rowCount())))
+
+    def test_cancel_keeps_current_filter(self):
+        """Test cancelling leaves the previously applied rows visible."""
+        self.runner.start(PrefixFilter('web'))
+        self.runner.cancel()
+        self.run_until_idle()
+        self.app.processEvents()
+
+        self.assertEqual(self.finished, [])
+        self.assertEqual(self.proxy.rowCount(), 10)
+
+    def test_replacement_during_pass_is_reevaluated(self):
+        """Test rows replaced mid-pass are re-evaluated without restarting the pass."""
+        prefix_filter = PrefixFilter('web')
+        evaluated = []
+        evaluate = prefix_filter.evaluate
+        prefix_filter.evaluate = lambda records: evaluated.append(len(records)) or evaluate(records)
+
+        self.runner.start(prefix_filter)
+        self.app.processEvents()
+        self.model.add_snapshots([('web01', make_snapshot('db-web01'))])
+        self.run_until_idle()
+
+        self.assertEqual(self.finished, [4])
+        self.assertFalse(self.model.is_visible(1))
+        self.assertEqual(sum(evaluated), 11)
+
+    def test_removal_during_pass_restarts(self):
+        """Test rows removed mid-pass don't misalign the results."""
+        self.runner.start(PrefixFilter('web'))
+        self.app.processEvents()
+        self.model.remove_snapshot('web00')
+        self.run_until_idle()
+
+        self.assertEqual(self.finished, [4])
+        self.assertEqual({self.model.snapshot_id(row): self.model.is_visible(row)
+                          for row in range(self.model.rowCount())},
+                         {name: name.startswith('web') for name in
+                          ['web%02d' % i for i in range(1, 5)] + ['db%02d' % i for i in range(5)]})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,153 @@
+import os
+import queue
+import sys
+import unittest
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pyVmomi import vim
+from modules.core.task_monitor import TaskMonitor
+
+
+class FakeFilter:
+    def __init__(self):
+        self.destroyed = False
+
+    def DestroyPropertyFilter(self):
+        self.destroyed = True
+
+
+class FakeCollector:
+    """PropertyCollector whose WaitForUpdatesEx returns scripted update sets."""
+
+    def __init__(self):
+        self.updates = queue.Queue()
+        self.filters = []
+        self.destroyed = False
+        self.cancelled = False
+
+    def CreatePropertyCollector(self):
+        return self
+
+    def CreateFilter(self, spec, partialUpdates):
+        if self.destroyed:
+            raise RuntimeError('The object has already been deleted')
+        self.filters.append(FakeFilter())
+        return self.filters[-1]
+
+    def WaitForUpdatesEx(self, version, options):
+        try:
+            update = self.updates.get(timeout=0.05)
+        except queue.Empty:
+            return None
+        if isinstance(update, Exception):
+            raise update
+        return update
+
+    def CancelWaitForUpdates(self):
+        self.cancelled = True
+
+    def DestroyPropertyCollector(self):
+        self.destroyed = True
+
+    def push(self, task, **changes):
+        names = {'state': 'info.state', 'progress': 'info.progress', 'error': 'info.error', 'result': 'info.result'}
+        change_set = [SimpleNamespace(name=names[key], val=value) for key, value in changes.items()]
+        object_update = SimpleNamespace(obj=task, changeSet=change_set)
+        self.updates.put(SimpleNamespace(version=str(self.updates.qsize() + 1),
+                                         filterSet=[SimpleNamespace(objectSet=[object_update])]))
+
+
+class TestTaskMonitor(unittest.TestCase):
+    def setUp(self):
+        self.collector = FakeCollector()
+        self.si = SimpleNamespace(content=SimpleNamespace(propertyCollector=self.collector))
+        self.monitor = TaskMonitor(wait_seconds=1)
+
+    def tearDown(self):
+        self.monitor.stop()
+
+    def test_events_are_dispatched_in_order(self):
+        """Test progress and completion updates reach the queue with their context."""
+        task = vim.Task('task-1')
+        self.monitor.watch('vc1', self.si, task, 'web01')
+        self.collector.push(task, state='running', progress=40)
+        self.collector.push(task, state='success', result='snapshot-1')
+
+        running = self.monitor.next_event(timeout=2)
+        done = self.monitor.next_event(timeout=2)
+
+        self.assertEqual((running.context, running.state, running.progress, running.is_done),
+                         ('web01', 'running', 40, False))
+        self.assertEqual((done.state, done.progress, done.result, done.is_done),
+                         ('success', 40, 'snapshot-1', True))
+        self.assertTrue(self.collector.filters[0].destroyed)
+
+    def test_error_message_is_reported(self):
+        """Test failed tasks carry the fault message."""
+        task = vim.Task('task-2')
+        self.monitor.watch('vc1', self.si, task)
+        self.collector.push(task, state='error', error=SimpleNamespace(msg='Snapshot locked'))
+
+        event = self.monitor.next_event(timeout=2)
+        self.assertEqual((event.state, event.error), ('error', 'Snapshot locked'))
+
+    def test_one_collector_per_vcenter(self):
+        """Test tasks on the same vCenter share one long-poll thread."""
+        for i in range(5):
+            self.monitor.watch('vc1', self.si, vim.Task(f'task-{i}'))
+        self.assertEqual(len(self.monitor._watchers), 1)
+        self.assertEqual(len(self.collector.filters), 5)
+
+    def test_collector_failure_fails_outstanding_tasks(self):
+        """Test a broken long-poll reports every watched task instead of hanging."""
+        tasks = [vim.Task('task-a'), vim.Task('task-b')]
+        for task in tasks:
+            self.monitor.watch('vc1', self.si, task, task._moId)
+        self.collector.updates.put(RuntimeError('session expired'))
+
+        events = [self.monitor.next_event(timeout=2) for _ in tasks]
+        self.assertEqual(sorted(event.context for event in events), ['task-a', 'task-b'])
+        self.assertTrue(all(event.state == 'error' and 'session expired' in event.error for event in events))
+
+    def test_failed_watcher_is_replaced(self):
+        """Test a task watched after a long-poll failure gets a new collector and is tracked."""
+        self.monitor.watch('vc1', self.si, vim.Task('task-a'))
+        self.collector.updates.put(RuntimeError('session expired'))
+        self.assertEqual(self.monitor.next_event(timeout=2).state, 'error')
+
+        new_collector = FakeCollector()
+        self.si.content.propertyCollector = new_collector
+        task = vim.Task('task-b')
+        self.monitor.watch('vc1', self.si, task, 'web02')
+        new_collector.push(task, state='success')
+
+        event = self.monitor.next_event(timeout=2)
+        self.assertEqual((event.context, event.state), ('web02', 'success'))
+        self.assertEqual(len(new_collector.filters), 1)
+        self.assertTrue(self.collector.destroyed)
+        self.assertEqual(list(self.monitor._watchers), ['vc1'])
+
+    def test_failed_watcher_is_forgotten(self):
+        """Test a watcher removes itself from the monitor once its long-poll fails."""
+        self.monitor.watch('vc1', self.si, vim.Task('task-a'))
+        watcher = self.monitor._watchers['vc1']
+        self.collector.updates.put(RuntimeError('session expired'))
+        self.monitor.next_event(timeout=2)
+        watcher.join(2)
+
+        self.assertEqual(self.monitor._watchers, {})
+
+    def test_stop_destroys_collector(self):
+        """Test stopping cancels the wait and destroys the private collector."""
+        self.monitor.watch('vc1', self.si, vim.Task('task-3'))
+        self.monitor.stop()
+
+        self.assertTrue(self.collector.cancelled)
+        self.assertTrue(self.collector.destroyed)
+        self.assertIsNone(self.monitor.next_event(timeout=0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
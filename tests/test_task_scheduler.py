@@ -0,0 +1,78 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from modules.core.task_scheduler import ConcurrencyScheduler, AdaptiveLimiter
+
+
+class TestConcurrencyScheduler(unittest.TestCase):
+    def test_limits_are_enforced_per_resource(self):
+        """Test each resource key gets its own window of the scope limit."""
+        scheduler = ConcurrencyScheduler({'datastore': 2})
+        for i in range(3):
+            scheduler.add(f'a{i}', [('datastore', 'ds-a')])
+            scheduler.add(f'b{i}', [('datastore', 'ds-b')])
+
+        self.assertEqual(scheduler.take_ready(), ['a0', 'b0', 'a1', 'b1'])
+        self.assertEqual(scheduler.take_ready(), [])
+        self.assertEqual(scheduler.pending_count, 2)
+
+    def test_release_starts_next_item(self):
+        """Test finishing one item immediately frees a slot for the next."""
+        scheduler = ConcurrencyScheduler({'vcenter': 1})
+        scheduler.add('first', [('vcenter', 'vc1')])
+        scheduler.add('second', [('vcenter', 'vc1')])
+
+        self.assertEqual(scheduler.take_ready(), ['first'])
+        self.assertEqual(scheduler.release('first'), (('vcenter', 'vc1'),))
+        self.assertEqual(scheduler.take_ready(), ['second'])
+        scheduler.release('second')
+        self.assertFalse(scheduler.has_work())
+
+    def test_blocked_items_do_not_block_others(self):
+        """Test an item waiting on a busy resource doesn't hold up later items."""
+        scheduler = ConcurrencyScheduler({'cluster': 1, 'datastore': 5})
+        scheduler.add('x', [('cluster', 'c1'), ('datastore', 'ds1')])
+        scheduler.add('y', [('cluster', 'c1'), ('datastore', 'ds1')])
+        scheduler.add('z', [('cluster', 'c2'), ('datastore', 'ds1')])
+
+        self.assertEqual(scheduler.take_ready(), ['x', 'z'])
+
+    def test_resource_limit_override_and_unlimited_scopes(self):
+        """Test per-resource overrides win and scopes without limits are unbounded."""
+        scheduler = ConcurrencyScheduler({'datastore': 4})
+        scheduler.set_resource_limit(('datastore', 'slow'), 1)
+        for i in range(3):
+            scheduler.add(f's{i}', [('datastore', 'slow'), ('host', 'h1')])
+
+        self.assertEqual(scheduler.take_ready(), ['s0'])
+        self.assertEqual(scheduler.limit_for(('host', 'h1')), None)
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = ConcurrencyScheduler({'datastore': 2})
+        self.limiter = AdaptiveLimiter(self.scheduler, initial_limit=2, max_limit=4)
+        self.resource = ('datastore', 'ds1')
+
+    def test_additive_increase_once_per_window(self):
+        """Test steady durations raise the limit by one per window of completions."""
+        limits = [self.limiter.record(self.resource, 10.0) for _ in range(12)]
+        self.assertEqual(limits, [2, 3, 3, 3, 4, 4, 4, 4, 4, 4, 4, 4])
+        self.assertEqual(self.scheduler.limit_for(self.resource), 4)
+
+    def test_multiplicative_decrease_on_slowdown(self):
+        """Test durations well above the baseline halve the limit, down to the minimum."""
+        for _ in range(5):
+            self.limiter.record(self.resource, 10.0)
+        self.assertEqual(self.scheduler.limit_for(self.resource), 4)
+
+        limits = [self.limiter.record(self.resource, 100.0) for _ in range(8)]
+        self.assertEqual(limits[-1], 1)
+        self.assertEqual(self.scheduler.limit_for(('datastore', 'other')), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()